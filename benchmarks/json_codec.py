@@ -0,0 +1,55 @@
+"""JSON codec benchmark.
+
+Compares the encoding and decoding time of the available JSON codecs on typical API payloads.
+Codecs whose library is not installed are skipped.
+
+Usage:
+
+    $ python json_codec.py
+"""
+
+import timeit
+
+from pykour.codec import CODECS
+
+ROUNDS = 5
+
+PAYLOADS = {
+    "small object": {"id": 1, "name": "John Doe", "email": "john@example.com", "active": True},
+    "100 records": [
+        {"id": i, "name": f"user{i}", "email": f"user{i}@example.com", "score": i * 1.5, "tags": ["a", "b"]}
+        for i in range(100)
+    ],
+    "nested document": {
+        "order": {
+            "id": 42,
+            "customer": {"id": 7, "name": "Jane", "address": {"city": "Tokyo", "zip": "100-0001"}},
+            "items": [{"sku": f"SKU-{i}", "quantity": i, "price": 9.99} for i in range(20)],
+        }
+    },
+}
+
+
+def main():
+    codecs = {}
+    for name, codec_class in CODECS.items():
+        try:
+            codecs[name] = codec_class()
+        except ImportError:
+            print(f"{name}: not installed, skipped")
+
+    print(f"best of {ROUNDS} rounds")
+    for payload_name, payload in PAYLOADS.items():
+        data = codecs["json"].dumps(payload)
+        number = max(1, 1_000_000 // len(data))
+        print(f"{payload_name} ({len(data)} bytes, {number} iterations)")
+        for name, codec in codecs.items():
+            dumps_time = min(timeit.repeat(lambda: codec.dumps(payload), number=number, repeat=ROUNDS))
+            loads_time = min(timeit.repeat(lambda: codec.loads(data), number=number, repeat=ROUNDS))
+            print(
+                f"  {name:8} dumps {dumps_time * 1e6 / number:8.2f} us" f"  loads {loads_time * 1e6 / number:8.2f} us"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Incremental JSON encoding benchmark.
+
+Measures the time to the first body byte and the peak memory allocated while the application renders a list
+of rows as one JSON document and as a stream of bounded chunks.
+
+Usage:
+
+    $ python json_stream.py
+"""
+
+import asyncio
+import time
+import tracemalloc
+
+from pykour import Pykour
+
+ROW_COUNTS = (10_000, 100_000)
+
+
+def create_app(rows, stream_threshold):
+    app = Pykour()
+    app.json_stream_threshold = stream_threshold
+
+    @app.get("/rows")
+    async def get_rows():
+        return rows
+
+    return app
+
+
+async def measure(app):
+    scope = {
+        "type": "http",
+        "scheme": "http",
+        "http_version": "1.1",
+        "method": "GET",
+        "path": "/rows",
+        "query_string": b"",
+        "headers": [(b"host", b"localhost"), (b"accept", b"application/json")],
+        "app": app,
+    }
+    state = {"first_byte": None, "size": 0}
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.body" and message["body"]:
+            if state["first_byte"] is None:
+                state["first_byte"] = time.perf_counter()
+            state["size"] += len(message["body"])
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    await app(scope, receive, send)
+    end = time.perf_counter()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return state["first_byte"] - start, end - start, peak, state["size"]
+
+
+def main():
+    for count in ROW_COUNTS:
+        rows = [{"id": i, "name": f"user{i}", "email": f"user{i}@example.com", "score": i * 1.5} for i in range(count)]
+        print(f"{count} rows")
+        for name, threshold in (("document", 0), ("streamed", 1000)):
+            app = create_app(rows, threshold)
+            first_byte, total, peak, size = asyncio.run(measure(app))
+            app.executor.shutdown()
+            print(
+                f"  {name:8} first byte {first_byte * 1e3:8.2f} ms  total {total * 1e3:8.2f} ms"
+                f"  peak {peak / 1024 / 1024:6.2f} MiB  body {size / 1024 / 1024:6.2f} MiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Request latency benchmark.
+
+Measures the mean time the application takes to handle a simple GET request, without a server or a network,
+for an async and a sync handler. Like a real server, the receive channel blocks after the request body until
+the client disconnects, which never happens here.
+
+Usage:
+
+    $ python latency.py
+"""
+
+import asyncio
+import time
+
+from pykour import Pykour
+from pykour.logging import setup_logging
+
+REQUESTS = 20_000
+ROUNDS = 5
+
+
+def create_app() -> Pykour:
+    app = Pykour()
+
+    @app.get("/async")
+    async def async_handler():
+        return {"message": "Hello, World!"}
+
+    @app.get("/sync")
+    def sync_handler():
+        return {"message": "Hello, World!"}
+
+    app.freeze()
+    return app
+
+
+def create_scope(path: str) -> dict:
+    return {
+        "type": "http",
+        "scheme": "http",
+        "http_version": "1.1",
+        "method": "GET",
+        "path": path,
+        "query_string": b"",
+        "headers": [(b"host", b"localhost:8000"), (b"accept", b"application/json")],
+    }
+
+
+def create_receive():
+    messages = [{"type": "http.request", "body": b"", "more_body": False}]
+    disconnected = asyncio.get_running_loop().create_future()
+
+    async def receive():
+        if messages:
+            return messages.pop()
+        return await disconnected
+
+    return receive
+
+
+async def send(message):
+    pass
+
+
+async def measure(app: Pykour, path: str, requests: int) -> float:
+    start = time.perf_counter()
+    for _ in range(requests):
+        await app(create_scope(path), create_receive(), send)
+        # A server returns to the event loop between requests
+        await asyncio.sleep(0)
+    return (time.perf_counter() - start) / requests
+
+
+async def run(app: Pykour) -> None:
+    for path in ("/async", "/sync"):
+        await measure(app, path, 1_000)
+        best = min([await measure(app, path, REQUESTS) for _ in range(ROUNDS)])
+        print(f"GET {path:7} {best * 1e6:8.2f} us per request")
+
+
+def main():
+    app = create_app()
+    # Measure the request handling rather than the console output of the access log
+    setup_logging([])
+    asyncio.run(run(app))
+    app.executor.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Per-request allocation benchmark.
+
+Measures with tracemalloc the memory held by a Request and Response pair, the peak memory allocated
+while a Pykour application handles a request, and the memory held by the routing objects of 10,000 routes.
+
+Usage:
+
+    $ python memory.py
+"""
+
+import asyncio
+import gc
+import tracemalloc
+
+from pykour import Pykour, Router
+
+REQUESTS = 1_000
+ROUTES = 10_000
+
+
+def create_app() -> Pykour:
+    app = Pykour()
+
+    @app.get("/users/{user_id:int}")
+    async def get_user(user_id: int, fields: str):
+        return {"id": user_id, "fields": fields}
+
+    app.freeze()
+    return app
+
+
+def create_scope() -> dict:
+    return {
+        "type": "http",
+        "scheme": "http",
+        "http_version": "1.1",
+        "method": "GET",
+        "path": "/users/42",
+        "query_string": b"fields=name",
+        "headers": [(b"host", b"localhost:8000"), (b"accept", b"application/json"), (b"user-agent", b"bench")],
+    }
+
+
+async def receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def send(message):
+    pass
+
+
+async def send_requests(app: Pykour) -> float:
+    for _ in range(10):
+        await app(create_scope(), receive, send)
+
+    gc.collect()
+    tracemalloc.start()
+    total = 0
+    for _ in range(REQUESTS):
+        scope = create_scope()
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        await app(scope, receive, send)
+        _, peak = tracemalloc.get_traced_memory()
+        total += peak - current
+    tracemalloc.stop()
+    return total / REQUESTS
+
+
+def measure_requests() -> None:
+    peak = asyncio.run(send_requests(create_app()))
+    print(f"{REQUESTS} requests: {peak:8.1f} bytes peak per request")
+
+
+def measure_request_objects() -> None:
+    from pykour.request import Request
+    from pykour.response import Response
+
+    scope = {"type": "http", "headers": [(b"host", b"localhost")], "query_string": b""}
+
+    tracemalloc.start()
+    snapshot = tracemalloc.take_snapshot()
+    objects = [(Request(scope, None), Response(None)) for _ in range(REQUESTS)]
+    stats = tracemalloc.take_snapshot().compare_to(snapshot, "filename")
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in stats)
+    count = sum(stat.count_diff for stat in stats)
+    print(f"Request + Response: {size / len(objects):8.1f} bytes, {count / len(objects):.1f} blocks per pair")
+
+
+def measure_routes() -> None:
+    tracemalloc.start()
+    snapshot = tracemalloc.take_snapshot()
+    router = Router()
+    for i in range(ROUTES):
+        router.add_route(f"/api/r{i}/:id/items", "GET", None)
+    router.freeze()
+    stats = tracemalloc.take_snapshot().compare_to(snapshot, "filename")
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in stats)
+    print(f"{ROUTES} routes: {size / 1024 / 1024:8.2f} MiB")
+
+
+def main():
+    measure_request_objects()
+    measure_requests()
+    measure_routes()
+
+
+if __name__ == "__main__":
+    main()
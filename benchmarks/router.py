@@ -0,0 +1,105 @@
+"""Route lookup benchmark.
+
+Registers 10,000 GET routes and compares the lookup time of the legacy per-method ``Node`` trie
+with the compiled ``RouteTree`` behind ``Router.get_route``, and ``Router.match`` with and without
+the route-match LRU cache on a small set of hot paths.
+
+Usage:
+
+    $ python router.py
+"""
+
+import random
+import timeit
+
+from pykour.router import Node, Route, Router
+
+RESOURCES = 1_000
+ROUNDS = 5
+LOOKUPS = 10_000
+HOT_PATHS = 100
+
+PATTERNS = [
+    "/api/r{i}",
+    "/api/r{i}/count",
+    "/api/r{i}/search",
+    "/api/r{i}/:id",
+    "/api/r{i}/:id/items",
+    "/api/r{i}/:id/items/:item_id",
+    "/api/r{i}/:id/tags",
+    "/api/r{i}/:id/tags/{{tag}}",
+    "/api/r{i}/:id/owner",
+    "/api/r{i}/:id/history/*entry",
+]
+
+
+def build_patterns():
+    return [pattern.format(i=i) for i in range(RESOURCES) for pattern in PATTERNS]
+
+
+def build_paths(patterns):
+    rng = random.Random(0)
+    paths = []
+    for _ in range(LOOKUPS):
+        pattern = rng.choice(patterns)
+        parts = [
+            str(rng.randint(1, 10_000)) if part.startswith((":", "*", "{")) else part for part in pattern.split("/")
+        ]
+        paths.append("/".join(parts))
+    return paths
+
+
+def main():
+    patterns = build_patterns()
+    paths = build_paths(patterns)
+
+    legacy = Node("")
+    for pattern in patterns:
+        legacy.insert(pattern, Route(pattern, "GET", None))
+
+    router = Router()
+    for pattern in patterns:
+        router.add_route(pattern, "GET", None)
+    router.tree.compile()
+
+    cached_router = Router(cache_size=HOT_PATHS)
+    for pattern in patterns:
+        cached_router.add_route(pattern, "GET", None)
+    cached_router.freeze()
+    router.freeze()
+    hot_paths = [paths[i % HOT_PATHS] for i in range(LOOKUPS)]
+    # Both engines must time successful lookups
+    assert all(legacy.search(path)[0] is not None for path in paths)
+    assert all(router.tree.search(path, "GET")[0] is not None for path in paths)
+
+    def legacy_lookup():
+        for path in paths:
+            legacy.search(path)
+
+    def compiled_lookup():
+        for path in paths:
+            router.tree.search(path, "GET")
+
+    def uncached_match():
+        for path in hot_paths:
+            router.match("GET", path)
+
+    def cached_match():
+        for path in hot_paths:
+            cached_router.match("GET", path)
+
+    print(f"{len(patterns)} routes, {len(paths)} lookups per round, best of {ROUNDS} rounds")
+    legacy_time = min(timeit.repeat(legacy_lookup, number=1, repeat=ROUNDS))
+    compiled_time = min(timeit.repeat(compiled_lookup, number=1, repeat=ROUNDS))
+    print(f"Node trie:  {legacy_time * 1e6 / len(paths):8.2f} us/lookup")
+    print(f"RouteTree:  {compiled_time * 1e6 / len(paths):8.2f} us/lookup ({legacy_time / compiled_time:.1f}x)")
+
+    print(f"{HOT_PATHS} hot paths, {len(hot_paths)} matches per round")
+    uncached_time = min(timeit.repeat(uncached_match, number=1, repeat=ROUNDS))
+    cached_time = min(timeit.repeat(cached_match, number=1, repeat=ROUNDS))
+    print(f"match:        {uncached_time * 1e6 / len(hot_paths):8.2f} us/match")
+    print(f"cached match: {cached_time * 1e6 / len(hot_paths):8.2f} us/match ({uncached_time / cached_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
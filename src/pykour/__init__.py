@@ -1,10 +1,23 @@
 __version__ = "0.3.0"
 
 from .pykour import Pykour
+from .background import BackgroundTasks
 from .config import Config
 from .request import Request
-from .response import Response
+from .response import Response, FileResponse
 from .router import Router
+from .staticfiles import StaticFiles
 from .url import URL
 
-__all__ = ["__version__", "Pykour", "Router", "Request", "Response", "URL", "Config"]
+__all__ = [
+    "__version__",
+    "Pykour",
+    "Router",
+    "Request",
+    "Response",
+    "FileResponse",
+    "URL",
+    "Config",
+    "BackgroundTasks",
+    "StaticFiles",
+]
@@ -1,14 +1,117 @@
 import asyncio
+from collections import deque
 from http import HTTPStatus
+from typing import Deque, Union
 
 import pykour.internal.handler.request as request_handler
 import pykour.internal.handler.response as response_handler
 import pykour.exceptions as ex
+from pykour.background import BackgroundTasks
+from pykour.lazy import LazyHandler
 from pykour.logging import write_access_log, write_error_log, write_debug_log
 
 from pykour.request import Request
 from pykour.response import Response
-from pykour.types import Scope, Receive, Send
+from pykour.router import Mount, Route
+from pykour.types import Scope, Receive, Send, Message
+
+
+class DisconnectWatcher:
+    """Watches the ASGI receive channel while an async handler runs and cancels its task if the client goes away.
+
+    At most one receive is pending at a time. The messages it reads are handed over to the request through
+    ``receive()``, so a handler can still read the body. The channel is watched until the request body has been
+    received, then for one more message, which a server only sends when the client disconnects.
+    """
+
+    __slots__ = ("_receive", "_task", "_handle", "_watcher", "_waiter", "_messages", "_error", "disconnected")
+
+    def __init__(self, receive: Receive, task: "asyncio.Task"):
+        """Initialize the watcher.
+
+        Args:
+            receive: The ASGI receive function.
+            task: Task that runs the handler, cancelled on a client disconnect.
+        """
+        self._receive = receive
+        self._task = task
+        self._handle: Union[asyncio.Handle, None] = None
+        self._watcher: Union[asyncio.Task, None] = None
+        self._waiter: Union[asyncio.Future, None] = None
+        self._messages: Deque[Message] = deque()
+        self._error: Union[BaseException, None] = None
+        self.disconnected = False
+
+    def start(self, body_received: bool = False) -> None:
+        """Start watching the receive channel once the handler yields to the event loop.
+
+        A handler that completes without yielding cannot be cancelled, so no watcher task is created for it.
+
+        Args:
+            body_received: Whether the request body has already been received.
+        """
+        self._handle = asyncio.get_running_loop().call_soon(self._spawn, body_received)
+
+    def stop(self) -> None:
+        """Stop watching the receive channel."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        if self._watcher is not None and not self._watcher.done():
+            self._watcher.cancel()
+
+    def _spawn(self, body_received: bool) -> None:
+        self._handle = None
+        self._watcher = asyncio.get_running_loop().create_task(self._watch(body_received))
+
+    async def _watch(self, body_received: bool) -> None:
+        try:
+            while True:
+                message = await self._receive()
+                self._messages.append(message)
+                self._wake()
+                if message.get("type") == "http.disconnect":
+                    self.disconnected = True
+                    self._task.cancel()
+                    return
+                # The handler reads the rest of the body itself
+                if body_received or message.get("more_body", False):
+                    return
+                body_received = True
+        except Exception as e:
+            self._error = e
+            self._wake()
+
+    def _wake(self) -> None:
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    async def receive(self) -> Message:
+        """Receive the next message from the channel.
+
+        Returns:
+            ASGI message.
+        """
+        if not self._messages and self._watcher is not None and not self._watcher.done():
+            self._waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+        if self._messages:
+            return self._messages.popleft()
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+        # Read the message here rather than in a watcher that has not started yet
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        message = await self._receive()
+        if message.get("type") == "http.request" and not message.get("more_body", False):
+            self.start(body_received=True)
+        return message
 
 
 class ASGIApp:
@@ -19,9 +122,11 @@ class ASGIApp:
         ...
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
-        request = Request(scope, receive)
+        app = scope["app"]
+        request = Request(scope, receive, app.max_body_size, app.json_codec)
         response = Response(send)
         start_time = asyncio.get_event_loop().time()
+        background = None
         try:
             # Check if the scheme is supported
             if not request_handler.is_supported_scheme(request):
@@ -34,6 +139,20 @@ class ASGIApp:
                 await response_handler.handle_error(request, response, HTTPStatus.NOT_FOUND)
                 return
 
+            # Resolve the router of the host once, then match against its own compiled routes
+            match = request.app.get_host_router(request.host).match(request.method, request.path)
+            request.route_match = match
+
+            # Dispatch to a mounted application
+            if match.mount is not None:
+                await self.handle_mount(request, response, match.mount)
+                return
+
+            # Answer OPTIONS for a path that has routes but no OPTIONS route
+            if request.method == "OPTIONS" and match.route is None and match.methods:
+                await response_handler.handle_options(request, response)
+                return
+
             # Check if the method is allowed
             if not request_handler.is_method_allowed(request):
                 write_debug_log(f"Method not allowed: {request.method}")
@@ -50,8 +169,8 @@ class ASGIApp:
                 return
 
             if request_handler.is_valid_route(request):
-                self.append_path_params(request)
-                await self.handle_request(request, response)
+                request.path_params = match.path_params
+                background = await self.handle_request(request, response, match.route)
             else:
                 write_debug_log(f"No valid route found: {request.method} {request.path}")
                 await response_handler.handle_error(request, response, HTTPStatus.NOT_FOUND)
@@ -60,33 +179,88 @@ class ASGIApp:
             end_time = asyncio.get_event_loop().time()
             write_access_log(request, response, (end_time - start_time))
 
+        # Run the background tasks once the response has been sent
+        if background:
+            await request_handler.run_background_tasks(request, background, request.app.executor)
+
     @staticmethod
-    def append_path_params(request: Request) -> None:
-        """Append path parameters to the request."""
-        app = request.app
-        path = request.path
-        method = request.method
-        route = app.get_route(path, method)
+    async def handle_mount(request: Request, response: Response, mount: Mount) -> None:
+        """Handle request for a mounted ASGI application."""
 
-        path_params = route.path_params
-        request.path_params = path_params
+        scope = dict(request.scope)
+        scope["root_path"] = scope.get("root_path", "") + mount.prefix
+        scope["path"] = request.path[len(mount.prefix) :] if request.path.startswith(mount.prefix) else request.path
+        if not scope["path"].startswith("/"):
+            scope["path"] = "/" + scope["path"]
+
+        async def send(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response.status = message["status"]
+            await response.send(message)
+
+        await mount.app(scope, request.receive, send)
 
     @staticmethod
-    async def handle_request(request: Request, response: Response):
-        """Handle request for a route."""
+    async def handle_request(request: Request, response: Response, route: Route) -> Union[BackgroundTasks, None]:
+        """Handle request for a route.
+
+        Returns:
+            Background tasks queued by the handler, or None if the handler did not queue any or failed.
+        """
 
-        app = request.app
-        route = app.get_route(request.path, request.method)
         route_fun, status_code = route.handler
         response.status = status_code
 
         # noinspection PyBroadException
         try:
-            response_body = await request_handler.call(route_fun, request, response)
+            if isinstance(route_fun, LazyHandler):
+                if not route_fun.loaded:
+                    await asyncio.get_running_loop().run_in_executor(request.app.executor, route_fun.load)
+                route_fun = route_fun.load()
+
+            # Sync handlers cannot be cancelled, so only async handlers watch for a client disconnect
+            binding = route.binding
+            watcher = None
+            if binding is None or binding.is_async:
+                watcher = DisconnectWatcher(request.receive, asyncio.current_task())  # type: ignore[arg-type]
+                request.receive = watcher.receive
+                watcher.start()
+            try:
+                response_body = await request_handler.call(
+                    route_fun, request, response, binding, route.executor or request.app.executor
+                )
+            except asyncio.CancelledError:
+                if watcher is None or not watcher.disconnected:
+                    raise
+                uncancel(asyncio.current_task())
+                raise ex.ClientDisconnect()
+            finally:
+                if watcher is not None:
+                    watcher.stop()
+
+            # Do not answer if the client has gone away
+            if watcher is not None and watcher.disconnected:
+                raise ex.ClientDisconnect()
 
             await response_handler.handle_response(request, response, response_body)
-        except ex.HTTPException as e:
-            await response_handler.handle_http_exception(request, response, e)
+            return request.background
+        except ex.ClientDisconnect:
+            request.app.aborted_requests += 1
+            write_debug_log(f"Client disconnected: {request.method} {request.path}")
         except Exception as e:
-            write_error_log(f"Internal Server Error: {e}")
-            await response_handler.handle_error(request, response, HTTPStatus.INTERNAL_SERVER_ERROR)
+            # Once the status line has been sent, the response can only be aborted
+            if response.started:
+                write_error_log(f"Response aborted: {request.method} {request.path}: {e}")
+                raise
+            if isinstance(e, ex.HTTPException):
+                await response_handler.handle_http_exception(request, response, e)
+            else:
+                write_error_log(f"Internal Server Error: {e}")
+                await response_handler.handle_error(request, response, HTTPStatus.INTERNAL_SERVER_ERROR)
+        return None
+
+
+def uncancel(task: Union["asyncio.Task", None]) -> None:
+    """Withdraw the cancellation request of a task that has handled its cancellation, on Python 3.11 and later."""
+    if task is not None and hasattr(task, "uncancel"):
+        task.uncancel()
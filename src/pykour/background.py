@@ -0,0 +1,88 @@
+import inspect
+from typing import Any, Callable, Iterator, List, Tuple, Union
+
+from pykour.db.connection import Connection
+
+CONNECTION_NAMES = ("conn", "connection")
+
+
+class BackgroundTask:
+    """Function queued to run after the response has been sent."""
+
+    __slots__ = ("func", "args", "kwargs", "connection_param", "is_async")
+
+    def __init__(self, func: Callable, *args: Any, **kwargs: Any):
+        """Initialize the background task.
+
+        Args:
+            func: Function to call. A parameter named ``conn`` or ``connection``, or annotated with
+                ``Connection``, that is not passed explicitly receives a connection of its own from the pool.
+            args: Positional arguments of the function.
+            kwargs: Keyword arguments of the function.
+        """
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.connection_param = get_connection_param(func, len(args), kwargs)
+        self.is_async = inspect.iscoroutinefunction(func) or inspect.iscoroutinefunction(
+            getattr(func, "__call__", None)
+        )
+
+    def __repr__(self) -> str:
+        return f"BackgroundTask({getattr(self.func, '__name__', self.func)!r})"
+
+
+class BackgroundTasks:
+    """Tasks that a route handler queues to run after its response has been sent.
+
+    Declare a parameter annotated with ``BackgroundTasks`` in a route handler to receive the tasks of the
+    request. The tasks run one after another once the response body has been sent, so they do not add to
+    the response time. A failing task is logged and does not stop the tasks after it.
+    """
+
+    __slots__ = ("tasks",)
+
+    def __init__(self) -> None:
+        """Initialize an empty list of tasks."""
+        self.tasks: List[BackgroundTask] = []
+
+    def add_task(self, func: Callable, *args: Any, **kwargs: Any) -> None:
+        """Queue a function to run after the response has been sent.
+
+        Args:
+            func: Function or coroutine function to call.
+            args: Positional arguments of the function.
+            kwargs: Keyword arguments of the function.
+        """
+        self.tasks.append(BackgroundTask(func, *args, **kwargs))
+
+    def __iter__(self) -> Iterator[BackgroundTask]:
+        return iter(self.tasks)
+
+    def __len__(self) -> int:
+        return len(self.tasks)
+
+    def __repr__(self) -> str:
+        return f"BackgroundTasks({self.tasks!r})"
+
+
+def get_connection_param(func: Callable, num_args: int, kwargs: Any) -> Union[str, None]:
+    """Get the name of the parameter that receives a database connection from the pool.
+
+    Args:
+        func: Function of the task.
+        num_args: Number of positional arguments passed to the function.
+        kwargs: Keyword arguments passed to the function.
+    Returns:
+        Parameter name, or None if the function does not take a connection or it is passed explicitly.
+    """
+    try:
+        params: List[Tuple[str, inspect.Parameter]] = list(inspect.signature(func).parameters.items())
+    except (TypeError, ValueError):
+        return None
+    for index, (name, param) in enumerate(params):
+        if param.annotation is Connection or name in CONNECTION_NAMES:
+            if index < num_args or name in kwargs:
+                return None
+            return name
+    return None
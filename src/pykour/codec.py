@@ -0,0 +1,210 @@
+import importlib
+import json
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, Type, Union
+
+DEFAULT_CHUNK_SIZE = 65536
+
+
+class JSONCodec:
+    """JSON codec backed by the standard library ``json`` module.
+
+    Codecs encode to and decode from bytes, so a backend that works with bytes natively needs no
+    str round-trip. Subclass this class to plug in another JSON library.
+    """
+
+    name = "json"
+    separator = b", "
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object into JSON.
+
+        Args:
+            obj: Object to encode.
+        Returns:
+            UTF-8 encoded JSON.
+        """
+        return json.dumps(obj).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Decode JSON into an object.
+
+        Args:
+            data: JSON as bytes or str.
+        Returns:
+            Decoded object.
+        """
+        return json.loads(data)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+
+class OrjsonCodec(JSONCodec):
+    """JSON codec backed by ``orjson``, which encodes directly into bytes.
+
+    Unlike the standard library, the output has no spaces after separators, and datetimes, UUIDs
+    and dataclasses are encoded natively.
+    """
+
+    name = "orjson"
+    separator = b","
+
+    def __init__(self) -> None:
+        """Initialize the codec.
+
+        Raises:
+            ImportError: If ``orjson`` is not installed.
+        """
+        self.orjson = importlib.import_module("orjson")
+        self.option = self.orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj: Any) -> bytes:
+        return self.orjson.dumps(obj, option=self.option)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self.orjson.loads(data)
+
+
+class JSONStreamEncoder:
+    """Encodes rows one at a time into a JSON array or into NDJSON, in chunks of a bounded size.
+
+    Only the current chunk is held in memory, so the memory used does not grow with the number of rows.
+    A chunk is emitted as soon as it reaches the chunk size. Rows fed one by one make it exceed the chunk size
+    by at most one row. The rows of a list are encoded in batches sized from the rows already encoded, so
+    its chunks are about the chunk size.
+    """
+
+    def __init__(self, codec: JSONCodec, ndjson: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """Initialize the encoder.
+
+        Args:
+            codec: Codec that encodes each row.
+            ndjson: Whether rows are encoded as newline-delimited JSON instead of a JSON array.
+            chunk_size: Size in bytes from which a chunk is emitted.
+        """
+        self.codec = codec
+        self.ndjson = ndjson
+        self.chunk_size = chunk_size
+        self._buffer = bytearray() if ndjson else bytearray(b"[")
+        self._empty = True
+
+    def feed(self, row: Any) -> Union[bytes, None]:
+        """Encode a row.
+
+        Args:
+            row: Row to encode.
+        Returns:
+            Chunk of encoded rows if the buffer has reached the chunk size, otherwise None.
+        """
+        buffer = self._buffer
+        if self.ndjson:
+            buffer += self.codec.dumps(row)
+            buffer += b"\n"
+        else:
+            if not self._empty:
+                buffer += self.codec.separator
+            buffer += self.codec.dumps(row)
+        self._empty = False
+
+        if len(buffer) >= self.chunk_size:
+            chunk = bytes(buffer)
+            buffer.clear()
+            return chunk
+        return None
+
+    def close(self) -> bytes:
+        """Finish the document.
+
+        Returns:
+            Last chunk of encoded rows, which may be empty for NDJSON.
+        """
+        if not self.ndjson:
+            self._buffer += b"]"
+        chunk = bytes(self._buffer)
+        self._buffer.clear()
+        return chunk
+
+    def iterate(self, rows: Iterable[Any]) -> Iterator[bytes]:
+        """Encode rows from an iterable.
+
+        Args:
+            rows: Rows to encode.
+        Returns:
+            Iterator of chunks.
+        """
+        if not self.ndjson and isinstance(rows, (list, tuple)):
+            yield from self._iterate_sequence(rows)
+        else:
+            for row in rows:
+                chunk = self.feed(row)
+                if chunk is not None:
+                    yield chunk
+        chunk = self.close()
+        if chunk:
+            yield chunk
+
+    def _iterate_sequence(self, rows: Union[list, tuple]) -> Iterator[bytes]:
+        # Encoding a slice of rows with one call is much faster than encoding each row, and the array
+        # brackets of the slice are simply dropped
+        buffer = self._buffer
+        start = 0
+        batch_size = 1
+        while start < len(rows):
+            encoded = self.codec.dumps(rows[start : start + batch_size])
+            if not self._empty:
+                buffer += self.codec.separator
+            buffer += memoryview(encoded)[1:-1]
+            self._empty = False
+            start += batch_size
+
+            if len(buffer) >= self.chunk_size:
+                yield bytes(buffer)
+                buffer.clear()
+            row_size = max(1, (len(encoded) - 2) // batch_size)
+            batch_size = max(1, (self.chunk_size - len(buffer)) // row_size)
+
+    async def aiterate(self, rows: AsyncIterable[Any]) -> AsyncIterator[bytes]:
+        """Encode rows from an async iterable.
+
+        Args:
+            rows: Rows to encode.
+        Returns:
+            Async iterator of chunks.
+        """
+        async for row in rows:
+            chunk = self.feed(row)
+            if chunk is not None:
+                yield chunk
+        chunk = self.close()
+        if chunk:
+            yield chunk
+
+
+CODECS: Dict[str, Type[JSONCodec]] = {
+    JSONCodec.name: JSONCodec,
+    OrjsonCodec.name: OrjsonCodec,
+}
+
+DEFAULT_CODEC = JSONCodec()
+
+
+def get_codec(codec: Union[str, JSONCodec, None]) -> JSONCodec:
+    """Get a JSON codec by name.
+
+    Args:
+        codec: Codec name such as ``json`` or ``orjson``, or a codec instance. The standard library codec
+            is used if omitted.
+    Returns:
+        JSONCodec instance.
+    Raises:
+        ValueError: If no codec is registered with the name.
+        ImportError: If the library of the codec is not installed.
+    """
+    if codec is None:
+        return DEFAULT_CODEC
+    if isinstance(codec, JSONCodec):
+        return codec
+    codec_class = CODECS.get(codec)
+    if codec_class is None:
+        raise ValueError(f"Unsupported JSON codec: {codec}")
+    return DEFAULT_CODEC if codec_class is JSONCodec else codec_class()
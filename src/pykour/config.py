@@ -8,6 +8,7 @@ import yaml
 from watchdog.events import FileSystemEventHandler
 from watchdog.observers import Observer
 
+from pykour.codec import DEFAULT_CHUNK_SIZE
 from pykour.logging import ACCESS_LEVEL_NO
 
 
@@ -37,6 +38,13 @@ class Config:
     KEY_PYKOUR_DATASOURCE_USERNAME = "pykour.datasource.username"
     KEY_PYKOUR_DATASOURCE_PASSWORD = "pykour.datasource.password"
     KEY_PYKOUR_DATASOURCE_POOL_MAX_CONNECTIONS = "pykour.datasource.pool.max-connections"
+    KEY_PYKOUR_ROUTER_CACHE_SIZE = "pykour.router.cache-size"
+    KEY_PYKOUR_EXECUTOR_MAX_WORKERS = "pykour.executor.max-workers"
+    KEY_PYKOUR_REQUEST_MAX_BODY_SIZE = "pykour.request.max-body-size"
+    KEY_PYKOUR_JSON_CODEC = "pykour.json.codec"
+    KEY_PYKOUR_JSON_STREAM_THRESHOLD = "pykour.json.stream-threshold"
+    KEY_PYKOUR_JSON_CHUNK_SIZE = "pykour.json.chunk-size"
+    KEY_PYKOUR_DOCS_ASSETS_DIR = "pykour.docs.assets-dir"
 
     def __init__(self, filepath=None):
         self.config = {}
@@ -139,6 +147,27 @@ class Config:
     def get_datasource_pool_max_connections(self) -> int:
         return self.get_int(self.KEY_PYKOUR_DATASOURCE_POOL_MAX_CONNECTIONS, 5)
 
+    def get_router_cache_size(self) -> int:
+        return self.get_int(self.KEY_PYKOUR_ROUTER_CACHE_SIZE, 0)
+
+    def get_executor_max_workers(self) -> Optional[int]:
+        return self.get_int(self.KEY_PYKOUR_EXECUTOR_MAX_WORKERS, None)
+
+    def get_request_max_body_size(self) -> Optional[int]:
+        return self.get_int(self.KEY_PYKOUR_REQUEST_MAX_BODY_SIZE, None)
+
+    def get_json_codec(self) -> Optional[str]:
+        return self.get(self.KEY_PYKOUR_JSON_CODEC, None)
+
+    def get_json_stream_threshold(self) -> int:
+        return self.get_int(self.KEY_PYKOUR_JSON_STREAM_THRESHOLD, 1000)
+
+    def get_json_chunk_size(self) -> int:
+        return self.get_int(self.KEY_PYKOUR_JSON_CHUNK_SIZE, DEFAULT_CHUNK_SIZE)
+
+    def get_docs_assets_dir(self) -> Optional[str]:
+        return self.get(self.KEY_PYKOUR_DOCS_ASSETS_DIR, None)
+
     def __del__(self):
         if hasattr(self, "observer"):
             self.observer.stop()
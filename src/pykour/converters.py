@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import re
+import uuid
+from typing import Any, Dict
+
+
+class Converter:
+    """Base class of path parameter converters.
+
+    A converter validates a path segment with a regular expression and converts it into a typed value.
+    Converters are stateless and shared by every route that uses them.
+    """
+
+    regex = "[^/]+"
+
+    def __init__(self) -> None:
+        self.pattern = re.compile(self.regex)
+
+    def convert(self, value: str) -> Any:
+        """Convert a path segment into a typed value.
+
+        Args:
+            value: Path segment.
+        Returns:
+            Converted value.
+        """
+        return value
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+
+class StringConverter(Converter):
+    """Matches a non-empty path segment."""
+
+    regex = "[^/]+"
+
+
+class IntegerConverter(Converter):
+    """Matches a signed decimal integer and converts it into ``int``."""
+
+    regex = "-?[0-9]+"
+
+    def convert(self, value: str) -> Any:
+        return int(value)
+
+
+class FloatConverter(Converter):
+    """Matches a signed decimal number and converts it into ``float``."""
+
+    regex = r"-?[0-9]+(\.[0-9]+)?"
+
+    def convert(self, value: str) -> Any:
+        return float(value)
+
+
+class UUIDConverter(Converter):
+    """Matches a hyphenated UUID and converts it into ``uuid.UUID``."""
+
+    regex = "[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+
+    def convert(self, value: str) -> Any:
+        return uuid.UUID(value)
+
+
+class PathConverter(Converter):
+    """Matches the rest of the path, including slashes. Only allowed as the last segment of a route."""
+
+    regex = ".*"
+
+
+CONVERTERS: Dict[str, Converter] = {
+    "str": StringConverter(),
+    "int": IntegerConverter(),
+    "float": FloatConverter(),
+    "uuid": UUIDConverter(),
+    "path": PathConverter(),
+}
+
+
+def get_converter(name: str) -> Converter:
+    """Get a registered converter by name.
+
+    Args:
+        name: Converter name, such as ``int`` in ``{id:int}``.
+    Returns:
+        Converter instance.
+    Raises:
+        ValueError: If no converter is registered with the name.
+    """
+    converter = CONVERTERS.get(name)
+    if converter is None:
+        raise ValueError(f"Unsupported path converter: {name}")
+    return converter
@@ -0,0 +1,82 @@
+from typing import Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+RawHeaders = Sequence[Tuple[bytes, bytes]]
+
+
+class Headers(Mapping[str, List[str]]):
+    """Case-insensitive multi-dict of HTTP headers over the raw byte pairs of an ASGI scope.
+
+    Nothing is decoded until a header is read. Looking up a single header with ``get_first()`` scans the
+    raw pairs, and any other access decodes all headers once into an index that is kept for later reads.
+    """
+
+    __slots__ = ("raw", "_index")
+
+    def __init__(self, raw: Optional[RawHeaders] = None):
+        """Initialize the headers.
+
+        Args:
+            raw: Header name and value pairs as bytes, such as ``scope["headers"]``.
+        """
+        self.raw: RawHeaders = raw if raw is not None else []
+        self._index: Optional[Dict[str, List[str]]] = None
+
+    def _get_index(self) -> Dict[str, List[str]]:
+        index = self._index
+        if index is None:
+            index = {}
+            for key, value in self.raw:
+                name = key.decode("latin-1").lower()
+                if name in index:
+                    index[name].append(value.decode("latin-1"))
+                else:
+                    index[name] = [value.decode("latin-1")]
+            self._index = index
+        return index
+
+    def get_first(self, name: str) -> Optional[str]:
+        """Get the first value of a header.
+
+        Args:
+            name: Header name, in any case.
+        Returns:
+            Header value, or None if the header is not present.
+        """
+        if self._index is not None:
+            values = self._index.get(name.lower())
+            return values[0] if values else None
+
+        raw_name = name.lower().encode("latin-1")
+        for key, value in self.raw:
+            if key == raw_name or key.lower() == raw_name:
+                return value.decode("latin-1")
+        return None
+
+    def get_raw(self, name: Union[str, bytes]) -> Optional[bytes]:
+        """Get the first value of a header without decoding it.
+
+        Args:
+            name: Header name, in any case.
+        Returns:
+            Raw header value, or None if the header is not present.
+        """
+        raw_name = (name if isinstance(name, bytes) else name.encode("latin-1")).lower()
+        for key, value in self.raw:
+            if key == raw_name or key.lower() == raw_name:
+                return value
+        return None
+
+    def __getitem__(self, name: str) -> List[str]:
+        return self._get_index()[name.lower()]
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and name.lower() in self._get_index()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._get_index())
+
+    def __len__(self) -> int:
+        return len(self._get_index())
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.raw!r})"
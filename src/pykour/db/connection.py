@@ -154,7 +154,8 @@ class Connection(abc.ABC):
 class SQLiteConnection(Connection):
     def connect(self, host=None, db=None, username=None, password=None) -> Connection:
         sqlite3 = importlib.import_module("sqlite3")
-        self.conn = sqlite3.connect(db)
+        # Pooled connections are used by one thread at a time, but not by the thread that opened them
+        self.conn = sqlite3.connect(db, check_same_thread=False)
         self.cursor = self.conn.cursor()
 
         return self
@@ -28,6 +28,17 @@ class ResourceNotFoundException(HTTPException):
         super().__init__(status_code=HTTPStatus.NOT_FOUND, message=message)
 
 
+class PayloadTooLargeException(HTTPException):
+    """PayloadTooLargeException is raised when a request body exceeds the maximum body size."""
+
+    def __init__(self, message: Union[str, None] = None) -> None:
+        super().__init__(status_code=HTTPStatus.REQUEST_ENTITY_TOO_LARGE, message=message)
+
+
+class ClientDisconnect(Exception):
+    """ClientDisconnect is raised when the client disconnects before the request body is received."""
+
+
 class ValidationError(ValueError):
     """ValidationError is raised when a value is not valid."""
 
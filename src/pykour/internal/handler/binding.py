@@ -0,0 +1,219 @@
+import inspect
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable, Collection, Dict, List, Tuple, Type, Union, get_origin
+
+from pykour.background import BackgroundTasks
+from pykour.config import Config
+from pykour.db.connection import Connection
+from pykour.request import Request, Stream
+from pykour.response import Response
+from pykour.schema import BaseSchema
+from pykour.util import cast
+
+REQUEST_NAMES = ("request", "req")
+RESPONSE_NAMES = ("response", "res", "resp")
+CONFIG_NAMES = ("config",)
+CONNECTION_NAMES = ("conn", "connection")
+CAST_TYPES = (int, float, bool, datetime)
+
+Extractor = Callable[[Request, Response, "BindingContext"], Any]
+
+
+class BindingContext:
+    """Values shared by the extractors of one request, read at most once per request."""
+
+    __slots__ = ("body", "query", "conn")
+
+    def __init__(self, body: Any, query: Union[Dict[str, Any], None], conn: Union[Connection, None]):
+        self.body = body
+        self.query = query
+        self.conn = conn
+
+
+class BindingPlan:
+    """Precompiled plan that binds the arguments of a route handler.
+
+    The signature of the handler is analysed once, when the route is registered, into an ordered list of
+    extractors, one per parameter. Binding a request only calls the extractors, without any reflection.
+    """
+
+    __slots__ = ("extractors", "needs_body", "needs_query", "needs_connection", "is_async")
+
+    def __init__(
+        self,
+        extractors: List[Tuple[str, Extractor]],
+        needs_body: bool = False,
+        needs_query: bool = False,
+        needs_connection: bool = False,
+        is_async: bool = True,
+    ):
+        """Initialize the binding plan.
+
+        Args:
+            extractors: Parameter names and the extractors of their values.
+            needs_body: Whether the request body is parsed as JSON.
+            needs_query: Whether the query parameters are parsed.
+            needs_connection: Whether a database connection is taken from the pool.
+            is_async: Whether the handler is a coroutine function run on the event loop.
+        """
+        self.extractors = extractors
+        self.needs_body = needs_body
+        self.needs_query = needs_query
+        self.needs_connection = needs_connection
+        self.is_async = is_async
+
+    async def bind(self, request: Request, response: Response) -> Tuple[Dict[str, Any], Union[Connection, None]]:
+        """Bind the arguments of the handler for a request.
+
+        Args:
+            request: Request instance.
+            response: Response instance.
+        Returns:
+            Bound arguments and the database connection taken from the pool, if any.
+        """
+        body = await request.json() if self.needs_body else None
+        query = request.query_params if self.needs_query else None
+        conn = None
+        if self.needs_connection:
+            pool = request.app.pool
+            if pool:
+                conn = pool.get_connection()
+
+        context = BindingContext(body, query, conn)
+        return {name: extract(request, response, context) for name, extract in self.extractors}, conn
+
+    def __repr__(self) -> str:
+        return f"BindingPlan({[name for name, _ in self.extractors]})"
+
+
+def extract_request(request: Request, response: Response, context: BindingContext) -> Any:
+    return request
+
+
+def extract_response(request: Request, response: Response, context: BindingContext) -> Any:
+    return response
+
+
+def extract_stream(request: Request, response: Response, context: BindingContext) -> Any:
+    return Stream(request)
+
+
+def extract_background_tasks(request: Request, response: Response, context: BindingContext) -> Any:
+    if request.background is None:
+        request.background = BackgroundTasks()
+    return request.background
+
+
+def extract_body(request: Request, response: Response, context: BindingContext) -> Any:
+    return context.body
+
+
+def extract_config(request: Request, response: Response, context: BindingContext) -> Any:
+    return request.app.config
+
+
+def extract_connection(request: Request, response: Response, context: BindingContext) -> Any:
+    return context.conn
+
+
+def extract_none(request: Request, response: Response, context: BindingContext) -> Any:
+    return None
+
+
+def get_caster(annotation: Any) -> Union[Callable[[Any], Any], None]:
+    """Get the function that casts a string parameter into the annotated type.
+
+    Args:
+        annotation: Parameter annotation.
+    Returns:
+        Cast function, or None if the string is passed as is.
+    """
+    if annotation in CAST_TYPES or (isinstance(annotation, type) and issubclass(annotation, Enum)):
+        return lambda value: cast(value, annotation)
+    return None
+
+
+def make_schema_extractor(schema: Type[BaseSchema]) -> Extractor:
+    def extract_schema(request: Request, response: Response, context: BindingContext) -> Any:
+        return schema.from_dict(context.body)
+
+    return extract_schema
+
+
+def make_path_extractor(name: str, caster: Union[Callable[[Any], Any], None]) -> Extractor:
+    if caster is None:
+
+        def extract_path(request: Request, response: Response, context: BindingContext) -> Any:
+            return request.path_params[name]
+
+    else:
+
+        def extract_path(request: Request, response: Response, context: BindingContext) -> Any:
+            return caster(request.path_params[name])
+
+    return extract_path
+
+
+def make_query_extractor(name: str, caster: Union[Callable[[Any], Any], None], fallback: Extractor) -> Extractor:
+    def extract_query(request: Request, response: Response, context: BindingContext) -> Any:
+        query = context.query
+        if name in query:
+            return caster(query[name]) if caster is not None else query[name]
+        return fallback(request, response, context)
+
+    return extract_query
+
+
+def compile_binding(
+    func: Callable, path_param_names: Collection[str] = (), typed_param_names: Collection[str] = ()
+) -> BindingPlan:
+    """Analyse the signature of a route handler into a binding plan.
+
+    Parameters are bound in the same order of precedence as before: schema and dictionary bodies,
+    the body stream, the background tasks, the request, the response, path parameters, query parameters,
+    the config and the connection.
+
+    Args:
+        func: Route handler.
+        path_param_names: Names of the path parameters of the route.
+        typed_param_names: Names of the path parameters already converted by a typed segment.
+    Returns:
+        BindingPlan instance.
+    """
+    extractors: List[Tuple[str, Extractor]] = []
+    needs_body = needs_query = needs_connection = False
+
+    for name, param in inspect.signature(func).parameters.items():
+        annotation = param.annotation
+        extractor: Extractor
+        if isinstance(annotation, type) and issubclass(annotation, BaseSchema):
+            extractor = make_schema_extractor(annotation)
+            needs_body = True
+        elif annotation is dict or get_origin(annotation) is dict:
+            extractor = extract_body
+            needs_body = True
+        elif annotation is Stream:
+            extractor = extract_stream
+        elif annotation is BackgroundTasks:
+            extractor = extract_background_tasks
+        elif annotation is Request or name in REQUEST_NAMES:
+            extractor = extract_request
+        elif annotation is Response or name in RESPONSE_NAMES:
+            extractor = extract_response
+        elif name in path_param_names:
+            extractor = make_path_extractor(name, None if name in typed_param_names else get_caster(annotation))
+        else:
+            if annotation is Config or name in CONFIG_NAMES:
+                fallback = extract_config
+            elif annotation is Connection or name in CONNECTION_NAMES:
+                fallback = extract_connection
+                needs_connection = True
+            else:
+                fallback = extract_none
+            extractor = make_query_extractor(name, get_caster(annotation), fallback)
+            needs_query = True
+        extractors.append((name, extractor))
+
+    is_async = inspect.iscoroutinefunction(func) or inspect.iscoroutinefunction(getattr(func, "__call__", None))
+    return BindingPlan(extractors, needs_body, needs_query, needs_connection, is_async)
@@ -1,13 +1,17 @@
+import asyncio
+import functools
 import inspect
-from typing import Any, Dict, get_origin, Tuple, ItemsView, Callable
+import threading
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, Union
 
-from pykour.config import Config
+from pykour.background import BackgroundTasks
 from pykour.db.connection import Connection
-from pykour.logging import write_error_log
+from pykour.globals import thread_local
+from pykour.internal.handler.binding import BindingPlan, compile_binding
+from pykour.logging import write_debug_log, write_error_log
 from pykour.request import Request
 from pykour.response import Response
-from pykour.schema import BaseSchema
-from pykour.util import cast
 
 SUPPORTED_METHODS = ["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS", "HEAD"]
 
@@ -23,83 +27,114 @@ def is_supported_method(request: Request) -> bool:
 
 
 def is_method_allowed(request: Request) -> bool:
-    """Check if the method is allowed for the given path."""
-    app = request.app
-    path = request.path
-    method = request.method
-    allowed_methods = app.get_allowed_methods(path)
-    return allowed_methods == [] or method in allowed_methods
+    """Check if the method is allowed for the matched path."""
+    return request.route_match.is_allowed(request.method)
 
 
 def is_valid_route(request: Request) -> bool:
-    """Check if the route exists."""
-    app = request.app
-    path = request.path
-    method = request.method
-    return app.exists(path, method)
-
-
-async def bind_args(
-    request: Request, response: Response, items: ItemsView[str, inspect.Parameter]
-) -> Tuple[Dict[str, Any], Connection]:
-    bound_args: Dict[str, Any] = {}
-    app = request.app
-    pool = app.pool
-    conn = None
-    for param_name, param in items:
-        if isinstance(param.annotation, type) and issubclass(param.annotation, BaseSchema):
-            # Bind schema
-            bound_args[param_name] = param.annotation.from_dict(await request.json())
-        elif param.annotation is dict or get_origin(param.annotation) is dict:
-            # Bind dictionary
-            bound_args[param_name] = await request.json()
-        elif param.annotation is Request or param_name == "request" or param_name == "req":
-            # Bind request
-            bound_args[param_name] = request
-        elif param.annotation is Response or param_name == "response" or param_name == "res" or param_name == "resp":
-            # Bind response
-            bound_args[param_name] = response
-        elif param_name in request.path_params:
-            # Bind path parameters
-            bound_args[param_name] = cast(request.path_params[param_name], param.annotation)
-        elif param_name in request.query_params:
-            # Bind query parameters
-            bound_args[param_name] = cast(request.query_params[param_name], param.annotation)
-        elif app.config and (param.annotation is Config or param_name == "config"):
-            # Bind config
-            bound_args[param_name] = app.config
-        elif param.annotation is Connection or param_name == "conn" or param_name == "connection":
-            if pool:
-                if conn:
-                    bound_args[param_name] = conn
-                else:
-                    conn = pool.get_connection()
-                    bound_args[param_name] = conn
+    """Check if a route matched the request."""
+    return request.route_match.route is not None
+
+
+def call_sync(
+    func: Callable,
+    bound_args: Dict[str, Any],
+    conn: Union[Connection, None],
+    pool: Any,
+    request_id: Any,
+    aborted: threading.Event,
+) -> Any:
+    """Call a synchronous route handler in a worker thread and finish its connection in the same thread.
+
+    A thread cannot be cancelled, so the handler runs to the end even if the request is aborted, but its
+    connection is then rolled back instead of committed.
+
+    Args:
+        func: Route handler.
+        bound_args: Bound arguments.
+        conn: Database connection bound to the handler, if any.
+        pool: Connection pool the connection is released to.
+        request_id: Request ID of the calling thread, used by the log records written in the worker thread.
+        aborted: Event set when the request is aborted.
+    Returns:
+        Return value of the handler.
+    """
+    thread_local.request_id = request_id
+    try:
+        ret = func(**bound_args)
+        if conn:
+            if aborted.is_set():
+                conn.rollback()
             else:
-                bound_args[param_name] = None
-        else:
-            bound_args[param_name] = None
-
-    return bound_args, conn
-
+                conn.commit()
+        return ret
+    except Exception:
+        if conn:
+            conn.rollback()
+        raise
+    finally:
+        if conn:
+            pool.release_connection(conn)
 
-async def call(func: Callable, request: Request, response: Response) -> Any:
-    sig = inspect.signature(func)
-    app = request.app
-    pool = app.pool
 
-    bound_args, conn = await bind_args(request, response, sig.parameters.items())
+async def call(
+    func: Callable,
+    request: Request,
+    response: Response,
+    binding: Union[BindingPlan, None] = None,
+    executor: Union[Executor, None] = None,
+) -> Any:
+    """Call a route handler with its arguments bound from the request.
+
+    Coroutine functions run on the event loop. If they are cancelled, their connection is rolled back.
+    Other handlers run in the executor together with the commit or rollback and the release of their
+    connection, so blocking database calls do not stall the event loop.
+
+    Args:
+        func: Route handler.
+        request: Request instance.
+        response: Response instance.
+        binding: Binding plan compiled when the route was registered. It is compiled here if omitted.
+        executor: Executor of synchronous handlers. The default executor of the event loop is used if omitted.
+    Returns:
+        Return value of the handler.
+    """
+    if binding is None:
+        typed_param_names = [name for name, value in request.path_params.items() if not isinstance(value, str)]
+        binding = compile_binding(func, request.path_params, typed_param_names)
+    pool = request.app.pool
+
+    bound_args, conn = await binding.bind(request, response)
+
+    if not binding.is_async:
+        request_id = getattr(thread_local, "request_id", None)
+        aborted = threading.Event()
+        future = asyncio.get_running_loop().run_in_executor(
+            executor, call_sync, func, bound_args, conn, pool, request_id, aborted
+        )
+        try:
+            # The future is shielded so that the worker always releases the connection
+            ret = await asyncio.shield(future)
+        except asyncio.CancelledError:
+            aborted.set()
+            raise
+        except Exception as e:
+            write_error_log(f"Error occurred while calling {func.__name__}: {e}")
+            raise e
+        if inspect.iscoroutine(ret):
+            ret = await ret
+        return ret
 
     try:
-        result = func(**bound_args)
-        if inspect.iscoroutine(result):
-            ret = await result
-        else:
-            ret = result
-
+        ret = await func(**bound_args)
         if conn:
             conn.commit()
         return ret
+    except asyncio.CancelledError:
+        write_debug_log(f"Cancelled {func.__name__}")
+        if conn:
+            conn.rollback()
+        raise
     except Exception as e:
         write_error_log(f"Error occurred while calling {func.__name__}: {e}")
         if conn:
@@ -108,3 +143,48 @@ async def call(func: Callable, request: Request, response: Response) -> Any:
     finally:
         if conn:
             pool.release_connection(conn)
+
+
+async def run_background_tasks(
+    request: Request, tasks: BackgroundTasks, executor: Union[Executor, None] = None
+) -> None:
+    """Run the background tasks of a request after its response has been sent.
+
+    Each task that takes a connection gets its own connection from the pool, which is committed if the task
+    succeeds and rolled back otherwise. Failures are logged and do not stop the remaining tasks.
+
+    Args:
+        request: Request instance.
+        tasks: Background tasks queued by the route handler.
+        executor: Executor of synchronous tasks. The default executor of the event loop is used if omitted.
+    """
+    pool = request.app.pool
+    request_id = getattr(thread_local, "request_id", None)
+    loop = asyncio.get_running_loop()
+
+    for task in tasks:
+        kwargs = task.kwargs
+        conn = None
+        if task.connection_param is not None:
+            conn = pool.get_connection() if pool else None
+            kwargs = {**kwargs, task.connection_param: conn}
+
+        # noinspection PyBroadException
+        try:
+            if task.is_async:
+                try:
+                    await task.func(*task.args, **kwargs)
+                    if conn:
+                        conn.commit()
+                except Exception:
+                    if conn:
+                        conn.rollback()
+                    raise
+                finally:
+                    if conn:
+                        pool.release_connection(conn)
+            else:
+                func = functools.partial(task.func, *task.args)
+                await loop.run_in_executor(executor, call_sync, func, kwargs, conn, pool, request_id, threading.Event())
+        except Exception as e:
+            write_error_log(f"Error occurred while running background task {task!r}: {e}")
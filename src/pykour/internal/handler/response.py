@@ -1,80 +1,196 @@
-import json
 from http import HTTPStatus
-from typing import Any
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Iterator, Union
 
+from pykour.codec import DEFAULT_CODEC, JSONCodec, JSONStreamEncoder
+
+from pykour.negotiation import APPLICATION_JSON, APPLICATION_NDJSON
 from pykour.openapi.endpoint import generate_openapi
 from pykour.request import Request
-from pykour.response import Response
+from pykour.response import FileResponse, Response, StreamingResponse
 import pykour.exceptions as ex
 
+SWAGGER_UI_CDN_URL = "https://cdn.jsdelivr.net/npm/swagger-ui-dist"
+
 
 def determine_content_type_for_response_body(request: Request, response_body: Any) -> str:
-    for accept in request.accept:
-        if accept == "text/plain":
-            return accept
-        if accept == "application/json":
-            return accept
-        if accept == "*/*":
-            if isinstance(response_body, dict):
-                return "application/json"
-            return "text/plain"
-    return "text/plain"
+    response_type = request.negotiation.response_type
+    if response_type is None:
+        return "application/json" if isinstance(response_body, dict) else "text/plain"
+    return response_type
 
 
 def determine_content_type_for_error_response(request: Request) -> str:
-    for accept in request.accept:
-        if accept == "application/json":
-            return accept
-    return "text/plain"
+    return request.negotiation.error_type
 
 
-def detect_error_phrase(response: Response, phrase: str) -> str:
+def detect_error_phrase(response: Response, phrase: str, json_codec: JSONCodec = DEFAULT_CODEC) -> Union[str, bytes]:
     if response.content_type == "application/json":
-        return json.dumps({"error": phrase})
+        return json_codec.dumps({"error": phrase})
     return phrase
 
 
-def detect_response_body(request: Request, response: Response, response_body: Any) -> None:
-    app = request.app
+def encode_ndjson(json_codec: JSONCodec, response_body: Any) -> bytes:
+    rows = response_body if isinstance(response_body, (list, tuple)) else (response_body,)
+    return b"".join(JSONStreamEncoder(json_codec, ndjson=True).iterate(rows))
+
+
+def serialize_response_body(request: Request, response: Response, response_body: Any) -> bytes:
+    if response.content_type == APPLICATION_JSON:
+        return request.app.json_codec.dumps(response_body)
+    if response.content_type == APPLICATION_NDJSON:
+        return encode_ndjson(request.app.json_codec, response_body)
+    if isinstance(response_body, bytes):
+        return response_body
+    if isinstance(response_body, memoryview):
+        return response_body.tobytes()
+    return str(response_body).encode(response.charset)
+
 
+def detect_response_body(request: Request, response: Response, response_body: Any) -> None:
     if response.status == HTTPStatus.NO_CONTENT:
         response.content = ""
     elif request.method == "OPTIONS":
-        response.add_header("Allow", ", ".join(app.get_allowed_methods(request.path)))
+        response.add_header("Allow", request.route_match.allow_header)
         response.content = ""
     elif request.method == "HEAD":
-        response.add_header("Content-Length", str(len(str(response_body))))
+        # Announce the length of the body a GET request would receive
+        response.add_header("Content-Length", str(len(serialize_response_body(request, response, response_body))))
         response.content = ""
-    elif response.content_type == "application/json":
-        response.content = json.dumps(response_body)
+    elif response.content_type == APPLICATION_JSON:
+        response.content = request.app.json_codec.dumps(response_body)
+    elif response.content_type == APPLICATION_NDJSON:
+        response.content = encode_ndjson(request.app.json_codec, response_body)
     elif response.content_type == "text/plain":
-        response.content = str(response_body)
+        response.content = response_body if isinstance(response_body, (bytes, memoryview)) else str(response_body)
+
+
+def is_streaming_body(request: Request, response: Response, response_body: Any) -> bool:
+    if isinstance(response_body, (AsyncIterable, Iterator)):
+        return True
+    # Long lists are encoded element by element rather than into one document
+    threshold = request.app.json_stream_threshold
+    return (
+        isinstance(response_body, list)
+        and bool(threshold)
+        and len(response_body) >= threshold
+        and response.content_type in (APPLICATION_JSON, APPLICATION_NDJSON)
+    )
+
+
+def to_chunk(element: Any) -> Any:
+    return element if isinstance(element, (str, bytes, memoryview)) else str(element)
+
+
+async def stringify_async_stream(stream: AsyncIterable[Any]) -> AsyncIterator[Any]:
+    async for element in stream:
+        yield to_chunk(element)
+
+
+def stringify_stream(stream: Any) -> Union[AsyncIterable[Any], Iterable[Any]]:
+    if isinstance(stream, AsyncIterable):
+        return stringify_async_stream(stream)
+    if isinstance(stream, (list, tuple)):
+        return [to_chunk(element) for element in stream]
+    return (to_chunk(element) for element in stream)
+
+
+async def close_stream(stream: Any) -> None:
+    aclose = getattr(stream, "aclose", None)
+    if aclose is not None:
+        await aclose()
+        return
+    close = getattr(stream, "close", None)
+    if close is not None:
+        close()
+
+
+async def handle_streaming_response(request: Request, response: Response, response_body: Any) -> None:
+    """Send the chunks produced by an async or sync iterator returned by a handler as they are produced.
+
+    If JSON or NDJSON has been negotiated, each element is encoded as a row of a JSON array or as a line of NDJSON,
+    and the rows are sent in chunks of bounded size. Otherwise, elements other than str, bytes or memoryview are
+    sent as their string representation.
+    """
+    content = response_body
+    if response.status == HTTPStatus.NO_CONTENT or request.method in ("HEAD", "OPTIONS"):
+        if request.method == "OPTIONS":
+            response.add_header("Allow", request.route_match.allow_header)
+        await close_stream(response_body)
+        content = ()
+    elif response.content_type in (APPLICATION_JSON, APPLICATION_NDJSON):
+        app = request.app
+        encoder = JSONStreamEncoder(app.json_codec, response.content_type == APPLICATION_NDJSON, app.json_chunk_size)
+        if isinstance(response_body, AsyncIterable):
+            content = encoder.aiterate(response_body)
+        else:
+            content = encoder.iterate(response_body)
+    else:
+        content = stringify_stream(response_body)
+
+    streaming = StreamingResponse.from_response(response, content, request.app.executor)
+    try:
+        await streaming.render()
+    finally:
+        response.started = streaming.started
+        if content is not response_body:
+            await close_stream(response_body)
+
+
+async def handle_file_response(request: Request, response: Response, file_response: FileResponse) -> None:
+    """Send a file returned by a handler, with the headers the handler added to its response."""
+    if file_response.send is None:
+        file_response.send = response.send
+    if file_response.executor is None:
+        file_response.executor = request.app.executor
+    for key, value in response.headers[1:]:
+        file_response.add_header(key, value)
+    try:
+        await file_response.render(request)
+    finally:
+        response.status = file_response.status
+        response.started = file_response.started
 
 
 async def handle_response(request: Request, response: Response, response_body: Any) -> None:
+    if isinstance(response_body, FileResponse):
+        await handle_file_response(request, response, response_body)
+        return
     response.content_type = determine_content_type_for_response_body(request, response_body)
+    if is_streaming_body(request, response, response_body):
+        await handle_streaming_response(request, response, response_body)
+        return
     detect_response_body(request, response, response_body)
     await response.render()
 
 
+async def handle_options(request: Request, response: Response) -> None:
+    """Reply to an OPTIONS request for a path without an OPTIONS route, without calling any handler."""
+    response.status = HTTPStatus.OK
+    response.add_header("Allow", request.route_match.options_allow_header)
+    response.content = ""
+    await response.render()
+
+
 async def handle_error(request: Request, response: Response, status: HTTPStatus) -> None:
     response.content_type = determine_content_type_for_error_response(request)
     response.status = status
-    response.content = detect_error_phrase(response, status.phrase)
+    if status == HTTPStatus.METHOD_NOT_ALLOWED:
+        response.add_header("Allow", request.route_match.allow_header)
+    response.content = detect_error_phrase(response, status.phrase, request.app.json_codec)
     await response.render()
 
 
 async def handle_http_exception(request: Request, response: Response, e: ex.HTTPException) -> None:
     response.content_type = determine_content_type_for_error_response(request)
     response.status = e.status_code
-    response.content = detect_error_phrase(response, e.message)
+    response.content = detect_error_phrase(response, e.message, request.app.json_codec)
     await response.render()
 
 
 async def handle_openapi(request: Request, response: Response) -> None:
     response.content_type = "application/json"
     try:
-        response.content = json.dumps(
+        response.content = request.app.json_codec.dumps(
             generate_openapi(request.app, request.url.scheme, request.url.hostname, request.url.port)
         )
     except Exception as e:
@@ -84,14 +200,17 @@ async def handle_openapi(request: Request, response: Response) -> None:
 
 async def handle_docs(request: Request, response: Response) -> None:
     app = request.app
+    assets_url = SWAGGER_UI_CDN_URL
+    if app.docs_assets_url is not None:
+        assets_url = request.scope.get("root_path", "") + app.docs_assets_url
     response.content_type = "text/html"
     response.content = f"""
 <!DOCTYPE html>
 <html>
 <head>
   <title>{app.title} API Documentation</title>
-  <link rel="stylesheet" type="text/css" href="https://cdn.jsdelivr.net/npm/swagger-ui-dist/swagger-ui.css">
-  <script src="https://cdn.jsdelivr.net/npm/swagger-ui-dist/swagger-ui-bundle.js"></script>
+  <link rel="stylesheet" type="text/css" href="{assets_url}/swagger-ui.css">
+  <script src="{assets_url}/swagger-ui-bundle.js"></script>
   <script>
     window.onload = function() {{
       SwaggerUIBundle({{
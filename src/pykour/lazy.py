@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import ast
+import importlib
+import importlib.util
+from threading import Lock
+from typing import Any, Callable, Union
+
+
+class LazyHandler:
+    """Route handler declared as a ``"package.module:function"`` string.
+
+    The module is imported on the first call of ``load()``, so registering the route does not import the
+    handler module. The docstring can be read from the module source without importing it.
+    """
+
+    def __init__(self, import_path: str):
+        """Initialize the lazy handler.
+
+        Args:
+            import_path: Import path of the handler, such as ``"package.module:function"``.
+        Raises:
+            ValueError: If the import path is not in the ``"package.module:function"`` format.
+        """
+        module_name, _, attr_name = import_path.partition(":")
+        if not module_name or not attr_name:
+            raise ValueError(f"Handler must be specified as 'package.module:function': {import_path}")
+
+        self.import_path = import_path
+        self.module_name = module_name
+        self.attr_name = attr_name
+        self.__name__ = attr_name.rsplit(".", 1)[-1]
+        self._func: Union[Callable, None] = None
+        self._lock = Lock()
+
+    @property
+    def loaded(self) -> bool:
+        """Returns True if the handler module has been imported."""
+        return self._func is not None
+
+    def load(self) -> Callable:
+        """Import the handler module once and return the handler function.
+
+        Returns:
+            Handler function.
+        Raises:
+            ImportError: If the module cannot be imported.
+            AttributeError: If the module has no such attribute.
+            TypeError: If the attribute is not callable.
+        """
+        if self._func is None:
+            with self._lock:
+                if self._func is None:
+                    obj: Any = importlib.import_module(self.module_name)
+                    for name in self.attr_name.split("."):
+                        obj = getattr(obj, name)
+                    if not callable(obj):
+                        raise TypeError(f"Handler is not callable: {self.import_path}")
+                    self._func = obj
+        return self._func
+
+    def get_doc(self) -> Union[str, None]:
+        """Returns the docstring of the handler, parsed from the module source if it is not imported yet."""
+        if self._func is not None:
+            return self._func.__doc__
+
+        try:
+            spec = importlib.util.find_spec(self.module_name)
+        except (ImportError, ValueError):
+            return None
+        if spec is None or not spec.origin or not spec.origin.endswith(".py"):
+            return None
+
+        with open(spec.origin, "r", encoding="utf-8") as file:
+            body = ast.parse(file.read()).body
+        for name in self.attr_name.split("."):
+            node = next(
+                (
+                    node
+                    for node in body
+                    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)) and node.name == name
+                ),
+                None,
+            )
+            if node is None:
+                return None
+            body = node.body
+        return ast.get_docstring(node)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.load()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"LazyHandler({self.import_path!r})"
@@ -1,5 +1,6 @@
 import gzip
 import io
+from http import HTTPStatus
 from typing import Callable, Union, List, Dict
 
 from pykour.types import ASGIApp, Scope, Receive, Send
@@ -41,38 +42,97 @@ class GZipMiddleware(BaseMiddleware):
 
 
 class GZipResponder:
+    """Compresses the body of one response.
+
+    The body is buffered until it reaches the minimum size. A body that ends before is sent uncompressed, and a
+    longer one is compressed. If the body is still streaming when it reaches the minimum size, the rest of it
+    is compressed chunk by chunk as it arrives, so a streaming response is not buffered whole.
+    """
+
     def __init__(self, app: ASGIApp, minimum_size: int):
         self.app = app
         self.minimum_size = minimum_size
         self.body: List[bytes] = []
+        self.size = 0
         self.send: Union[Callable, None] = None
         self.initial_message: Union[Dict, None] = None
+        self.gzip_buffer: Union[io.BytesIO, None] = None
+        self.gzip_file: Union[gzip.GzipFile, None] = None
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send):
         self.send = send
         self.body = []
+        self.size = 0
         self.initial_message = None
+        self.gzip_buffer = None
+        self.gzip_file = None
 
         async def send_wrapper(message):
             if message["type"] == "http.response.start":
                 self.initial_message = message
+                # Partial content and bodies already encoded are sent as they are
+                if message["status"] == HTTPStatus.PARTIAL_CONTENT or any(
+                    key.lower() == b"content-encoding" for key, _ in message["headers"]
+                ):
+                    await self.send(message)
+                    self.initial_message = None
+            elif self.initial_message is None:
+                await self.send(message)
             elif message["type"] == "http.response.body":
-                self.body.append(message.get("body", b""))
-                if not message.get("more_body", False):
-                    body = b"".join(self.body)
+                body = message.get("body", b"")
+                more_body = message.get("more_body", False)
+                if self.gzip_file is not None:
+                    await self.send_compressed(body, more_body)
+                    return
+
+                self.body.append(body)
+                self.size += len(body)
+                if not more_body:
+                    body = self.body[0] if len(self.body) == 1 else b"".join(self.body)
                     if len(body) >= self.minimum_size:
                         gzip_buffer = io.BytesIO()
                         with gzip.GzipFile(fileobj=gzip_buffer, mode="wb") as f:
                             f.write(body)
                         body = gzip_buffer.getvalue()
-                        self.initial_message["headers"].append((b"content-encoding", b"gzip"))
+                        self.set_gzip_headers(len(body))
                     await self.send(self.initial_message)
                     await self.send({"type": "http.response.body", "body": body, "more_body": False})
+                elif self.size >= self.minimum_size:
+                    # The length of a streaming body is unknown, so it is sent without Content-Length
+                    self.set_gzip_headers(None)
+                    await self.send(self.initial_message)
+                    self.gzip_buffer = io.BytesIO()
+                    self.gzip_file = gzip.GzipFile(fileobj=self.gzip_buffer, mode="wb")
+                    body = b"".join(self.body)
+                    self.body = []
+                    await self.send_compressed(body, True)
+            elif message["type"] == "http.response.pathsend":
+                # The server sends the file itself, so it cannot be compressed
+                await self.send(self.initial_message)
+                await self.send(message)
             else:
                 await self.send(message)
 
         await self.app(scope, receive, send_wrapper)
 
+    def set_gzip_headers(self, content_length: Union[int, None]) -> None:
+        # The length announced by the application is the length before compression
+        headers = [(key, value) for key, value in self.initial_message["headers"] if key.lower() != b"content-length"]
+        headers.append((b"content-encoding", b"gzip"))
+        if content_length is not None:
+            headers.append((b"content-length", str(content_length).encode("latin-1")))
+        self.initial_message["headers"] = headers
+
+    async def send_compressed(self, body: bytes, more_body: bool) -> None:
+        self.gzip_file.write(body)
+        if not more_body:
+            self.gzip_file.close()
+        compressed = self.gzip_buffer.getvalue()
+        self.gzip_buffer.seek(0)
+        self.gzip_buffer.truncate()
+        if compressed or not more_body:
+            await self.send({"type": "http.response.body", "body": compressed, "more_body": more_body})
+
 
 def gzip_middleware(minimum_size: int = 500):
     def middleware(app: ASGIApp):
@@ -0,0 +1,78 @@
+from functools import lru_cache
+from typing import List, NamedTuple, Optional, Tuple
+
+ACCEPT_CACHE_SIZE = 256
+
+TEXT_PLAIN = "text/plain"
+APPLICATION_JSON = "application/json"
+APPLICATION_NDJSON = "application/x-ndjson"
+RESPONSE_TYPES = (TEXT_PLAIN, APPLICATION_JSON, APPLICATION_NDJSON)
+
+
+class Negotiation(NamedTuple):
+    """Result of the content negotiation for an Accept header.
+
+    Attributes:
+        media_types: Accepted media types in order of preference.
+        response_type: Media type of successful responses, or None if it depends on the response body.
+        error_type: Media type of error responses.
+    """
+
+    media_types: Tuple[str, ...]
+    response_type: Optional[str]
+    error_type: str
+
+
+def parse_accept_header(accept_header: str) -> List[Tuple[str, float]]:
+    """Parse an Accept header into media types and their quality values, sorted by preference.
+
+    Args:
+        accept_header: Value of the Accept header.
+    Returns:
+        List of media types and quality values.
+    """
+    result = []
+    for value in accept_header.split(","):
+        parts = value.split(";")
+        mime_type = parts[0].strip()
+        q_value = 1.0
+
+        if len(parts) > 1 and parts[1].strip().startswith("q="):
+            try:
+                q_value = float(parts[1].strip()[2:])
+            except ValueError:
+                pass
+
+        result.append((mime_type, q_value))
+
+    result.sort(key=lambda x: x[1], reverse=True)
+    return result
+
+
+@lru_cache(maxsize=ACCEPT_CACHE_SIZE)
+def negotiate(accept: Optional[bytes]) -> Negotiation:
+    """Negotiate the media types of responses for a raw Accept header.
+
+    Clients send few distinct Accept headers, so the results are kept in a bounded LRU cache.
+
+    Args:
+        accept: Raw value of the Accept header, or None if the request has none.
+    Returns:
+        Negotiation result.
+    """
+    if not accept:
+        return Negotiation((), TEXT_PLAIN, TEXT_PLAIN)
+
+    media_types = tuple(mime_type for mime_type, _ in parse_accept_header(accept.decode("latin-1")))
+
+    response_type: Optional[str] = TEXT_PLAIN
+    for media_type in media_types:
+        if media_type in RESPONSE_TYPES:
+            response_type = media_type
+            break
+        if media_type == "*/*":
+            response_type = None
+            break
+
+    error_type = APPLICATION_JSON if APPLICATION_JSON in media_types else TEXT_PLAIN
+    return Negotiation(media_types, response_type, error_type)
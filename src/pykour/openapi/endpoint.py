@@ -1,6 +1,7 @@
 import inspect
 from typing import get_type_hints, Any
 
+from pykour.lazy import LazyHandler
 from pykour.schema import BaseSchema
 
 TYPE_MAP = {
@@ -55,8 +56,15 @@ def generate_openapi_paths(app):
             method, handlers = endpoint
             handler, port = handlers
 
+            if isinstance(handler, LazyHandler):
+                # Lazy handlers are described from their source until their module is imported
+                summary = handler.get_doc()
+                handler = handler.load() if handler.loaded else None
+            else:
+                summary = handler.__doc__
+
             paths[path][method.lower()] = {
-                "summary": handler.__doc__.strip(),
+                "summary": (summary or "").strip(),
             }
 
             # if parameters exist, add them to the path
@@ -65,7 +73,7 @@ def generate_openapi_paths(app):
             #     paths[path][method.lower()]["parameters"] = parameters
 
             # if request body exists, add it to the path
-            request_body = generate_openapi_request_body(handler)
+            request_body = generate_openapi_request_body(handler) if handler else None
             if request_body:
                 paths[path][method.lower()]["requestBody"] = request_body
 
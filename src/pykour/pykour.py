@@ -1,16 +1,22 @@
+import asyncio
 import os
-from typing import Callable, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Any, Optional, Union
 from uuid import uuid4
 
 from pykour.app import ASGIApp
+from pykour.codec import JSONCodec, get_codec
 from pykour.config import Config
 from pykour.db.pool import ConnectionPool
 from pykour.globals import thread_local
-from pykour.logging import setup_logging, write_debug_log
+from pykour.logging import setup_logging, write_debug_log, write_error_log
 
 from pykour.router import Router
+from pykour.staticfiles import StaticFiles
 from pykour.types import Scope, Receive, Send
 
+DOCS_ASSETS_PREFIX = "/docs/assets"
+
 
 class Pykour(Router):
     """Pykour application."""
@@ -23,34 +29,112 @@ class Pykour(Router):
         version: str = "0.1.0",
         prefix="/",
         config: Config = Config(),
+        warm_up: bool = False,
+        json_codec: Union[str, JSONCodec, None] = None,
     ) -> None:
         """Initialize Pykour application.
 
         Args:
             prefix: URL prefix. Default is "/".
             config: Configuration instance.
+            warm_up: Import the modules of lazy handlers in the background on lifespan startup.
+            json_codec: JSON codec name such as ``orjson``, or a codec instance. It takes precedence over
+                the ``pykour.json.codec`` configuration key.
         """
         self.production_mode = os.getenv("PYKOUR_ENV") == "production"
         self.title = title
         self.summary = summary
         self.description = description
         self.version = version
+        self.warm_up_on_startup = warm_up
+        self._warm_up_task: Optional[asyncio.Task] = None
 
-        super().__init__(prefix=prefix)
+        super().__init__(prefix=prefix, cache_size=config.get_router_cache_size())
         self._config = config
         setup_logging(self._config.get_log_levels())
 
         self.app = ASGIApp()
+        self.aborted_requests = 0
+
+        self.max_body_size = self._config.get_request_max_body_size()
+        self.json_codec = get_codec(json_codec or self._config.get_json_codec())
+        self.json_stream_threshold = self._config.get_json_stream_threshold()
+        self.json_chunk_size = self._config.get_json_chunk_size()
+        self.executor = ThreadPoolExecutor(self._config.get_executor_max_workers(), thread_name_prefix="pykour")
+
+        # Serve the Swagger UI assets of /docs from a local directory instead of the CDN
+        self.docs_assets_url: Optional[str] = None
+        docs_assets_dir = self._config.get_docs_assets_dir()
+        if docs_assets_dir:
+            self.mount(DOCS_ASSETS_PREFIX, StaticFiles(docs_assets_dir))
+            self.docs_assets_url = DOCS_ASSETS_PREFIX
 
         self.pool = None
         if self._config.get_datasource_type():
             self.pool = ConnectionPool(self._config)
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await self.lifespan(scope, receive, send)
+            return
+
+        if not self.frozen:
+            self.freeze()
         scope["app"] = self
         thread_local.request_id = str(uuid4())
         await self.app(scope, receive, send)
 
+    async def lifespan(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle the ASGI lifespan protocol.
+
+        The routes are frozen on startup, so the first request does not pay for compiling them.
+
+        Args:
+            scope: The ASGI scope.
+            receive: The ASGI receive function.
+            send: The ASGI send function.
+        """
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                try:
+                    self.freeze()
+                except Exception as e:
+                    await send({"type": "lifespan.startup.failed", "message": str(e)})
+                    return
+                if self.warm_up_on_startup:
+                    self._warm_up_task = asyncio.create_task(self.warm_up())
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                if self._warm_up_task is not None and not self._warm_up_task.done():
+                    self._warm_up_task.cancel()
+                for executor in (self.executor, *self.get_executors()):
+                    executor.shutdown(wait=False)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def warm_up(self) -> None:
+        """Import the modules of all lazy handlers one by one in the executor of the application.
+
+        Handlers that fail to import are logged and imported again on their first request.
+        """
+        loop = asyncio.get_running_loop()
+        for handler in self.get_lazy_handlers():
+            try:
+                await loop.run_in_executor(self.executor, handler.load)
+            except Exception as e:
+                write_error_log(f"Failed to load handler {handler.import_path}: {e}")
+
+    def freeze(self) -> None:
+        """Compile the routes of the application into immutable lookup structures.
+
+        This runs automatically on lifespan startup or on the first request.
+        Adding a route afterwards raises ``RuntimeError``.
+        """
+        if not self.frozen:
+            write_debug_log("Freeze routes")
+        super().freeze()
+
     @property
     def config(self) -> Config:
         """Get the configuration.
@@ -1,42 +1,69 @@
-import json
-from typing import Mapping, Any, Iterator, cast, List, Tuple, Union
-from collections import defaultdict
+from typing import Mapping, Any, AsyncIterator, Dict, Iterator, cast, List, Optional, Tuple, Union
 
+from pykour.codec import DEFAULT_CODEC, JSONCodec
+from pykour.datastructures import Headers
+from pykour.negotiation import Negotiation, negotiate, parse_accept_header
+from pykour.exceptions import ClientDisconnect, HTTPException, PayloadTooLargeException
 from pykour.types import Scope, Receive
 from pykour.url import URL
 from urllib.parse import parse_qs
 
+_UNSET: Any = object()
 
-class Request(Mapping[str, Any]):
-    """Request is a class that represents a request from a client."""
 
-    def __init__(self, scope: Scope, receive: Receive):
+class Request(Mapping[str, Any]):
+    """Request is a class that represents a request from a client.
+
+    Requests have a fixed set of attributes. Store any other per-request values in ``state``.
+    """
+
+    __slots__ = (
+        "scope",
+        "receive",
+        "max_body_size",
+        "json_codec",
+        "path_params",
+        "route_match",
+        "background",
+        "_body",
+        "_json",
+        "_headers",
+        "_query_params",
+        "_negotiation",
+        "_stream_consumed",
+        "_state",
+    )
+
+    def __init__(
+        self,
+        scope: Scope,
+        receive: Receive,
+        max_body_size: Optional[int] = None,
+        json_codec: JSONCodec = DEFAULT_CODEC,
+    ):
         """Initializes a new instance of the Request class.
 
         Args:
             scope: The ASGI scope.
             receive: The ASGI receive function.
+            max_body_size: Maximum size of the request body in bytes. The size is not limited if omitted.
+            json_codec: JSON codec used to parse the body.
         """
 
         self.scope = scope
         self.receive = receive
-        self._headers = defaultdict(list)
-        self.content_type = None
-        self.charset = "utf-8"
-        self.path_params: dict[str, str] = {}
-
-        if "headers" in self.scope:
-            for key, value in self.scope["headers"]:
-                decoded_key = key.decode("latin1").lower()
-                decoded_value = value.decode("latin1")
-                self._headers[decoded_key].append(decoded_value)
-
-                if decoded_key == "content-type":
-                    self.content_type = decoded_value
-                    if "charset=" in decoded_value:
-                        self.charset = decoded_value.split("charset=")[-1]
-
+        self.max_body_size = max_body_size
+        self.json_codec = json_codec
+        self._body: Optional[bytes] = None
+        self._json: Any = _UNSET
+        self._headers = Headers(scope.get("headers"))
+        self._query_params: Optional[Dict[str, Union[str, List[str]]]] = None
+        self._negotiation: Optional[Negotiation] = None
+        self.path_params: Mapping[str, str] = {}
+        self.route_match: Any = None
+        self.background: Any = None
         self._stream_consumed = False
+        self._state: Optional[Dict[str, Any]] = None
 
     def __getitem__(self, key: str) -> Any:
         return self.scope[key]
@@ -59,6 +86,19 @@ class Request(Mapping[str, Any]):
         """
         return self.scope["app"]
 
+    @property
+    def state(self) -> Dict[str, Any]:
+        """Returns the mapping of per-request values set by middleware and handlers.
+
+        The mapping is created on first access.
+
+        Returns:
+            Per-request state.
+        """
+        if self._state is None:
+            self._state = {}
+        return self._state
+
     @property
     def url(self) -> URL:
         """Returns the URL instance.
@@ -69,22 +109,45 @@ class Request(Mapping[str, Any]):
         return URL(scope=self.scope)
 
     @property
-    def headers(self) -> dict[str, list[str]]:
+    def headers(self) -> Headers:
         """Returns the headers.
 
+        The headers are decoded on first access.
+
         Returns:
-            Headers.
+            Case-insensitive mapping of header names to their values.
         """
         return self._headers
 
-    def get_header(self, name: str) -> list[str]:
+    def get_header(self, name: str) -> Optional[List[str]]:
         """Returns the header value.
 
         Args:
-            name: The header name.
+            name: The header name, in any case.
         """
         return self._headers.get(name)
 
+    @property
+    def content_type(self) -> Optional[str]:
+        """Returns the value of the Content-Type header.
+
+        Returns:
+            Content type, or None if the request has no Content-Type header.
+        """
+        return self._headers.get_first("content-type")
+
+    @property
+    def charset(self) -> str:
+        """Returns the charset of the Content-Type header.
+
+        Returns:
+            Charset, or ``utf-8`` if the Content-Type header has no charset.
+        """
+        content_type = self.content_type
+        if content_type and "charset=" in content_type:
+            return content_type.split("charset=")[-1]
+        return "utf-8"
+
     @property
     def method(self) -> Union[str, None]:
         """Returns the HTTP method.
@@ -118,6 +181,15 @@ class Request(Mapping[str, Any]):
         else:
             return self.scope["http_version"]
 
+    @property
+    def host(self) -> Union[str, None]:
+        """Returns the value of the Host header.
+
+        Returns:
+            Host header, or None if the request has no Host header.
+        """
+        return self._headers.get_first("host")
+
     @property
     def client(self) -> Union[str, None]:
         """Returns the client address.
@@ -150,18 +222,22 @@ class Request(Mapping[str, Any]):
         return self.scope["query_string"]
 
     @property
-    def query_params(self) -> dict[str, Union[str, list[str]]]:
+    def query_params(self) -> Dict[str, Union[str, List[str]]]:
         """Returns the query parameters.
 
+        The query string is parsed on first access.
+
         Returns:
             Query parameters.
         """
-        query_string = self.scope["query_string"].decode("utf-8")
-
-        parsed_dict = parse_qs(query_string)
-
-        result = {k: (v[0] if len(v) == 1 else v) for k, v in parsed_dict.items()}
-        return result
+        if self._query_params is None:
+            query_string = self.scope.get("query_string", b"")
+            if query_string:
+                parsed_dict = parse_qs(query_string.decode("utf-8"))
+                self._query_params = {k: (v[0] if len(v) == 1 else v) for k, v in parsed_dict.items()}
+            else:
+                self._query_params = {}
+        return self._query_params
 
     @property
     def accept(self) -> List[str]:
@@ -170,79 +246,132 @@ class Request(Mapping[str, Any]):
         Returns:
             Accept header.
         """
-        return self.get_sorted_accept_list(self.scope)
+        return list(self.negotiation.media_types)
+
+    @property
+    def negotiation(self) -> Negotiation:
+        """Returns the content negotiation result for the Accept header.
+
+        It is looked up once per request, from a cache shared by the requests with the same Accept header.
+
+        Returns:
+            Negotiation result.
+        """
+        if self._negotiation is None:
+            self._negotiation = negotiate(self._headers.get_raw("accept"))
+        return self._negotiation
+
+    async def stream(self) -> AsyncIterator[bytes]:
+        """Iterates over the chunks of the request body as they are received, without buffering them.
+
+        If the body has already been read by ``body()``, the cached body is yielded instead.
+
+        Returns:
+            Async iterator of the body chunks.
+        Raises:
+            PayloadTooLargeException: If the body exceeds the maximum body size.
+            ClientDisconnect: If the client disconnects before the body is received.
+            RuntimeError: If the body has already been streamed.
+        """
+        if self._body is not None:
+            if self._body:
+                yield self._body
+            return
+        if self._stream_consumed:
+            raise RuntimeError("The request body has already been streamed")
+        self._stream_consumed = True
+
+        max_body_size = self.max_body_size
+        if max_body_size is not None:
+            content_length = self._headers.get_first("content-length")
+            if content_length and content_length.isdigit() and int(content_length) > max_body_size:
+                raise PayloadTooLargeException()
+
+        size = 0
+        more_body = True
+        while more_body:
+            message = await self.receive()
+            if message.get("type") == "http.disconnect":
+                raise ClientDisconnect()
+            chunk = message.get("body", b"")
+            if chunk:
+                size += len(chunk)
+                if max_body_size is not None and size > max_body_size:
+                    raise PayloadTooLargeException()
+                yield chunk
+            more_body = message.get("more_body", False)
 
     async def body(self) -> bytes:
         """Reads the request body.
 
+        The body is read once and cached, so it can be read again by later calls.
+
         Returns:
             The request body.
+        Raises:
+            PayloadTooLargeException: If the body exceeds the maximum body size.
+            ClientDisconnect: If the client disconnects before the body is received.
         """
-        try:
-            body = b""
-            more_body = True
-
-            while more_body:
-                message = await self.receive()
-                body += message.get("body", b"")
-                more_body = message.get("more_body", False)
-
-            return body
-        except Exception as e:
-            print(f"Error occurred while receiving body: {e}")
-            raise e
+        if self._body is None:
+            chunks = [chunk async for chunk in self.stream()]
+            self._body = chunks[0] if len(chunks) == 1 else b"".join(chunks)
+        return self._body
 
     async def json(self) -> Any:
         """Parses the request body as JSON.
 
+        The parsed object is cached, so it is parsed once per request.
+
         Returns:
             The parsed JSON object.
         """
-        try:
-            body = await self.body()
-            return json.loads(body)
-        except Exception as e:
-            print(f"Error occurred while parsing JSON: {e}")
-            raise e
+        if self._json is _UNSET:
+            try:
+                self._json = self.json_codec.loads(await self.body())
+            except HTTPException:
+                raise
+            except Exception as e:
+                print(f"Error occurred while parsing JSON: {e}")
+                raise e
+        return self._json
 
     @staticmethod
     def parse_accept_header(accept_header: str) -> List[Tuple[str, float]]:
         """
         Parse the accept header and return a sorted list of MIME types.
         """
-        accept_values = accept_header.split(",")
-        result = []
-
-        for value in accept_values:
-            parts = value.split(";")
-            mime_type = parts[0].strip()
-            q_value = 1.0
-
-            if len(parts) > 1 and parts[1].strip().startswith("q="):
-                try:
-                    q_value = float(parts[1].strip()[2:])
-                except ValueError:
-                    pass
-
-            result.append((mime_type, q_value))
-
-        result.sort(key=lambda x: x[1], reverse=True)
-        return result
+        return parse_accept_header(accept_header)
 
     def get_sorted_accept_list(self, scope: Scope) -> List[str]:
         """
         Parse the accept header and return a sorted list of MIME types.
         """
-        headers = scope.get("headers", [])
-        accept_header = ""
+        return list(negotiate(Headers(scope.get("headers")).get_raw("accept")).media_types)
+
 
-        for header in headers:
-            if header[0].decode("latin-1") == "accept":
-                accept_header = header[1].decode("latin-1")
-                break
+class Stream(AsyncIterator[bytes]):
+    """Request body bound to a handler parameter as an async iterator of chunks.
+
+    Declaring a parameter of this type lets a handler process a large body chunk by chunk,
+    with constant memory.
+
+    Example:
+        @app.post('/uploads')
+        async def upload(stream: Stream):
+            async for chunk in stream:
+                ...
+    """
+
+    def __init__(self, request: Request):
+        """Initializes a new instance of the Stream class.
+
+        Args:
+            request: The request whose body is streamed.
+        """
+        self._iterator = request.stream()
 
-        if not accept_header:
-            return []
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return self
 
-        parsed_accept = self.parse_accept_header(accept_header)
-        return [mime_type for mime_type, q_value in parsed_accept]
+    async def __anext__(self) -> bytes:
+        return await self._iterator.__anext__()
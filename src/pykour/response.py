@@ -1,11 +1,36 @@
+import asyncio
+import mimetypes
+import mmap
+import os
+import stat
+from concurrent.futures import Executor
+from email.utils import formatdate, parsedate_to_datetime
 from http import HTTPStatus
+from typing import Any, AsyncGenerator, AsyncIterable, Iterable, Iterator, Optional, Tuple, Union
+from urllib.parse import quote
 
+import pykour.exceptions as ex
+from pykour.request import Request
 from pykour.types import Send, HTTPStatusCode
 
+Content = Union[str, bytes, memoryview]
+ContentStream = Union[AsyncIterable[Content], Iterable[Content]]
+Buffer = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+BODYLESS_STATUS_CODES = (HTTPStatus.NO_CONTENT, HTTPStatus.NOT_MODIFIED)
+
+DEFAULT_FILE_CHUNK_SIZE = 65536
+PATHSEND_EXTENSION = "http.response.pathsend"
+TEXT_CONTENT_TYPES = ("application/json", "application/javascript", "application/xml", "image/svg+xml")
+
+_EXHAUSTED: Any = object()
+
 
 class Response:
     """Response is a class that represents an HTTP response."""
 
+    __slots__ = ("send", "started", "_status_code", "_charset", "_content_type", "_headers", "_content")
+
     def __init__(
         self,
         send: Send,
@@ -23,12 +48,13 @@ class Response:
         """
 
         self.send = send
+        self.started = False
         self._status_code = status_code
         self._charset = charset
         self._content_type = content_type
         self._headers = []
         self._headers.append((b"Content-Type", f"{content_type}; charset={charset}".encode("latin-1")))
-        self._content = ""
+        self._content: Content = ""
 
     @property
     def status(self) -> HTTPStatusCode:
@@ -111,17 +137,17 @@ class Response:
                 result.append(header[1].decode("latin-1"))
         return result
 
-    def add_header(self, key: str, value: str) -> None:
+    def add_header(self, key: str, value: Union[str, bytes]) -> None:
         """Add a header to the response.
 
         Args:
             key: The key of the header.
-            value: The value of the header.
+            value: The value of the header. Bytes are sent as they are.
         """
-        self._headers.append((key.encode("latin-1"), value.encode("latin-1")))
+        self._headers.append((key.encode("latin-1"), value if isinstance(value, bytes) else value.encode("latin-1")))
 
     @property
-    def content(self) -> str:
+    def content(self) -> Content:
         """Get the content of the response.
 
         Returns:
@@ -130,25 +156,446 @@ class Response:
         return self._content
 
     @content.setter
-    def content(self, content: str) -> None:
+    def content(self, content: Content) -> None:
         """Set the content of the response.
 
         Args:
-            content: The content of the response.
+            content: The content of the response. Bytes and memoryviews are sent as they are, without encoding
+                or copying.
         """
         self._content = content
 
+    def encode_content(self) -> Union[bytes, memoryview]:
+        """Get the content of the response as it is sent.
+
+        Returns:
+            The content encoded with the charset of the response, or as it is if it is already binary.
+        """
+        content = self._content
+        if not content:
+            return b""
+        if isinstance(content, str):
+            return content.encode(self._charset)
+        if isinstance(content, memoryview) and not content.c_contiguous:
+            return content.tobytes()
+        return content
+
     async def render(self) -> None:
-        """Render the response."""
+        """Render the response.
 
+        The whole body is sent in a single message, announced by a ``Content-Length`` header unless the status
+        does not allow a body or the header has already been set.
+        """
+
+        status_code = self._status_code
+        if status_code < 200 or status_code in BODYLESS_STATUS_CODES:
+            body: Union[bytes, memoryview] = b""
+        else:
+            body = self.encode_content()
+            if not any(key.lower() == b"content-length" for key, _ in self._headers):
+                length = body.nbytes if isinstance(body, memoryview) else len(body)
+                self._headers.append((b"Content-Length", str(length).encode("latin-1")))
+
+        self.started = True
         await self.send(
             {
                 "type": "http.response.start",
-                "status": self._status_code,
+                "status": status_code,
                 "headers": self._headers,
             }
         )
-        if self._status_code == HTTPStatus.NO_CONTENT or self.content is None or self.content == "":
-            await self.send({"type": "http.response.body", "body": b""})
-        else:
-            await self.send({"type": "http.response.body", "body": self._content.encode(self._charset)})
+        await self.send({"type": "http.response.body", "body": body})
+
+
+class StreamingResponse(Response):
+    """Response whose body is sent chunk by chunk as an iterator produces it.
+
+    Each chunk is sent in its own ``http.response.body`` message with ``more_body`` set, and the next chunk is
+    not produced until the server has accepted the previous one. No ``Content-Length`` header is sent.
+    """
+
+    __slots__ = ("body_iterator", "executor")
+
+    def __init__(
+        self,
+        send: Send,
+        content: ContentStream,
+        status_code: HTTPStatusCode = HTTPStatus.OK,
+        charset: str = "utf-8",
+        content_type: str = "application/json",
+        executor: Union[Executor, None] = None,
+    ) -> None:
+        """Create a new StreamingResponse object.
+
+        Args:
+            send: The send function of the ASGI application.
+            content: Async or sync iterable of the chunks of the body, as str, bytes or memoryview.
+            status_code: The status code of the response.
+            charset: The charset of the response.
+            content_type: The content type of the response.
+            executor: Executor that advances a sync iterator, so a blocking iterator does not stall the event
+                loop. The default executor of the event loop is used if omitted.
+        """
+        super().__init__(send, status_code, charset, content_type)
+        self.body_iterator = content
+        self.executor = executor
+
+    @classmethod
+    def from_response(
+        cls, response: Response, content: ContentStream, executor: Union[Executor, None] = None
+    ) -> "StreamingResponse":
+        """Create a streaming response with the status and the headers of a response.
+
+        Args:
+            response: Response whose status, charset, content type and headers are copied.
+            content: Async or sync iterable of the chunks of the body.
+            executor: Executor that advances a sync iterator.
+        Returns:
+            StreamingResponse instance.
+        """
+        streaming = cls(response.send, content, response.status, response.charset, response.content_type, executor)
+        streaming._headers = list(response._headers)
+        return streaming
+
+    async def iterate(self) -> AsyncGenerator[Content, None]:
+        """Iterate over the chunks of the body.
+
+        Returns:
+            Async generator of the chunks.
+        """
+        content = self.body_iterator
+        if isinstance(content, AsyncIterable):
+            async for chunk in content:
+                yield chunk
+            return
+        if isinstance(content, (list, tuple)):
+            # Chunks already in memory never block
+            for chunk in content:
+                yield chunk
+            return
+
+        iterator = iter(content)
+        loop = asyncio.get_running_loop()
+        pending: Union[asyncio.Future, None] = None
+        try:
+            while True:
+                # Shielded, so a cancelled response still learns when the executor is done with the iterator
+                pending = loop.run_in_executor(self.executor, next, iterator, _EXHAUSTED)
+                chunk = await asyncio.shield(pending)
+                if chunk is _EXHAUSTED:
+                    return
+                yield chunk
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                if pending is None or pending.done():
+                    close()
+                else:
+                    # A generator cannot be closed while it is running, so close it once the chunk is produced
+                    pending.add_done_callback(lambda future: close_after(future, close))
+
+    async def render(self) -> None:
+        """Render the response, sending each chunk of the body as soon as it is produced.
+
+        The first chunk is produced before the status line is sent, so an iterator that fails right away still
+        lets an error response be sent instead. Once ``started`` is set, a failure can only abort the response.
+        """
+
+        has_body = self._status_code >= 200 and self._status_code not in BODYLESS_STATUS_CODES
+        chunks = self.iterate()
+        try:
+            first: Union[Content, None] = None
+            if has_body:
+                first = await chunks.__anext__()
+        except StopAsyncIteration:
+            pass
+        except BaseException:
+            await self.close(chunks)
+            raise
+
+        try:
+            self.started = True
+            await self.send(
+                {
+                    "type": "http.response.start",
+                    "status": self._status_code,
+                    "headers": self._headers,
+                }
+            )
+            if first:
+                await self.send_chunk(first)
+            if has_body:
+                async for chunk in chunks:
+                    if chunk:
+                        await self.send_chunk(chunk)
+        finally:
+            await self.close(chunks)
+        await self.send({"type": "http.response.body", "body": b"", "more_body": False})
+
+    async def send_chunk(self, chunk: Content) -> None:
+        """Send a chunk of the body.
+
+        Args:
+            chunk: Chunk of the body.
+        """
+        body = chunk.encode(self._charset) if isinstance(chunk, str) else chunk
+        await self.send({"type": "http.response.body", "body": body, "more_body": True})
+
+    async def close(self, chunks: AsyncGenerator[Content, None]) -> None:
+        """Close the chunk iterator and the body iterator.
+
+        Args:
+            chunks: Generator returned by ``iterate()``.
+        """
+        await chunks.aclose()
+        aclose = getattr(self.body_iterator, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+class FileResponse(StreamingResponse):
+    """Response that sends a file from disk without reading it into memory.
+
+    The file is read in chunks of a fixed size, or handed over to the server with the ``http.response.pathsend``
+    extension when the server supports it. ``Last-Modified`` and ``ETag`` are computed from the stat data of the
+    file, and when rendered for a request, conditional requests and single byte ranges are answered with
+    ``304 Not Modified`` and ``206 Partial Content``.
+    """
+
+    __slots__ = ("path", "filename", "chunk_size", "stat_result", "buffer")
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        status_code: HTTPStatusCode = HTTPStatus.OK,
+        content_type: Optional[str] = None,
+        charset: str = "utf-8",
+        filename: Optional[str] = None,
+        chunk_size: int = DEFAULT_FILE_CHUNK_SIZE,
+        stat_result: Optional[os.stat_result] = None,
+        send: Optional[Send] = None,
+        executor: Union[Executor, None] = None,
+        buffer: Optional[Buffer] = None,
+    ) -> None:
+        """Create a new FileResponse object.
+
+        Args:
+            path: Path of the file.
+            status_code: The status code of the response.
+            content_type: The content type of the response. It is guessed from the file name if omitted.
+            charset: The charset of text files.
+            filename: File name the client saves the file as. The file is sent as an attachment if specified.
+            chunk_size: Size in bytes of the chunks the file is read in.
+            stat_result: Stat data of the file, if already known.
+            send: The send function of the ASGI application. It is set by the application if omitted.
+            executor: Executor the file is read in. The default executor of the event loop is used if omitted.
+            buffer: Content of the file already in memory, such as a cached copy or a memory map. It is sent as
+                slices of the buffer, without reading the file. ``stat_result`` must describe the same content.
+        """
+        if content_type is None:
+            content_type = mimetypes.guess_type(filename or os.fspath(path))[0] or "application/octet-stream"
+        super().__init__(send, (), status_code, charset, content_type, executor)
+        if not (content_type.startswith("text/") or content_type in TEXT_CONTENT_TYPES):
+            self._headers[0] = (b"Content-Type", content_type.encode("latin-1"))
+        if filename is not None:
+            self._headers.append((b"Content-Disposition", content_disposition(filename)))
+        self.path = path
+        self.filename = filename
+        self.chunk_size = chunk_size
+        self.stat_result = stat_result
+        self.buffer = buffer
+
+    async def render(self, request: Optional[Request] = None) -> None:
+        """Render the response.
+
+        Args:
+            request: Request the response answers. Conditional and range headers are ignored if omitted.
+        Raises:
+            ResourceNotFoundException: If the file does not exist or is not a regular file.
+        """
+        stat_result = self.stat_result
+        if stat_result is None:
+            try:
+                stat_result = await asyncio.get_running_loop().run_in_executor(self.executor, os.stat, self.path)
+            except (FileNotFoundError, NotADirectoryError):
+                raise ex.ResourceNotFoundException()
+            self.stat_result = stat_result
+        if not stat.S_ISREG(stat_result.st_mode):
+            raise ex.ResourceNotFoundException()
+
+        size = stat_result.st_size
+        etag = f'"{stat_result.st_mtime_ns:x}-{size:x}"'
+        self._headers.append((b"Last-Modified", formatdate(stat_result.st_mtime, usegmt=True).encode("latin-1")))
+        self._headers.append((b"ETag", etag.encode("latin-1")))
+        self._headers.append((b"Accept-Ranges", b"bytes"))
+
+        start, length = 0, size
+        if request is not None and self._status_code == HTTPStatus.OK:
+            headers = request.headers
+            if is_not_modified(
+                headers.get_first("if-none-match"), headers.get_first("if-modified-since"), etag, stat_result
+            ):
+                self._status_code = HTTPStatus.NOT_MODIFIED
+                await super().render()
+                return
+
+            range_header = headers.get_first("range")
+            if range_header is not None and if_range_matches(headers.get_first("if-range"), etag, stat_result):
+                try:
+                    byte_range = parse_range_header(range_header, size)
+                except ValueError:
+                    self._status_code = HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE
+                    self._headers.append((b"Content-Range", f"bytes */{size}".encode("latin-1")))
+                    self._headers.append((b"Content-Length", b"0"))
+                    await super().render()
+                    return
+                if byte_range is not None:
+                    start, end = byte_range
+                    length = end - start + 1
+                    self._status_code = HTTPStatus.PARTIAL_CONTENT
+                    self._headers.append((b"Content-Range", f"bytes {start}-{end}/{size}".encode("latin-1")))
+
+        self._headers.append((b"Content-Length", str(length).encode("latin-1")))
+        if request is not None and request.method == "HEAD":
+            await super().render()
+            return
+
+        if self.buffer is not None:
+            view = memoryview(self.buffer)[start : start + length]
+            chunk_size = self.chunk_size
+            self.body_iterator = tuple(view[i : i + chunk_size] for i in range(0, length, chunk_size))
+            await super().render()
+            return
+
+        if request is not None and length == size and PATHSEND_EXTENSION in (request.scope.get("extensions") or {}):
+            self.started = True
+            await self.send({"type": "http.response.start", "status": self._status_code, "headers": self._headers})
+            await self.send({"type": PATHSEND_EXTENSION, "path": os.path.abspath(self.path)})
+            return
+
+        self.body_iterator = read_file(self.path, start, length, self.chunk_size)
+        await super().render()
+
+
+def close_after(future: asyncio.Future, close: Any) -> None:
+    """Close an iterator once the executor has produced a chunk nobody is waiting for any more.
+
+    Args:
+        future: Future of the chunk.
+        close: Close method of the iterator.
+    """
+    if not future.cancelled():
+        # Retrieve the outcome so a failing iterator is not reported as an unhandled error
+        future.exception()
+    close()
+
+
+def content_disposition(filename: str) -> bytes:
+    quoted = quote(filename)
+    if quoted == filename:
+        return f'attachment; filename="{filename}"'.encode("latin-1")
+    return f"attachment; filename*=utf-8''{quoted}".encode("latin-1")
+
+
+def read_file(path: Union[str, "os.PathLike[str]"], start: int, length: int, chunk_size: int) -> Iterator[bytes]:
+    """Read a part of a file in chunks.
+
+    Args:
+        path: Path of the file.
+        start: Offset of the first byte.
+        length: Number of bytes to read.
+        chunk_size: Maximum size of a chunk.
+    Returns:
+        Iterator of chunks.
+    """
+    with open(path, "rb") as file:
+        file.seek(start)
+        remaining = length
+        while remaining > 0:
+            chunk = file.read(min(chunk_size, remaining))
+            if not chunk:
+                return
+            remaining -= len(chunk)
+            yield chunk
+
+
+def parse_http_date(value: str) -> Optional[float]:
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def is_not_modified(
+    if_none_match: Optional[str], if_modified_since: Optional[str], etag: str, stat_result: os.stat_result
+) -> bool:
+    """Check whether the client has the current version of a file.
+
+    Args:
+        if_none_match: Value of the If-None-Match header.
+        if_modified_since: Value of the If-Modified-Since header. It is ignored if If-None-Match is present.
+        etag: Entity tag of the file.
+        stat_result: Stat data of the file.
+    Returns:
+        True if the file has not been modified.
+    """
+    if if_none_match is not None:
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in tags or any((tag[2:] if tag.startswith("W/") else tag) == etag for tag in tags)
+    if if_modified_since is not None:
+        timestamp = parse_http_date(if_modified_since)
+        return timestamp is not None and int(stat_result.st_mtime) <= timestamp
+    return False
+
+
+def if_range_matches(if_range: Optional[str], etag: str, stat_result: os.stat_result) -> bool:
+    """Check whether the Range header of a request applies to the current version of a file.
+
+    Args:
+        if_range: Value of the If-Range header.
+        etag: Entity tag of the file.
+        stat_result: Stat data of the file.
+    Returns:
+        True if the range applies.
+    """
+    if if_range is None:
+        return True
+    if_range = if_range.strip()
+    if if_range.startswith('"') or if_range.startswith("W/"):
+        # Only a strong entity tag matches
+        return if_range == etag
+    return parse_http_date(if_range) == int(stat_result.st_mtime)
+
+
+def parse_range_header(range_header: str, size: int) -> Optional[Tuple[int, int]]:
+    """Parse a Range header into a single byte range.
+
+    Args:
+        range_header: Value of the Range header.
+        size: Size of the file.
+    Returns:
+        First and last byte positions of the range, or None if the header is ignored because it is malformed
+        or asks for several ranges.
+    Raises:
+        ValueError: If the range cannot be satisfied.
+    """
+    unit, _, range_set = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in range_set:
+        return None
+
+    first, sep, last = range_set.strip().partition("-")
+    if not sep or not (first or last) or (first and not first.isdigit()) or (last and not last.isdigit()):
+        return None
+
+    if not first:
+        suffix_length = int(last)
+        if suffix_length == 0 or size == 0:
+            raise ValueError(f"Range not satisfiable: {range_header}")
+        return max(0, size - suffix_length), size - 1
+
+    start = int(first)
+    if last and int(last) < start:
+        return None
+    if start >= size:
+        raise ValueError(f"Range not satisfiable: {range_header}")
+    return start, min(int(last), size - 1) if last else size - 1
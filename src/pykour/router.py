@@ -1,20 +1,183 @@
 from __future__ import annotations
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from http import HTTPStatus
-from typing import Any, Callable, Dict, Union, List, Tuple
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Optional, Union, List, Tuple, NamedTuple, Mapping, Sequence, Iterable, Iterator
+
+from pykour.converters import Converter, PathConverter, get_converter
+from pykour.internal.handler.binding import BindingPlan, compile_binding
+from pykour.lazy import LazyHandler
+
+SUPPORTED_METHODS = ["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS", "HEAD"]
+EMPTY_PARAMS: Mapping[str, Any] = MappingProxyType({})
+
+# Sets of HTTP methods are stored as bitmaps, so the answers for every possible set are built once here.
+METHOD_BITS: Dict[str, int] = {method: 1 << index for index, method in enumerate(SUPPORTED_METHODS)}
+ALLOWED_METHODS: Tuple[Tuple[str, ...], ...] = tuple(
+    tuple(method for method in SUPPORTED_METHODS if mask & METHOD_BITS[method])
+    for mask in range(1 << len(SUPPORTED_METHODS))
+)
+ALLOW_HEADERS: Tuple[bytes, ...] = tuple(", ".join(methods).encode("latin-1") for methods in ALLOWED_METHODS)
+
+
+def split_path(path: str) -> List[str]:
+    """Split a URL path into its segments.
+
+    Leading and trailing slashes are ignored, so ``/users/`` and ``users`` yield the same segments,
+    and the root path has no segments.
+
+    Args:
+        path: URL path or route pattern.
+    Returns:
+        List of path segments.
+    """
+    key = path.strip("/")
+    return key.split("/") if key else []
+
+
+def is_wild_part(part: str) -> bool:
+    """Check if a pattern segment is a path parameter (``:name``, ``*name`` or ``{name}``)."""
+    return part.startswith(":") or part.startswith("*") or part.startswith("{")
+
+
+def get_param_name(part: str) -> str:
+    """Get the parameter name of a wildcard pattern segment."""
+    return part.lstrip(":*{").rstrip("}").split(":", 1)[0].strip()
+
+
+def get_param_converter(part: str) -> Union[Converter, None]:
+    """Get the converter of a typed pattern segment such as ``{id:int}``.
+
+    Args:
+        part: Wildcard pattern segment.
+    Returns:
+        Converter instance, or None if the segment is untyped.
+    Raises:
+        ValueError: If the converter is not supported.
+    """
+    if not part.startswith("{") or ":" not in part:
+        return None
+    return get_converter(part[1:].rstrip("}").split(":", 1)[1].strip())
+
+
+def is_catch_all_part(part: str) -> bool:
+    """Check if a pattern segment matches the rest of the path (``{name:path}``)."""
+    return isinstance(get_param_converter(part), PathConverter)
 
 
 class Route:
-    def __init__(self, path: str, method: str, handler: Any):
-        self.path = path
-        self.method = method
-        self.handler = handler
-        self.path_params: Dict[str, str] = {}
+    """Immutable route registered in a router.
+
+    Routes are shared by every request, so the path parameters of a request are never stored here;
+    they are returned in a per-request ``RouteMatch`` instead.
+    The converters of typed segments such as ``{id:int}`` are resolved once when the route is created,
+    and so is the binding plan of the handler arguments.
+    """
+
+    __slots__ = ("path", "method", "handler", "param_names", "converters", "executor", "_binding")
+
+    path: str
+    method: str
+    handler: Any
+    param_names: Tuple[str, ...]
+    converters: Tuple[Union[Converter, None], ...]
+    executor: Union[ThreadPoolExecutor, None]
+    _binding: Union[BindingPlan, None]
+
+    def __init__(self, path: str, method: str, handler: Any, max_workers: Union[int, None] = None):
+        """Initialize the route.
+
+        Args:
+            path: URL path pattern.
+            method: HTTP method.
+            handler: Route handler and status code.
+            max_workers: Number of threads dedicated to a synchronous handler of this route. The executor of
+                the application is used if omitted.
+        Raises:
+            ValueError: If a path converter is not the last segment of the route.
+        """
+        segments = split_path(path)
+        if any(is_catch_all_part(part) for part in segments[:-1]):
+            raise ValueError(f"Path converter must be the last segment of the route: {path}")
+        parts = [part for part in segments if is_wild_part(part)]
+        converters = tuple(get_param_converter(part) for part in parts)
+
+        object.__setattr__(self, "path", path)
+        object.__setattr__(self, "method", method)
+        object.__setattr__(self, "handler", handler)
+        object.__setattr__(self, "param_names", tuple(get_param_name(part) for part in parts))
+        object.__setattr__(self, "converters", converters if any(converters) else ())
+        object.__setattr__(self, "_binding", None)
+        executor = ThreadPoolExecutor(max_workers, thread_name_prefix="pykour-route") if max_workers else None
+        object.__setattr__(self, "executor", executor)
 
-    def set_path_params(self, path_params: Dict[str, str]):
-        self.path_params = path_params
+        func = handler[0] if isinstance(handler, tuple) and handler else None
+        if callable(func) and not isinstance(func, LazyHandler):
+            object.__setattr__(self, "_binding", self.compile_binding(func))
+
+    @property
+    def binding(self) -> Union[BindingPlan, None]:
+        """Returns the binding plan of the handler arguments.
+
+        The plan of a lazy handler is compiled once, on the first access after its module is imported.
+        """
+        if self._binding is None:
+            func = self.handler[0] if isinstance(self.handler, tuple) and self.handler else None
+            if isinstance(func, LazyHandler) and func.loaded:
+                object.__setattr__(self, "_binding", self.compile_binding(func.load()))
+        return self._binding
+
+    def compile_binding(self, func: Callable) -> BindingPlan:
+        """Compile the binding plan of a handler of this route.
+
+        Args:
+            func: Route handler.
+        Returns:
+            BindingPlan instance.
+        """
+        typed_param_names = [name for name, converter in zip(self.param_names, self.converters) if converter]
+        return compile_binding(func, self.param_names, typed_param_names)
+
+    def parse(self, values: Sequence[str]) -> Union[Dict[str, Any], None]:
+        """Convert the matched path segments into path parameters.
+
+        Args:
+            values: Path segments matched by the wildcard segments of the route.
+        Returns:
+            Dictionary of path parameters, or None if a typed segment does not parse.
+        """
+        if not self.converters:
+            return dict(zip(self.param_names, values))
+
+        path_params = {}
+        for name, converter, value in zip(self.param_names, self.converters, values):
+            if converter is None:
+                path_params[name] = value
+                continue
+            if converter.pattern.fullmatch(value) is None:
+                return None
+            try:
+                path_params[name] = converter.convert(value)
+            except ValueError:
+                return None
+        return path_params
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __repr__(self) -> str:
+        return f"Route(path={self.path!r}, method={self.method!r})"
 
 
 class Node:
+    """Legacy trie of the routes of one HTTP method, kept as the reference of the route lookup benchmark."""
+
+    __slots__ = ("part", "children", "is_wild", "route")
+
     def __init__(self, part: str, is_wild: bool = False):
         self.part = part
         self.children: list[Node] = []
@@ -26,7 +189,7 @@ class Node:
 
         node = self
         for part in parts:
-            child = node.match_child(part)
+            child = node.get_child(part)
             if not child:
                 child = Node(
                     part,
@@ -54,6 +217,12 @@ class Node:
         # route = node.route_map.get(method)
         return node.route, path_params
 
+    def get_child(self, part: str):
+        for child in self.children:
+            if child.part == part:
+                return child
+        return None
+
     def match_child(self, part: str):
         for child in self.children:
             if child.part == part and not child.is_wild:
@@ -64,131 +233,648 @@ class Node:
         return None
 
 
+def get_method_mask(methods: Iterable[str]) -> int:
+    """Get the bitmap of a set of HTTP methods.
+
+    Args:
+        methods: HTTP methods.
+    Returns:
+        Bitmap with the bit of every method set.
+    """
+    mask = 0
+    for method in methods:
+        mask |= METHOD_BITS[method]
+    return mask
+
+
+def normalize_host(host: str) -> str:
+    """Normalize a host name for lookup by removing the port and the trailing dot and lowercasing it.
+
+    Args:
+        host: Value of the ``Host`` header, such as ``API.example.com:8000``.
+    Returns:
+        Normalized host name, such as ``api.example.com``.
+    """
+    if host.startswith("["):
+        host = host[: host.find("]") + 1]
+    else:
+        host = host.split(":", 1)[0]
+    return host.rstrip(".").lower()
+
+
+def join_path(prefix: str, path: str) -> str:
+    """Join a path prefix and a path into a normalized path such as ``/api/users``."""
+    return "/" + "/".join(part for part in (prefix.strip("/"), path.strip("/")) if part)
+
+
+class Mount(NamedTuple):
+    """Router or ASGI application mounted on a path prefix.
+
+    Attributes:
+        prefix: Normalized path prefix, such as ``/api``, or an empty string for the root.
+        app: Mounted router or ASGI application.
+    """
+
+    prefix: str
+    app: Any
+
+
+class RouteMatch(NamedTuple):
+    """Result of matching a request method and path against a router.
+
+    Attributes:
+        route: Matched route, or None if no route matches the method.
+        path_params: Path parameters of the matched route.
+        methods: Bitmap of the HTTP methods that have a route for the path.
+        mount: Mounted ASGI application that handles the path, if any.
+    """
+
+    route: Union[Route, None]
+    path_params: Mapping[str, Any]
+    methods: int
+    mount: Union[Mount, None] = None
+
+    @property
+    def handler(self) -> Any:
+        """Returns the handler of the matched route, or None if no route matches."""
+        return None if self.route is None else self.route.handler
+
+    @property
+    def allowed_methods(self) -> Tuple[str, ...]:
+        """Returns the HTTP methods that have a route for the path."""
+        return ALLOWED_METHODS[self.methods]
+
+    @property
+    def allow_header(self) -> bytes:
+        """Returns the prebuilt value of the ``Allow`` header for the path."""
+        return ALLOW_HEADERS[self.methods]
+
+    @property
+    def options_allow_header(self) -> bytes:
+        """Returns the prebuilt value of the ``Allow`` header of an automatic OPTIONS reply."""
+        return ALLOW_HEADERS[self.methods | METHOD_BITS["OPTIONS"]]
+
+    def is_allowed(self, method: str) -> bool:
+        """Check if the method is allowed, which is always the case for an unknown path.
+
+        Args:
+            method: HTTP method.
+        Returns:
+            False if the path has routes but none for the method.
+        """
+        return not self.methods or bool(self.methods & METHOD_BITS.get(method, 0))
+
+
+class RadixNode:
+    """Node of the compiled routing tree.
+
+    Static children are indexed by their segment. Every node has at most one wildcard child, which matches
+    a single segment, and one catch-all child, which matches the rest of the path.
+    Routes ending at this node are stored per HTTP method in registration order; routes with the same shape
+    but different converters share the node and are tried in turn.
+    The bitmap of the methods with a route is kept up to date, so the allowed methods of a node without
+    typed routes are known without looking at its routes.
+    """
+
+    __slots__ = ("static", "wild", "catch_all", "routes", "methods", "typed")
+
+    def __init__(self):
+        self.static: Dict[str, RadixNode] = {}
+        self.wild: Union[RadixNode, None] = None
+        self.catch_all: Union[RadixNode, None] = None
+        self.routes: Dict[str, Sequence[Route]] = {}
+        self.methods = 0
+        self.typed = False
+
+    def add_route(self, route: Route) -> Union[Route, None]:
+        """Add a route, replacing a route registered with the same pattern and method.
+
+        Returns:
+            Replaced route, or None if no route had the same pattern and method.
+        """
+        self.methods |= METHOD_BITS[route.method]
+        self.typed = self.typed or bool(route.converters)
+        routes: List[Route] = self.routes.setdefault(route.method, [])  # type: ignore
+        for index, registered in enumerate(routes):
+            if registered.path == route.path:
+                routes[index] = route
+                return registered
+        routes.append(route)
+        return None
+
+
+class RouteTree:
+    """Compiled routing engine shared by all HTTP methods.
+
+    Fully static paths are answered from a hash table of prebuilt matches that is compiled lazily after the
+    last registration. Any other path walks the radix tree, trying the static child of each segment before
+    the wildcard child and the catch-all child. A typed segment that does not parse falls through to the
+    next candidate.
+
+    Once frozen, the tree rejects new routes and its route lists are converted to tuples.
+    """
+
+    def __init__(self):
+        self.root = RadixNode()
+        self.static_keys: List[str] = []
+        self.static_routes: Dict[str, Tuple[Dict[str, RouteMatch], RouteMatch]] = {}
+        self.compiled = True
+        self.frozen = False
+
+    def insert(self, route: Route) -> Union[Route, None]:
+        """Insert a route into the tree.
+
+        Args:
+            route: Route instance.
+        Returns:
+            Route replaced by the new one, or None if no route had the same pattern and method.
+        Raises:
+            RuntimeError: If the tree is frozen.
+        """
+        if self.frozen:
+            raise RuntimeError(f"Cannot add route {route.method} {route.path}: the router is frozen")
+
+        parts = split_path(route.path)
+        node = self.root
+        for part in parts:
+            if is_catch_all_part(part):
+                if node.catch_all is None:
+                    node.catch_all = RadixNode()
+                node = node.catch_all
+            elif is_wild_part(part):
+                if node.wild is None:
+                    node.wild = RadixNode()
+                node = node.wild
+            else:
+                child = node.static.get(part)
+                if child is None:
+                    child = node.static[part] = RadixNode()
+                node = child
+        replaced = node.add_route(route)
+
+        if not route.param_names:
+            self.static_keys.append("/".join(parts))
+        self.compiled = False
+        return replaced
+
+    def compile(self) -> None:
+        """Resolve every fully static path once and store prebuilt matches in the static hash table.
+
+        Each entry holds the match of every allowed method and the match returned for any other method.
+        The matches are shared by every request, so their path parameters are read-only.
+        """
+        self.static_routes = {}
+        for key in self.static_keys:
+            resolved = self.resolve(split_path(key))
+            methods = get_method_mask(resolved)
+            matches = {
+                method: RouteMatch(route, MappingProxyType(dict(path_params)), methods)
+                for method, (route, path_params) in resolved.items()
+            }
+            self.static_routes[key] = (matches, NO_MATCHES[methods])
+        self.compiled = True
+
+    def freeze(self) -> None:
+        """Compile the tree and make it immutable."""
+        if self.frozen:
+            return
+        self.compile()
+
+        def freeze_node(node: RadixNode) -> None:
+            node.routes = {method: tuple(routes) for method, routes in node.routes.items()}  # type: ignore
+            for child in (*node.static.values(), node.wild, node.catch_all):
+                if child is not None:
+                    freeze_node(child)
+
+        freeze_node(self.root)
+        self.static_keys = []
+        self.frozen = True
+
+    def iter_routes(self) -> Iterator[Route]:
+        """Iterate over the routes of the tree, static segments first, then wildcard and catch-all segments.
+
+        Returns:
+            Iterator of Route instances.
+        """
+        nodes = [self.root]
+        while nodes:
+            node = nodes.pop()
+            for routes in node.routes.values():
+                yield from routes
+            children = (*node.static.values(), node.wild, node.catch_all)
+            nodes.extend(child for child in reversed(children) if child is not None)
+
+    def resolve(self, parts: List[str]) -> Dict[str, Tuple[Route, Mapping[str, Any]]]:
+        """Resolve path segments to the matching route and path parameters of every method.
+
+        Args:
+            parts: Path segments.
+        Returns:
+            Dictionary of HTTP method to route and path parameters.
+        """
+        resolved: Dict[str, Tuple[Route, Mapping[str, Any]]] = {}
+        self._collect(self.root, parts, 0, (), resolved)
+        return resolved
+
+    def search(self, path: str, method: str) -> Tuple[Union[Route, None], Mapping[str, Any]]:
+        """Search the route of the specified path and method.
+
+        Args:
+            path: URL path.
+            method: HTTP method.
+        Returns:
+            Route and path parameters, or None and empty parameters if no route matches.
+        """
+        if not self.compiled:
+            self.compile()
+
+        key = path.strip("/")
+        static = self.static_routes.get(key)
+        if static is not None:
+            matches, miss = static
+            match = matches.get(method, miss)
+            return match.route, match.path_params
+
+        found = self._find(self.root, split_path(key), 0, (), method)
+        if found is None:
+            return None, EMPTY_PARAMS
+        return found
+
+    def match(self, path: str, method: str) -> RouteMatch:
+        """Match the path in a single walk of the tree.
+
+        Args:
+            path: URL path.
+            method: HTTP method.
+        Returns:
+            RouteMatch with the route and path parameters of the method and the allowed methods of the path.
+        """
+        if not self.compiled:
+            self.compile()
+
+        key = path.strip("/")
+        static = self.static_routes.get(key)
+        if static is not None:
+            matches, miss = static
+            return matches.get(method, miss)
+
+        found: List[Tuple[Route, Dict[str, Any]]] = []
+        methods = self._match(self.root, split_path(key), 0, (), method, found)
+        if not found:
+            return NO_MATCHES[methods]
+        route, path_params = found[0]
+        return RouteMatch(route, path_params, methods)
+
+    def _find(
+        self, node: RadixNode, parts: List[str], index: int, values: Tuple[str, ...], method: str
+    ) -> Union[Tuple[Route, Dict[str, Any]], None]:
+        if index == len(parts):
+            found = self._pick(node.routes.get(method), values)
+            if found is not None:
+                return found
+        else:
+            child = node.static.get(parts[index])
+            if child is not None:
+                found = self._find(child, parts, index + 1, values, method)
+                if found is not None:
+                    return found
+            if node.wild is not None:
+                found = self._find(node.wild, parts, index + 1, values + (parts[index],), method)
+                if found is not None:
+                    return found
+        if node.catch_all is not None:
+            return self._pick(node.catch_all.routes.get(method), values + ("/".join(parts[index:]),))
+        return None
+
+    def _match(
+        self,
+        node: RadixNode,
+        parts: List[str],
+        index: int,
+        values: Tuple[str, ...],
+        method: str,
+        found: List[Tuple[Route, Dict[str, Any]]],
+    ) -> int:
+        # Walks every candidate in priority order, appends the first route of the method to found and
+        # returns the bitmap of the methods allowed for the path.
+        methods = 0
+        if index == len(parts):
+            if node.methods:
+                methods |= self._visit(node, values, method, found)
+        else:
+            child = node.static.get(parts[index])
+            if child is not None:
+                methods |= self._match(child, parts, index + 1, values, method, found)
+            if node.wild is not None:
+                methods |= self._match(node.wild, parts, index + 1, values + (parts[index],), method, found)
+        if node.catch_all is not None:
+            methods |= self._visit(node.catch_all, values + ("/".join(parts[index:]),), method, found)
+        return methods
+
+    def _visit(
+        self, node: RadixNode, values: Tuple[str, ...], method: str, found: List[Tuple[Route, Dict[str, Any]]]
+    ) -> int:
+        if not found:
+            picked = self._pick(node.routes.get(method), values)
+            if picked is not None:
+                found.append(picked)
+        if not node.typed:
+            return node.methods
+
+        methods = 0
+        for routes_method, routes in node.routes.items():
+            if self._pick(routes, values) is not None:
+                methods |= METHOD_BITS[routes_method]
+        return methods
+
+    def _collect(
+        self,
+        node: RadixNode,
+        parts: List[str],
+        index: int,
+        values: Tuple[str, ...],
+        resolved: Dict[str, Tuple[Route, Mapping[str, Any]]],
+    ) -> None:
+        if index == len(parts):
+            self._resolve_routes(node, values, resolved)
+        else:
+            child = node.static.get(parts[index])
+            if child is not None:
+                self._collect(child, parts, index + 1, values, resolved)
+            if node.wild is not None:
+                self._collect(node.wild, parts, index + 1, values + (parts[index],), resolved)
+        if node.catch_all is not None:
+            self._resolve_routes(node.catch_all, values + ("/".join(parts[index:]),), resolved)
+
+    def _resolve_routes(
+        self, node: RadixNode, values: Tuple[str, ...], resolved: Dict[str, Tuple[Route, Mapping[str, Any]]]
+    ) -> None:
+        for method, routes in node.routes.items():
+            if method not in resolved:
+                found = self._pick(routes, values)
+                if found is not None:
+                    resolved[method] = found
+
+    @staticmethod
+    def _pick(
+        routes: Union[Sequence[Route], None], values: Tuple[str, ...]
+    ) -> Union[Tuple[Route, Dict[str, Any]], None]:
+        if routes:
+            for route in routes:
+                path_params = route.parse(values)
+                if path_params is not None:
+                    return route, path_params
+        return None
+
+
+# Matches without a route are shared for each set of allowed methods.
+NO_MATCHES: Tuple[RouteMatch, ...] = tuple(RouteMatch(None, EMPTY_PARAMS, mask) for mask in range(len(ALLOWED_METHODS)))
+
+
+class RouteCache:
+    """Bounded LRU cache of route matches keyed by HTTP method and path."""
+
+    def __init__(self, maxsize: int):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of cached matches.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._matches: OrderedDict[Tuple[str, str], RouteMatch] = OrderedDict()
+
+    def get(self, method: str, path: str) -> Union[RouteMatch, None]:
+        """Get a cached match and mark it as recently used.
+
+        Args:
+            method: HTTP method.
+            path: URL path.
+        Returns:
+            Cached RouteMatch, or None if the path is not cached.
+        """
+        match = self._matches.get((method, path))
+        if match is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._matches.move_to_end((method, path))
+        return match
+
+    def put(self, method: str, path: str, match: RouteMatch) -> None:
+        """Cache a match, evicting the least recently used one if the cache is full.
+
+        Args:
+            method: HTTP method.
+            path: URL path.
+            match: RouteMatch to cache.
+        """
+        self._matches[(method, path)] = match
+        if len(self._matches) > self.maxsize:
+            self._matches.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached matches. The counters are kept."""
+        self._matches.clear()
+
+    def __len__(self) -> int:
+        return len(self._matches)
+
+    def __repr__(self) -> str:
+        return f"RouteCache(maxsize={self.maxsize}, size={len(self)}, hits={self.hits}, misses={self.misses})"
+
+
 class Router:
-    SUPPORTED_METHODS = ["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS", "HEAD"]
+    SUPPORTED_METHODS = SUPPORTED_METHODS
 
-    def __init__(self, prefix: str = ""):
+    def __init__(self, prefix: str = "", cache_size: int = 0):
         """Router class.
 
         Args:
             prefix: Prefix for the router.
+            cache_size: Maximum number of route matches kept in the LRU cache. The cache is disabled if 0.
         """
-        self.roots: dict[str, Node] = {}
+        self.tree = RouteTree()
+        self.mounts: Dict[str, Mount] = {}
+        self.mount_depths: List[int] = []
+        self.hosts: Dict[str, Router] = {}
+        self.wildcard_hosts: Dict[str, Router] = {}
         self.prefix = prefix.rstrip("/")
+        self.cache: Union[RouteCache, None] = RouteCache(cache_size) if cache_size > 0 else None
+        self._parents: List[Router] = []
+
+    @property
+    def frozen(self) -> bool:
+        """Returns True if the routes are frozen and no more routes can be added."""
+        return self.tree.frozen
+
+    def freeze(self) -> None:
+        """Compile the routes into immutable lookup structures.
+
+        Static paths are resolved into prebuilt matches holding their allowed methods, so 404 and 405
+        decisions for them need no tree walk. Adding a route afterwards raises ``RuntimeError``.
+        Mounted routers and host routers are frozen as well. Freezing is idempotent.
+        """
+        self.tree.freeze()
+        for mount in self.mounts.values():
+            if isinstance(mount.app, Router):
+                mount.app.freeze()
+        for router in (*self.hosts.values(), *self.wildcard_hosts.values()):
+            router.freeze()
+
+    def invalidate_cache(self) -> None:
+        """Clear the cached route matches of this router and of the routers it is mounted on."""
+        if self.cache is not None:
+            self.cache.clear()
+        for parent in self._parents:
+            parent.invalidate_cache()
 
     def __str__(self):
         routes: List[str] = []
-
-        def traverse(node, prefix=""):
-            for child in node.children:
-                new_prefix = f"{prefix}/{child.part}".strip("/")
-                route = child.route
-                if route:
-                    handler_name = route.handler[0].__name__
-                    route_description = f"{method} /{new_prefix} -> {handler_name}()"
-                    routes.append(route_description)
-                traverse(child, new_prefix)
-
-        for method, root in self.roots.items():
-            traverse(root)
+        for path, method, handler in self.iter_routes():
+            routes.append(f"{method} {path} -> {handler[0].__name__}()")
         return "\n".join(routes)
 
+    def iter_routes(self, prefix: str = "") -> Iterator[Tuple[str, str, Any]]:
+        """Iterate over the routes of the router, including the routes of mounted routers.
+
+        Args:
+            prefix: Prefix prepended to every path.
+        Returns:
+            Iterator of normalized path, HTTP method and handler.
+        """
+        for route in self.tree.iter_routes():
+            yield join_path(prefix, route.path), route.method, route.handler
+        for mount in self.mounts.values():
+            if isinstance(mount.app, Router) and not callable(mount.app):
+                yield from mount.app.iter_routes(join_path(prefix, mount.prefix))
+
     def __repr__(self):
         return "Router(prefix='{}')".format(self.prefix)
 
-    def get(self, path: str, status_code: HTTPStatus = HTTPStatus.OK) -> Callable:
+    def get(self, path: str, status_code: HTTPStatus = HTTPStatus.OK, max_workers: Optional[int] = None) -> Callable:
         """Decorator for GET method.
 
         Args:
             path: URL path.
             status_code: HTTP status code.
+            max_workers: Number of threads dedicated to a synchronous handler.
         Returns:
             Route decorator.
         """
-        return self.route(path=path, method="GET", status_code=status_code)
+        return self.route(path=path, method="GET", status_code=status_code, max_workers=max_workers)
 
-    def post(self, path: str, status_code: HTTPStatus = HTTPStatus.CREATED) -> Callable:
+    def post(
+        self, path: str, status_code: HTTPStatus = HTTPStatus.CREATED, max_workers: Optional[int] = None
+    ) -> Callable:
         """Decorator for POST method.
 
         Args:
             path: URL path.
             status_code: HTTP status code.
+            max_workers: Number of threads dedicated to a synchronous handler.
         Returns:
             Route decorator.
         """
-        return self.route(path=path, method="POST", status_code=status_code)
+        return self.route(path=path, method="POST", status_code=status_code, max_workers=max_workers)
 
-    def put(self, path: str, status_code: HTTPStatus = HTTPStatus.OK) -> Callable:
+    def put(self, path: str, status_code: HTTPStatus = HTTPStatus.OK, max_workers: Optional[int] = None) -> Callable:
         """Decorator for PUT method.
 
         Args:
             path: URL path.
             status_code: HTTP status code.
+            max_workers: Number of threads dedicated to a synchronous handler.
         Returns:
             Route decorator.
         """
-        return self.route(path=path, method="PUT", status_code=status_code)
+        return self.route(path=path, method="PUT", status_code=status_code, max_workers=max_workers)
 
-    def delete(self, path: str, status_code: HTTPStatus = HTTPStatus.NO_CONTENT) -> Callable:
+    def delete(
+        self, path: str, status_code: HTTPStatus = HTTPStatus.NO_CONTENT, max_workers: Optional[int] = None
+    ) -> Callable:
         """Decorator for DELETE method.
 
         Args:
             path: URL path.
             status_code: HTTP status code.
+            max_workers: Number of threads dedicated to a synchronous handler.
         Returns:
             Route decorator.
         """
-        return self.route(path=path, method="DELETE", status_code=status_code)
+        return self.route(path=path, method="DELETE", status_code=status_code, max_workers=max_workers)
 
-    def patch(self, path: str, status_code: HTTPStatus = HTTPStatus.OK) -> Callable:
+    def patch(self, path: str, status_code: HTTPStatus = HTTPStatus.OK, max_workers: Optional[int] = None) -> Callable:
         """Decorator for PATCH method.
 
         Args:
             path: URL path.
             status_code: HTTP status code.
+            max_workers: Number of threads dedicated to a synchronous handler.
         Returns:
             Route decorator.
         """
-        return self.route(path=path, method="PATCH", status_code=status_code)
+        return self.route(path=path, method="PATCH", status_code=status_code, max_workers=max_workers)
 
-    def options(self, path: str, status_code: HTTPStatus = HTTPStatus.OK) -> Callable:
+    def options(
+        self, path: str, status_code: HTTPStatus = HTTPStatus.OK, max_workers: Optional[int] = None
+    ) -> Callable:
         """Decorator for OPTIONS method.
 
         Args:
             path: URL path.
             status_code: HTTP status code.
+            max_workers: Number of threads dedicated to a synchronous handler.
         Returns:
             Route decorator.
         """
-        return self.route(path=path, method="OPTIONS", status_code=status_code)
+        return self.route(path=path, method="OPTIONS", status_code=status_code, max_workers=max_workers)
 
-    def head(self, path: str, status_code: HTTPStatus = HTTPStatus.OK) -> Callable:
+    def head(self, path: str, status_code: HTTPStatus = HTTPStatus.OK, max_workers: Optional[int] = None) -> Callable:
         """Decorator for HEAD method.
 
         Args:
             path: URL path.
             status_code: HTTP status code.
+            max_workers: Number of threads dedicated to a synchronous handler.
         Returns:
             Route decorator.
         """
-        return self.route(path=path, method="HEAD", status_code=status_code)
+        return self.route(path=path, method="HEAD", status_code=status_code, max_workers=max_workers)
 
-    def route(self, path: str, method: str = "GET", status_code: Union[HTTPStatus, int] = HTTPStatus.OK) -> Callable:
+    def route(
+        self,
+        path: str,
+        method: str = "GET",
+        status_code: Union[HTTPStatus, int] = HTTPStatus.OK,
+        handler: Union[str, None] = None,
+        max_workers: Optional[int] = None,
+    ) -> Callable:
         """Decorator for route.
 
         Args:
             path: URL path.
             method: HTTP method.
             status_code: HTTP status code.
+            handler: Import path of the handler, such as ``"package.module:function"``. The route is registered
+                immediately and the module is imported on the first matching request.
+            max_workers: Number of threads dedicated to a synchronous handler. The executor of the application
+                is used if omitted.
         Returns:
-            Route decorator.
+            Route decorator, or the lazy handler if ``handler`` is specified.
         """
 
         if method not in self.SUPPORTED_METHODS:
             raise ValueError(f"Unsupported HTTP method: {method}")
 
+        if handler is not None:
+            lazy_handler = LazyHandler(handler)
+            self.add_route(path, method, (lazy_handler, status_code), max_workers)
+            return lazy_handler
+
         def decorator(func):
-            self.add_route(path, method, (func, status_code))
+            self.add_route(path, method, (func, status_code), max_workers)
             return func
 
         return decorator
@@ -196,72 +882,221 @@ class Router:
     def add_router(self, router: Router, prefix: str = ""):
         """Add router.
 
+        The router is mounted on the prefix, so routes added to it later are visible through this router.
+
         Args:
             router: Router instance.
             prefix: Prefix for the router.
         """
+        self.mount(prefix, router)
+
+    def mount(self, prefix: str, app: Any) -> None:
+        """Mount a router or an ASGI application on a path prefix.
+
+        Requests that match no route of this router are dispatched on the longest mounted prefix of their
+        path, with the prefix removed, instead of copying the routes of the mounted router.
+
+        Args:
+            prefix: Static path prefix.
+            app: Router instance or ASGI application.
+        Raises:
+            ValueError: If the prefix contains path parameters.
+            RuntimeError: If the router is frozen.
+        """
+        if self.frozen:
+            raise RuntimeError(f"Cannot mount {prefix}: the router is frozen")
+        path = f"/{self.prefix}{prefix}" if self.prefix else prefix
+        parts = split_path(path)
+        if any(is_wild_part(part) for part in parts):
+            raise ValueError(f"Mount prefix must not contain path parameters: {prefix}")
+
+        key = "/".join(parts)
+        self.mounts[key] = Mount(f"/{key}" if key else "", app)
+        self.mount_depths = sorted({*self.mount_depths, len(parts)}, reverse=True)
+        if isinstance(app, Router):
+            app._parents.append(self)
+        self.invalidate_cache()
+
+    def host(self, host: str, router: Union[Router, None] = None) -> Router:
+        """Register a router that serves the requests for a host.
+
+        The host is either an exact name such as ``api.example.com`` or a wildcard subdomain such as
+        ``*.example.com``, which matches any subdomain but not ``example.com`` itself. Exact hosts take
+        precedence over wildcards, and the longest wildcard wins. Requests for an unregistered host are
+        served by the routes of this router.
+
+        Args:
+            host: Host name or wildcard subdomain pattern.
+            router: Router instance. A new router with the same cache size is created if omitted.
+        Returns:
+            Router registered for the host.
+        Raises:
+            ValueError: If the host pattern is invalid.
+            RuntimeError: If the router is frozen.
+        """
+        if self.frozen:
+            raise RuntimeError(f"Cannot add host {host}: the router is frozen")
+        if router is None:
+            router = Router(cache_size=self.cache.maxsize if self.cache is not None else 0)
+
+        if host.startswith("*."):
+            name = normalize_host(host[2:])
+            hosts = self.wildcard_hosts
+        else:
+            name = normalize_host(host)
+            hosts = self.hosts
+        if not name or "*" in name:
+            raise ValueError(f"Host must be a host name or a wildcard subdomain such as '*.example.com': {host}")
+
+        hosts[name] = router
+        router._parents.append(self)
+        self.invalidate_cache()
+        return router
+
+    def get_host_router(self, host: Union[str, None]) -> Router:
+        """Get the router that serves the requests for a host.
+
+        Args:
+            host: Value of the ``Host`` header.
+        Returns:
+            Router registered for the host, or this router if no host matches.
+        """
+        if not host or not (self.hosts or self.wildcard_hosts):
+            return self
 
-        def traverse(node, prefix=""):
-            for child in node.children:
-                new_prefix = f"{prefix}/{child.part}".rstrip("/")
-                route = child.route
-                if route:
-                    self.add_route(new_prefix, method, route.handler)
-                traverse(child, new_prefix)
+        name = normalize_host(host)
+        router = self.hosts.get(name)
+        if router is not None:
+            return router
 
-        for method, root in router.roots.items():
-            traverse(root, prefix=prefix)
+        if self.wildcard_hosts:
+            dot = name.find(".")
+            while dot != -1:
+                router = self.wildcard_hosts.get(name[dot + 1 :])
+                if router is not None:
+                    return router
+                dot = name.find(".", dot + 1)
+        return self
 
-    def add_route(self, path: str, method: str, handler: Any):
+    def add_route(self, path: str, method: str, handler: Any, max_workers: Optional[int] = None):
         """Add route.
 
         Args:
             path: URL path.
             method: HTTP method.
-            handler: Route handler.
+            handler: Route handler and status code. A ``"package.module:function"`` string in place of the
+                function declares a handler that is imported on the first matching request.
+            max_workers: Number of threads dedicated to a synchronous handler.
+        Raises:
+            RuntimeError: If the router is frozen.
         """
+        if self.frozen:
+            raise RuntimeError(f"Cannot add route {method} {path}: the router is frozen")
+        if isinstance(handler, tuple) and isinstance(handler[0], str):
+            handler = (LazyHandler(handler[0]), *handler[1:])
         if self.prefix:
             full_path = f"/{self.prefix}{path}"
         else:
             full_path = path
-        route = Route(full_path, method, handler)
-        if method not in self.roots:
-            self.roots[method] = Node("")
-        self.roots[method].insert(full_path, route)
+        route = Route(full_path, method, handler, max_workers)
+        replaced = self.tree.insert(route)
+        if replaced is not None and replaced.executor is not None:
+            replaced.executor.shutdown(wait=False)
+        self.invalidate_cache()
 
     def get_route(self, path: str, method: str) -> Union[Route, None]:
         """Get route.
 
+        The path parameters are not stored on the shared route; use ``match()`` to get them.
+
         Args:
             path: URL path.
             method: HTTP method.
         """
-        if method in self.roots:
-            route, path_params = self.roots[method].search(path)
-            if route:
-                route.set_path_params(path_params)
-            return route
-        return None
+        route, _ = self.tree.search(path, method)
+        if route is None and self.mounts:
+            return self.match(method, path).route
+        return route
 
-    def get_openapi_routes(self) -> List[Tuple[str, Tuple[str, Any]]]:
-        routes = []
+    def match(self, method: str, path: str) -> RouteMatch:
+        """Match a request against the router in a single walk.
+
+        Args:
+            method: HTTP method.
+            path: URL path.
+        Returns:
+            RouteMatch holding the route, the path parameters and the allowed methods.
+        """
+        if self.cache is not None:
+            match = self.cache.get(method, path)
+            if match is None:
+                match = self._match(method, path)
+                # Cached matches are shared by every request, so their path parameters are read-only
+                if match.path_params and not isinstance(match.path_params, MappingProxyType):
+                    match = match._replace(path_params=MappingProxyType(match.path_params))
+                self.cache.put(method, path, match)
+            return match
+        return self._match(method, path)
+
+    def _match(self, method: str, path: str) -> RouteMatch:
+        match = self.tree.match(path, method)
+        if match.route is not None or not self.mounts:
+            return match
+
+        # A path may have routes here and in mounted routers, so their methods are merged for the Allow header
+        methods = match.methods
+        parts = split_path(path)
+        for depth in self.mount_depths:
+            if depth > len(parts):
+                continue
+            mount = self.mounts.get("/".join(parts[:depth]))
+            if mount is None:
+                continue
+            if callable(mount.app):
+                # Paths with routes here are not handed to a mounted application
+                if methods:
+                    continue
+                return RouteMatch(None, EMPTY_PARAMS, 0, mount)
+
+            child_match = mount.app.match(method, "/" + "/".join(parts[depth:]))
+            if child_match.route is not None:
+                return child_match._replace(methods=methods | child_match.methods)
+            if child_match.mount is not None and not methods:
+                return child_match._replace(mount=Mount(mount.prefix + child_match.mount.prefix, child_match.mount.app))
+            methods |= child_match.methods
+        return match if methods == match.methods else NO_MATCHES[methods]
 
-        for method in self.roots:
-            root = self.roots[method]
+    def get_lazy_handlers(self) -> List[LazyHandler]:
+        """Get the lazy handlers that are not imported yet, including those of mounted and host routers.
+
+        Returns:
+            List of LazyHandler instances.
+        """
+        handlers = [
+            handler[0]
+            for _, _, handler in self.iter_routes()
+            if isinstance(handler[0], LazyHandler) and not handler[0].loaded
+        ]
+        for router in (*self.hosts.values(), *self.wildcard_hosts.values()):
+            handlers.extend(router.get_lazy_handlers())
+        return handlers
 
-            def traverse(node, prefix=""):
-                for child in node.children:
-                    new_prefix = f"{prefix}/{child.part}".rstrip("/")
-                    if new_prefix == "":
-                        new_prefix = "/"
-                    route = child.route
-                    if route:
-                        routes.append((new_prefix, (method, route.handler)))
-                    traverse(child, new_prefix)
+    def get_executors(self) -> List[ThreadPoolExecutor]:
+        """Get the executors dedicated to routes, including those of mounted and host routers.
 
-            traverse(root)
+        Returns:
+            List of ThreadPoolExecutor instances.
+        """
+        executors = [route.executor for route in self.tree.iter_routes() if route.executor is not None]
+        for mount in self.mounts.values():
+            if isinstance(mount.app, Router):
+                executors.extend(mount.app.get_executors())
+        for router in (*self.hosts.values(), *self.wildcard_hosts.values()):
+            executors.extend(router.get_executors())
+        return executors
 
-        return routes
+    def get_openapi_routes(self) -> List[Tuple[str, Tuple[str, Any]]]:
+        return [(path, (method, handler)) for path, method, handler in self.iter_routes()]
 
     def get_allowed_methods(self, path: str) -> List[str]:
         """Get allowed HTTP methods for the specified path.
@@ -272,22 +1107,7 @@ class Router:
         Returns:
             List of allowed HTTP methods.
         """
-        allowed_methods = []
-        http_methods = [
-            "GET",
-            "POST",
-            "PUT",
-            "DELETE",
-            "PATCH",
-            "OPTIONS",
-            "HEAD",
-        ]
-
-        for method in http_methods:
-            if self.get_route(path, method):
-                allowed_methods.append(method)
-
-        return allowed_methods
+        return list(self.match("GET", path).allowed_methods)
 
     def exists(self, path: str, method: str) -> bool:
         """Check if route exists.
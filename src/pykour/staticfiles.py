@@ -0,0 +1,328 @@
+import asyncio
+import mimetypes
+import mmap
+import os
+import stat
+from collections import OrderedDict
+from concurrent.futures import Executor
+from http import HTTPStatus
+from typing import List, Optional, Tuple, Union
+
+import pykour.exceptions as ex
+from pykour.request import Request
+from pykour.response import PATHSEND_EXTENSION, Buffer, FileResponse, Response
+from pykour.types import Receive, Scope, Send
+
+PRECOMPRESSED_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+
+class FileCache:
+    """LRU cache of file contents bounded by their total size in bytes."""
+
+    def __init__(self, maxsize: int):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum total size of the cached contents in bytes.
+        """
+        self.maxsize = maxsize
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._files: OrderedDict[str, Tuple[int, int, bytes]] = OrderedDict()
+
+    def get(self, path: str, stat_result: os.stat_result) -> Union[bytes, None]:
+        """Get the cached content of a file and mark it as recently used.
+
+        Args:
+            path: Path of the file.
+            stat_result: Current stat data of the file. A content cached for other stat data is stale.
+        Returns:
+            Cached content, or None if the file is not cached or has changed since.
+        """
+        entry = self._files.get(path)
+        if entry is None or entry[0] != stat_result.st_mtime_ns or entry[1] != stat_result.st_size:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._files.move_to_end(path)
+        return entry[2]
+
+    def put(self, path: str, stat_result: os.stat_result, content: bytes) -> None:
+        """Cache the content of a file, evicting the least recently used ones until the cache fits its size.
+
+        Args:
+            path: Path of the file.
+            stat_result: Stat data of the file the content was read with.
+            content: Content of the file.
+        """
+        if len(content) > self.maxsize:
+            return
+        self.remove(path)
+        self._files[path] = (stat_result.st_mtime_ns, stat_result.st_size, content)
+        self.size += len(content)
+        while self.size > self.maxsize:
+            _, (_, _, evicted) = self._files.popitem(last=False)
+            self.size -= len(evicted)
+
+    def remove(self, path: str) -> None:
+        """Remove the content of a file from the cache.
+
+        Args:
+            path: Path of the file.
+        """
+        entry = self._files.pop(path, None)
+        if entry is not None:
+            self.size -= len(entry[2])
+
+    def clear(self) -> None:
+        """Remove all cached contents. The counters are kept."""
+        self._files.clear()
+        self.size = 0
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def __repr__(self) -> str:
+        return (
+            f"FileCache(maxsize={self.maxsize}, size={self.size}, files={len(self)}, "
+            f"hits={self.hits}, misses={self.misses})"
+        )
+
+
+class StaticFiles:
+    """ASGI application that serves the files of a directory.
+
+    Mount it on a router to serve files under a path prefix. Small files are kept in memory as ready-to-send
+    buffers in an LRU cache bounded by their total size, large files are memory-mapped once and their maps are
+    reused while the files do not change, and the other files are read in chunks. A ``.br`` or ``.gz`` sibling of
+    a file is served instead when the client accepts its encoding. Responses support conditional and range
+    requests like ``FileResponse``.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, "os.PathLike[str]"],
+        cache_size: int = 16 * 1024 * 1024,
+        max_cached_file_size: int = 64 * 1024,
+        mmap_threshold: int = 1024 * 1024,
+        precompressed: bool = True,
+        max_mapped_files: int = 64,
+    ):
+        """Initialize the application.
+
+        Args:
+            directory: Directory to serve.
+            cache_size: Maximum total size in bytes of the files cached in memory. 0 disables the cache.
+            max_cached_file_size: Maximum size in bytes of a file cached in memory.
+            mmap_threshold: Size in bytes from which a file is memory-mapped instead of read in chunks.
+            precompressed: Whether ``.br`` and ``.gz`` siblings of files are served to clients that accept them.
+            max_mapped_files: Maximum number of memory maps kept open. Each map holds a file descriptor.
+        Raises:
+            ValueError: If the directory does not exist.
+        """
+        self.directory = os.path.realpath(directory)
+        if not os.path.isdir(self.directory):
+            raise ValueError(f"Directory does not exist: {directory}")
+        self.cache = FileCache(cache_size)
+        self.max_cached_file_size = max_cached_file_size
+        self.mmap_threshold = mmap_threshold
+        self.precompressed = precompressed
+        self.max_mapped_files = max_mapped_files
+        self._maps: OrderedDict[str, Tuple[int, int, mmap.mmap]] = OrderedDict()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        request = Request(scope, receive)
+        if request.method not in ("GET", "HEAD"):
+            response = Response(send, HTTPStatus.METHOD_NOT_ALLOWED, content_type="text/plain")
+            response.add_header("Allow", "GET, HEAD")
+            response.content = HTTPStatus.METHOD_NOT_ALLOWED.phrase
+            await response.render()
+            return
+
+        path = self.resolve(request.path)
+        if path is not None:
+            file_response = None
+            try:
+                file_response = await self.get_response(request, path, send)
+                await file_response.render(request)
+                return
+            except (ex.HTTPException, OSError, ValueError):
+                # A file that cannot be read is reported as missing, but a response that has started can only be aborted
+                if file_response is not None and file_response.started:
+                    raise
+
+        response = Response(send, HTTPStatus.NOT_FOUND, content_type="text/plain")
+        response.content = HTTPStatus.NOT_FOUND.phrase
+        await response.render()
+
+    def resolve(self, path: str) -> Union[str, None]:
+        """Resolve a request path into the path of a file in the directory.
+
+        Args:
+            path: Request path, relative to the mount prefix.
+        Returns:
+            Absolute path of the file, or None if the path points outside the directory or cannot be resolved.
+        """
+        try:
+            full_path = os.path.realpath(os.path.join(self.directory, path.lstrip("/")))
+            if os.path.commonpath((self.directory, full_path)) != self.directory:
+                return None
+        except (OSError, ValueError):
+            return None
+        return full_path
+
+    async def get_response(self, request: Request, path: str, send: Send) -> FileResponse:
+        """Create the response that sends a file, or its precompressed variant.
+
+        Args:
+            request: Request instance.
+            path: Absolute path of the file.
+            send: The ASGI send function.
+        Returns:
+            FileResponse instance.
+        Raises:
+            ResourceNotFoundException: If the file does not exist, is not a regular file or cannot be read.
+        """
+        # Stat data of local files is read without a thread hop, which would cost more than the call itself
+        try:
+            stat_result = os.stat(path)
+        except (OSError, ValueError):
+            raise ex.ResourceNotFoundException()
+        if not stat.S_ISREG(stat_result.st_mode):
+            raise ex.ResourceNotFoundException()
+
+        content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        encoding = None
+        has_variants = False
+        if self.precompressed:
+            accepted = parse_accept_encoding(request.headers.get_first("accept-encoding"))
+            for name, extension in PRECOMPRESSED_ENCODINGS:
+                try:
+                    variant_stat = os.stat(path + extension)
+                except OSError:
+                    continue
+                if not stat.S_ISREG(variant_stat.st_mode):
+                    continue
+                has_variants = True
+                if encoding is None and name in accepted:
+                    encoding, path, stat_result = name, path + extension, variant_stat
+
+        app = request.scope.get("app")
+        executor = getattr(app, "executor", None)
+        try:
+            buffer = await self.get_buffer(request, path, stat_result, executor)
+        except OSError:
+            raise ex.ResourceNotFoundException()
+        response = FileResponse(
+            path, content_type=content_type, stat_result=stat_result, send=send, executor=executor, buffer=buffer
+        )
+        if encoding is not None:
+            response.add_header("Content-Encoding", encoding)
+        if has_variants:
+            response.add_header("Vary", "Accept-Encoding")
+        return response
+
+    async def get_buffer(
+        self, request: Request, path: str, stat_result: os.stat_result, executor: Optional[Executor]
+    ) -> Union[Buffer, None]:
+        """Get the content of a file in memory, if it is small enough to be cached or large enough to be mapped.
+
+        Args:
+            request: Request instance.
+            path: Absolute path of the file.
+            stat_result: Stat data of the file.
+            executor: Executor the file is read in.
+        Returns:
+            Cached content or memory map of the file, or None if the file is read in chunks.
+        """
+        size = stat_result.st_size
+        loop = asyncio.get_running_loop()
+        if size <= self.max_cached_file_size and self.cache.maxsize > 0:
+            content = self.cache.get(path, stat_result)
+            if content is None:
+                content = await loop.run_in_executor(executor, read_bytes, path)
+                if len(content) != size:
+                    return None
+                self.cache.put(path, stat_result, content)
+            return content
+
+        if size >= self.mmap_threshold and PATHSEND_EXTENSION not in (request.scope.get("extensions") or {}):
+            return await self.get_map(path, stat_result, executor)
+        return None
+
+    async def get_map(
+        self, path: str, stat_result: os.stat_result, executor: Optional[Executor]
+    ) -> Union[mmap.mmap, None]:
+        """Get the memory map of a file, mapping it if it is not mapped yet or has changed since.
+
+        Args:
+            path: Absolute path of the file.
+            stat_result: Stat data of the file.
+            executor: Executor the file is mapped in.
+        Returns:
+            Memory map of the file, or None if the file has changed while it was mapped.
+        """
+        entry = self._maps.get(path)
+        if entry is not None and entry[0] == stat_result.st_mtime_ns and entry[1] == stat_result.st_size:
+            self._maps.move_to_end(path)
+            return entry[2]
+
+        mapped = await asyncio.get_running_loop().run_in_executor(executor, map_file, path, stat_result.st_size)
+        self.unmap(path)
+        if mapped is not None and self.max_mapped_files > 0:
+            self._maps[path] = (stat_result.st_mtime_ns, stat_result.st_size, mapped)
+            while len(self._maps) > self.max_mapped_files:
+                self.unmap(next(iter(self._maps)))
+        return mapped
+
+    def unmap(self, path: str) -> None:
+        """Forget the memory map of a file and close it unless a response is still sending it.
+
+        Args:
+            path: Absolute path of the file.
+        """
+        entry = self._maps.pop(path, None)
+        if entry is not None:
+            close_map(entry[2])
+
+
+def read_bytes(path: str) -> bytes:
+    with open(path, "rb") as file:
+        return file.read()
+
+
+def map_file(path: str, size: int) -> Union[mmap.mmap, None]:
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size != size:
+            return None
+        # The map keeps its own reference to the file, so the file can be closed
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def close_map(mapped: mmap.mmap) -> None:
+    try:
+        mapped.close()
+    except BufferError:
+        # Views of the map are still being sent, so the map is closed when it is garbage collected
+        pass
+
+
+def parse_accept_encoding(accept_encoding: Optional[str]) -> List[str]:
+    """Parse an Accept-Encoding header into the accepted content codings.
+
+    Args:
+        accept_encoding: Value of the Accept-Encoding header.
+    Returns:
+        Accepted content codings, without those with a quality value of 0.
+    """
+    if not accept_encoding:
+        return []
+    encodings = []
+    for value in accept_encoding.split(","):
+        name, _, params = value.partition(";")
+        params = params.strip().replace(" ", "")
+        if params in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        encodings.append(name.strip().lower())
+    return encodings
@@ -45,6 +45,11 @@ class Assertion:
         assert self.get_status_code() == 500, f"Expected 500, but got {self.get_status_code()}"
         return self
 
+    def has_header(self, name: str, value: str) -> Assertion:
+        actual = self.get_headers().get(name.lower())
+        assert actual == value, f"Expected header '{name}: {value}', but got '{actual}'"
+        return self
+
     def expect(self, expected: Any) -> Assertion:
         actual = self.get_body()
         if isinstance(expected, dict) or isinstance(expected, list):
@@ -63,6 +68,15 @@ class Assertion:
                 return call_args[0][0]["status"]
         return 0
 
+    def get_headers(self) -> dict[str, str]:
+        call_args_list = self.send.call_args_list
+        for call_args in call_args_list:
+            if call_args[0][0]["type"] == "http.response.start":
+                return {
+                    key.decode("latin-1").lower(): value.decode("latin-1") for key, value in call_args[0][0]["headers"]
+                }
+        return {}
+
     def get_body(self) -> str:
         call_args_list = self.send.call_args_list
         for call_args in call_args_list:
@@ -185,6 +199,24 @@ def head(url: str, scheme: str = "http", version: str = "1.1") -> Scope:
     }
 
 
+def options(url: str, scheme: str = "http", version: str = "1.1") -> Scope:
+    url_split = url.split("?")
+
+    return {
+        "type": "http",
+        "scheme": scheme,
+        "http_version": version,
+        "method": "OPTIONS",
+        "path": url_split[0],
+        "query_string": url_split[1].encode() if len(url_split) > 1 else b"",
+        "headers": [
+            [b"host", b"localhost:8000"],
+            [b"user-agent", f"pykour/{__version__}".encode()],
+            [b"accept", b"*/*"],
+        ],
+    }
+
+
 def trace(url: str, scheme: str = "http", version: str = "1.1") -> Scope:
     url_split = url.split("?")
 
@@ -204,7 +236,7 @@ def trace(url: str, scheme: str = "http", version: str = "1.1") -> Scope:
 
 
 async def perform(app: Pykour, scope: Scope) -> Assertion:
-    receive = AsyncMock()
+    receive = AsyncMock(return_value={"type": "http.request", "body": scope.get("body", b""), "more_body": False})
     send = AsyncMock()
     await app(scope, receive, send)
     return Assertion(scope, receive, send)
@@ -0,0 +1,168 @@
+from typing import Any, Dict
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from pykour.background import BackgroundTasks
+from pykour.config import Config
+from pykour.db.connection import Connection
+from pykour.internal.handler.binding import compile_binding
+from pykour.request import Request, Stream
+from pykour.response import Response
+from pykour.schema import BaseSchema
+
+
+class UserSchema(BaseSchema):
+    name: str
+    age: int
+
+
+def create_request(path_params=None, query_params=None, pool=None):
+    app = MagicMock()
+    app.config = MagicMock(spec=Config)
+    app.pool = pool
+    request = MagicMock(spec=Request)
+    request.app = app
+    request.path_params = path_params or {}
+    request.query_params = query_params or {}
+    request.json = AsyncMock(return_value={"name": "John", "age": 30})
+    return request
+
+
+@pytest.mark.asyncio
+async def test_bind():
+    def handler(
+        user: UserSchema,
+        body1: dict,
+        body2: Dict,
+        r1: Request,
+        req: Any,
+        request: Any,
+        r2: Response,
+        res: Any,
+        resp: Any,
+        response: Any,
+        value1: int,
+        c1: Config,
+        config: Any,
+        con1: Connection,
+        conn: Any,
+        connection: Any,
+    ):
+        pass
+
+    conn = MagicMock()
+    pool = MagicMock()
+    pool.get_connection.return_value = conn
+    req = create_request(path_params={"value1": "1"}, pool=pool)
+    resp = MagicMock(spec=Response)
+
+    bound_args, c = await compile_binding(handler, ["value1"]).bind(req, resp)
+
+    assert bound_args["user"].name == "John"
+    assert bound_args["user"].age == 30
+    assert bound_args["body1"] == {"name": "John", "age": 30}
+    assert bound_args["body2"] == {"name": "John", "age": 30}
+    assert bound_args["r1"] == req
+    assert bound_args["req"] == req
+    assert bound_args["request"] == req
+    assert bound_args["r2"] == resp
+    assert bound_args["res"] == resp
+    assert bound_args["resp"] == resp
+    assert bound_args["response"] == resp
+    assert bound_args["value1"] == 1
+    assert bound_args["c1"] == req.app.config
+    assert bound_args["config"] == req.app.config
+    assert bound_args["con1"] == conn
+    assert bound_args["conn"] == conn
+    assert bound_args["connection"] == conn
+    assert c == conn
+    req.json.assert_awaited_once()
+    pool.get_connection.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_bind_without_pool():
+    def handler(dummy: Any, conn: Any):
+        pass
+
+    bound_args, c = await compile_binding(handler).bind(create_request(), MagicMock(spec=Response))
+
+    assert bound_args == {"dummy": None, "conn": None}
+    assert c is None
+
+
+@pytest.mark.asyncio
+async def test_bind_query_params():
+    def handler(page: int, name, missing: int):
+        pass
+
+    req = create_request(query_params={"page": "2", "name": "a"})
+    bound_args, _ = await compile_binding(handler).bind(req, MagicMock(spec=Response))
+
+    assert bound_args == {"page": 2, "name": "a", "missing": None}
+
+
+@pytest.mark.asyncio
+async def test_bind_typed_path_params():
+    def handler(item_id: str, tag: int):
+        pass
+
+    req = create_request(path_params={"item_id": 1, "tag": "2"})
+    bound_args, _ = await compile_binding(handler, ["item_id", "tag"], ["item_id"]).bind(req, MagicMock(spec=Response))
+
+    assert bound_args == {"item_id": 1, "tag": 2}
+
+
+@pytest.mark.asyncio
+async def test_bind_skips_unused_sources():
+    def handler(request: Request):
+        pass
+
+    req = create_request()
+    binding = compile_binding(handler)
+    await binding.bind(req, MagicMock(spec=Response))
+
+    assert not (binding.needs_body or binding.needs_query or binding.needs_connection)
+    req.json.assert_not_awaited()
+
+
+def test_is_async():
+    async def async_handler():
+        pass
+
+    def sync_handler():
+        pass
+
+    assert compile_binding(async_handler).is_async
+    assert not compile_binding(sync_handler).is_async
+
+
+@pytest.mark.asyncio
+async def test_bind_stream():
+    async def handler(stream: Stream):
+        pass
+
+    req = create_request()
+    binding = compile_binding(handler)
+    bound_args, _ = await binding.bind(req, MagicMock(spec=Response))
+
+    assert isinstance(bound_args["stream"], Stream)
+    assert not binding.needs_body
+    req.stream.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_bind_background_tasks():
+    async def handler(tasks: BackgroundTasks, more: BackgroundTasks):
+        pass
+
+    req = create_request()
+    req.background = None
+    binding = compile_binding(handler)
+    bound_args, _ = await binding.bind(req, MagicMock(spec=Response))
+
+    assert isinstance(bound_args["tasks"], BackgroundTasks)
+    assert bound_args["more"] is bound_args["tasks"]
+    assert req.background is bound_args["tasks"]
+    assert not binding.needs_query
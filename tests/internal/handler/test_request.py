@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -50,13 +50,14 @@ def test_is_supported_method():
 def test_is_method_allowed():
     from pykour.internal.handler.request import is_method_allowed
     from pykour.request import Request
+    from pykour.router import RouteMatch, get_method_mask
 
     request = MagicMock(spec=Request)
 
-    request.app.get_allowed_methods.return_value = []
+    request.route_match = RouteMatch(None, {}, 0)
     assert is_method_allowed(request) is True
 
-    request.app.get_allowed_methods.return_value = ["GET", "POST"]
+    request.route_match = RouteMatch(None, {}, get_method_mask(["GET", "POST"]))
 
     request.method = "GET"
     assert is_method_allowed(request) is True
@@ -71,116 +72,19 @@ def test_is_method_allowed():
 def test_is_valid_route():
     from pykour.internal.handler.request import is_valid_route
     from pykour.request import Request
+    from pykour.router import Route, RouteMatch, get_method_mask
 
     request = MagicMock(spec=Request)
 
-    request.app.exists.return_value = True
+    request.route_match = RouteMatch(Route("/test", "GET", "handler"), {}, get_method_mask(["GET"]))
     assert is_valid_route(request) is True
 
-    request.app.exists.return_value = False
+    request.route_match = RouteMatch(None, {}, 0)
     assert is_valid_route(request) is False
 
 
 @pytest.mark.asyncio
-async def test_bind_args1():
-    from pykour.internal.handler.request import bind_args
-    from pykour.request import Request
-    from pykour.response import Response
-    from pykour.schema import BaseSchema
-    from pykour.config import Config
-    from pykour.db.connection import Connection
-    from typing import Dict, Any
-    import inspect
-
-    class UserSchema(BaseSchema):
-        name: str
-        age: int
-
-    config = MagicMock()
-    conn = MagicMock()
-    pool = MagicMock()
-    pool.get_connection.return_value = conn
-    app = MagicMock()
-    app.config = config
-    app.pool = pool
-    request = MagicMock(spec=Request)
-    request.path_params = {"value1": "1"}
-    request.app = app
-    request.json.return_value = {"name": "John", "age": 30}
-    response = MagicMock(spec=Response)
-    items = MagicMock()
-
-    items.__iter__.return_value = [
-        ("user", inspect.Parameter("user", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=UserSchema)),
-        ("body1", inspect.Parameter("body1", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=dict)),
-        ("body2", inspect.Parameter("body2", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=Dict)),
-        ("r1", inspect.Parameter("r1", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=Request)),
-        ("req", inspect.Parameter("req", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=Any)),
-        ("request", inspect.Parameter("request", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=Any)),
-        ("r2", inspect.Parameter("r2", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=Response)),
-        ("res", inspect.Parameter("res", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=Any)),
-        ("resp", inspect.Parameter("resp", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=Any)),
-        ("response", inspect.Parameter("response", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=Any)),
-        ("value1", inspect.Parameter("value1", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=int)),
-        ("c1", inspect.Parameter("c1", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=Config)),
-        ("config", inspect.Parameter("config", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=Any)),
-        ("con1", inspect.Parameter("conn", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=Connection)),
-        ("conn", inspect.Parameter("conn", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=Any)),
-        ("connection", inspect.Parameter("conn", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=Any)),
-    ]
-
-    bound_args, c = await bind_args(request, response, items)
-
-    assert bound_args["user"].name == "John"
-    assert bound_args["user"].age == 30
-    assert bound_args["body1"] == {"name": "John", "age": 30}
-    assert bound_args["body2"] == {"name": "John", "age": 30}
-    assert bound_args["r1"] == request
-    assert bound_args["req"] == request
-    assert bound_args["request"] == request
-    assert bound_args["r2"] == response
-    assert bound_args["res"] == response
-    assert bound_args["resp"] == response
-    assert bound_args["response"] == response
-    assert bound_args["value1"] == 1
-    assert bound_args["c1"] == config
-    assert bound_args["config"] == config
-    assert bound_args["con1"] == conn
-    assert bound_args["conn"] == conn
-    assert bound_args["connection"] == conn
-    assert c == conn
-
-
-@pytest.mark.asyncio
-async def test_bind_args2():
-    from pykour.internal.handler.request import bind_args
-    from pykour.request import Request
-    from pykour.response import Response
-    from typing import Any
-    import inspect
-
-    app = MagicMock()
-    app.pool = None
-    request = MagicMock(spec=Request)
-    request.path_params = {}
-    request.app = app
-    response = MagicMock(spec=Response)
-    items = MagicMock()
-
-    items.__iter__.return_value = [
-        ("dummy", inspect.Parameter("dummy", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=Any)),
-        ("conn", inspect.Parameter("conn", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=Any)),
-    ]
-
-    bound_args, c = await bind_args(request, response, items)
-
-    assert bound_args["dummy"] is None
-    assert bound_args["conn"] is None
-    assert c is None
-
-
-@pytest.mark.asyncio
-async def test_call_sync(mocker):
+async def test_call_sync():
     from pykour.internal.handler.request import call
 
     def func():
@@ -189,14 +93,16 @@ async def test_call_sync(mocker):
     request = MagicMock()
     response = MagicMock()
 
-    mocker.patch("pykour.internal.handler.request.bind_args", return_value=({}, None))
-    result = await call(func, request, response)
+    binding = MagicMock()
+    binding.is_async = False
+    binding.bind = AsyncMock(return_value=({}, None))
+    result = await call(func, request, response, binding)
 
     assert result == "1"
 
 
 @pytest.mark.asyncio
-async def test_call_async(mocker):
+async def test_call_async():
     from pykour.internal.handler.request import call
 
     async def func():
@@ -205,14 +111,16 @@ async def test_call_async(mocker):
     request = MagicMock()
     response = MagicMock()
 
-    mocker.patch("pykour.internal.handler.request.bind_args", return_value=({}, None))
-    result = await call(func, request, response)
+    binding = MagicMock()
+    binding.is_async = True
+    binding.bind = AsyncMock(return_value=({}, None))
+    result = await call(func, request, response, binding)
 
     assert result == "1"
 
 
 @pytest.mark.asyncio
-async def test_call_with_connection(mocker):
+async def test_call_with_connection():
     from pykour.internal.handler.request import call
     from pykour.db.connection import Connection
 
@@ -227,8 +135,10 @@ async def test_call_with_connection(mocker):
     request.app = app
     response = MagicMock()
 
-    mocker.patch("pykour.internal.handler.request.bind_args", return_value=({"c": conn}, conn))
-    result = await call(func, request, response)
+    binding = MagicMock()
+    binding.is_async = False
+    binding.bind = AsyncMock(return_value=({"c": conn}, conn))
+    result = await call(func, request, response, binding)
 
     assert result == "1"
     conn.commit.assert_called_once()
@@ -237,7 +147,7 @@ async def test_call_with_connection(mocker):
 
 
 @pytest.mark.asyncio
-async def test_call_throw_exception(mocker):
+async def test_call_throw_exception():
     from pykour.internal.handler.request import call
     from pykour.db.connection import Connection
 
@@ -252,10 +162,248 @@ async def test_call_throw_exception(mocker):
     request.app = app
     response = MagicMock()
 
-    mocker.patch("pykour.internal.handler.request.bind_args", return_value=({"c": conn}, conn))
+    binding = MagicMock()
+    binding.is_async = False
+    binding.bind = AsyncMock(return_value=({"c": conn}, conn))
     with pytest.raises(ValueError):
-        await call(func, request, response)
+        await call(func, request, response, binding)
 
     conn.commit.assert_not_called()
     conn.rollback.assert_called_once()
     pool.release_connection.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_call_without_binding():
+    from pykour.internal.handler.request import call
+
+    def func(item_id: int, q):
+        return item_id, q
+
+    app = MagicMock()
+    app.pool = None
+    request = MagicMock()
+    request.app = app
+    request.path_params = {"item_id": "1"}
+    request.query_params = {"q": "a"}
+    response = MagicMock()
+
+    assert await call(func, request, response) == (1, "a")
+
+
+@pytest.mark.asyncio
+async def test_call_sync_in_executor():
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    from pykour.globals import thread_local
+    from pykour.internal.handler.request import call
+
+    def func(conn):
+        return threading.current_thread().name, thread_local.request_id
+
+    pool = MagicMock()
+    conn = MagicMock()
+    pool.get_connection.return_value = conn
+    app = MagicMock()
+    app.pool = pool
+    request = MagicMock()
+    request.app = app
+    request.path_params = {}
+    request.query_params = {}
+    thread_local.request_id = "request-1"
+
+    with ThreadPoolExecutor(1, thread_name_prefix="handler") as executor:
+        thread_name, request_id = await call(func, request, MagicMock(), executor=executor)
+
+    assert thread_name.startswith("handler")
+    assert request_id == "request-1"
+    conn.commit.assert_called_once()
+    pool.release_connection.assert_called_once_with(conn)
+
+
+@pytest.fixture
+def sqlite_pool(tmp_path):
+    from pykour.config import Config
+    from pykour.db.pool import ConnectionPool
+
+    config = MagicMock(spec=Config)
+    config.get_datasource_type.return_value = "sqlite"
+    config.get_datasource_db.return_value = str(tmp_path / "test.db")
+    config.get_datasource_pool_max_connections.return_value = 1
+    pool = ConnectionPool(config)
+    conn = pool.get_connection()
+    conn.execute("CREATE TABLE items (name TEXT)")
+    conn.commit()
+    pool.release_connection(conn)
+    yield pool
+    pool.close_all_connections()
+
+
+@pytest.mark.asyncio
+async def test_call_sync_with_sqlite_connection(sqlite_pool):
+    from concurrent.futures import ThreadPoolExecutor
+    from pykour.internal.handler.request import call
+
+    def func(conn):
+        conn.execute("INSERT INTO items (name) VALUES (?)", "a")
+        return conn.fetch_many("SELECT name FROM items")
+
+    request = MagicMock()
+    request.app.pool = sqlite_pool
+    request.path_params = {}
+    request.query_params = {}
+
+    with ThreadPoolExecutor(1) as executor:
+        assert await call(func, request, MagicMock(), executor=executor) == [{"name": "a"}]
+
+
+@pytest.mark.asyncio
+async def test_call_sync_in_executor_throw_exception():
+    from pykour.internal.handler.request import call
+
+    def func(conn):
+        raise ValueError("Error")
+
+    pool = MagicMock()
+    conn = MagicMock()
+    pool.get_connection.return_value = conn
+    app = MagicMock()
+    app.pool = pool
+    request = MagicMock()
+    request.app = app
+    request.path_params = {}
+    request.query_params = {}
+
+    with pytest.raises(ValueError):
+        await call(func, request, MagicMock())
+
+    conn.commit.assert_not_called()
+    conn.rollback.assert_called_once()
+    pool.release_connection.assert_called_once_with(conn)
+
+
+@pytest.mark.asyncio
+async def test_call_cancelled_rolls_back():
+    import asyncio
+    from pykour.internal.handler.request import call
+
+    async def func(conn):
+        await asyncio.sleep(10)
+
+    pool = MagicMock()
+    conn = MagicMock()
+    pool.get_connection.return_value = conn
+    app = MagicMock()
+    app.pool = pool
+    request = MagicMock()
+    request.app = app
+    request.path_params = {}
+    request.query_params = {}
+
+    task = asyncio.ensure_future(call(func, request, MagicMock()))
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    conn.commit.assert_not_called()
+    conn.rollback.assert_called_once()
+    pool.release_connection.assert_called_once_with(conn)
+
+
+@pytest.mark.asyncio
+async def test_call_sync_cancelled_rolls_back():
+    import asyncio
+    import threading
+    from pykour.internal.handler.request import call
+
+    started = threading.Event()
+    resume = threading.Event()
+
+    def func(conn):
+        started.set()
+        resume.wait(1)
+
+    pool = MagicMock()
+    conn = MagicMock()
+    pool.get_connection.return_value = conn
+    released = threading.Event()
+    pool.release_connection.side_effect = lambda c: released.set()
+    app = MagicMock()
+    app.pool = pool
+    request = MagicMock()
+    request.app = app
+    request.path_params = {}
+    request.query_params = {}
+
+    task = asyncio.ensure_future(call(func, request, MagicMock()))
+    await asyncio.get_running_loop().run_in_executor(None, started.wait, 1)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    resume.set()
+    await asyncio.get_running_loop().run_in_executor(None, released.wait, 1)
+
+    conn.commit.assert_not_called()
+    conn.rollback.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_run_background_tasks():
+    from pykour.background import BackgroundTasks
+    from pykour.db.connection import Connection
+    from pykour.internal.handler.request import run_background_tasks
+
+    calls = []
+    conns = [MagicMock(), MagicMock(), MagicMock()]
+
+    def sync_task(value, conn: Connection):
+        calls.append(("sync", value, conn))
+
+    async def async_task(value, connection=None):
+        calls.append(("async", value, connection))
+
+    def failing_task(conn):
+        raise ValueError("Error")
+
+    pool = MagicMock()
+    pool.get_connection.side_effect = conns
+    request = MagicMock()
+    request.app.pool = pool
+
+    tasks = BackgroundTasks()
+    tasks.add_task(failing_task)
+    tasks.add_task(sync_task, 1)
+    tasks.add_task(async_task, 2)
+    tasks.add_task(async_task, 3, connection="explicit")
+    await run_background_tasks(request, tasks)
+
+    assert calls == [("sync", 1, conns[1]), ("async", 2, conns[2]), ("async", 3, "explicit")]
+    conns[0].rollback.assert_called_once()
+    conns[0].commit.assert_not_called()
+    conns[1].commit.assert_called_once()
+    conns[2].commit.assert_called_once()
+    assert pool.get_connection.call_count == 3
+    assert pool.release_connection.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_run_background_tasks_with_sqlite_connection(sqlite_pool):
+    from concurrent.futures import ThreadPoolExecutor
+    from pykour.background import BackgroundTasks
+    from pykour.internal.handler.request import run_background_tasks
+
+    def sync_task(name, conn):
+        conn.execute("INSERT INTO items (name) VALUES (?)", name)
+
+    request = MagicMock()
+    request.app.pool = sqlite_pool
+    tasks = BackgroundTasks()
+    tasks.add_task(sync_task, "a")
+
+    with ThreadPoolExecutor(1) as executor:
+        await run_background_tasks(request, tasks, executor)
+
+    conn = sqlite_pool.get_connection()
+    assert conn.fetch_many("SELECT name FROM items") == [{"name": "a"}]
+    sqlite_pool.release_connection(conn)
@@ -1,42 +1,44 @@
 from http import HTTPStatus
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 
 def test_determine_content_type_for_response_body():
     from pykour.internal.handler.response import determine_content_type_for_response_body
+    from pykour.negotiation import negotiate
     from pykour.request import Request
 
     request = MagicMock(spec=Request)
 
-    request.accept = ["text/plain"]
+    request.negotiation = negotiate(b"text/plain")
     assert determine_content_type_for_response_body(request, "") == "text/plain"
 
-    request.accept = ["application/json"]
+    request.negotiation = negotiate(b"application/json")
     assert determine_content_type_for_response_body(request, "") == "application/json"
 
-    request.accept = ["*/*"]
+    request.negotiation = negotiate(b"*/*")
     assert determine_content_type_for_response_body(request, "") == "text/plain"
     assert determine_content_type_for_response_body(request, {}) == "application/json"
 
-    request.accept = ["text/html"]
+    request.negotiation = negotiate(b"text/html")
     assert determine_content_type_for_response_body(request, "") == "text/plain"
 
 
 def test_determine_content_type_for_error_response():
     from pykour.internal.handler.response import determine_content_type_for_error_response
+    from pykour.negotiation import negotiate
     from pykour.request import Request
 
     request = MagicMock(spec=Request)
 
-    request.accept = ["application/json"]
+    request.negotiation = negotiate(b"application/json")
     assert determine_content_type_for_error_response(request) == "application/json"
 
-    request.accept = ["text/plain"]
+    request.negotiation = negotiate(b"text/plain")
     assert determine_content_type_for_error_response(request) == "text/plain"
 
-    request.accept = ["text/html"]
+    request.negotiation = negotiate(b"text/html")
     assert determine_content_type_for_error_response(request) == "text/plain"
 
 
@@ -47,7 +49,7 @@ def test_detect_error_phrase():
     response = MagicMock(spec=Response)
 
     response.content_type = "application/json"
-    assert detect_error_phrase(response, "error message") == '{"error": "error message"}'
+    assert detect_error_phrase(response, "error message") == b'{"error": "error message"}'
 
     response.content_type = "text/plain"
     assert detect_error_phrase(response, "error message") == "error message"
@@ -76,11 +78,10 @@ def test_detect_response_body_by_options_method():
     from pykour.request import Request
     from pykour.response import Response
 
-    app = MagicMock()
-    app.get_allowed_methods.return_value = ["GET", "POST", "PUT", "DELETE"]
+    from pykour.router import RouteMatch, get_method_mask
 
     request = MagicMock(spec=Request)
-    request.app = app
+    request.route_match = RouteMatch(None, {}, get_method_mask(["GET", "POST", "PUT", "DELETE", "OPTIONS"]))
     response = MagicMock(spec=Response)
 
     request.method = "OPTIONS"
@@ -88,10 +89,11 @@ def test_detect_response_body_by_options_method():
     response.content_type = "application/json"
     detect_response_body(request, response, "response body")
     assert response.content == ""
-    response.add_header.assert_called_once_with("Allow", "GET, POST, PUT, DELETE")
+    response.add_header.assert_called_once_with("Allow", b"GET, POST, PUT, DELETE, OPTIONS")
 
 
 def test_detect_response_body_by_head_method():
+    from pykour.codec import JSONCodec
     from pykour.internal.handler.response import detect_response_body
     from pykour.request import Request
     from pykour.response import Response
@@ -103,15 +105,23 @@ def test_detect_response_body_by_head_method():
     request.app = app
     response = MagicMock(spec=Response)
 
+    app.json_codec = JSONCodec()
     request.method = "HEAD"
     response.status = HTTPStatus.OK
     response.content_type = "application/json"
     detect_response_body(request, response, "response body")
     assert response.content == ""
-    response.add_header.assert_called_once_with("Content-Length", "13")
+    response.add_header.assert_called_once_with("Content-Length", "15")
+
+    response.reset_mock()
+    response.content_type = "text/plain"
+    response.charset = "utf-8"
+    detect_response_body(request, response, "résumé")
+    response.add_header.assert_called_once_with("Content-Length", "8")
 
 
 def test_detect_response_body_by_content_type():
+    from pykour.codec import JSONCodec
     from pykour.internal.handler.response import detect_response_body
     from pykour.request import Request
     from pykour.response import Response
@@ -119,11 +129,12 @@ def test_detect_response_body_by_content_type():
     request = MagicMock(spec=Request)
     response = MagicMock(spec=Response)
 
+    request.app.json_codec = JSONCodec()
     request.method = "GET"
     response.status = HTTPStatus.OK
     response.content_type = "application/json"
     detect_response_body(request, response, {"key": "value"})
-    assert response.content == '{"key": "value"}'
+    assert response.content == b'{"key": "value"}'
 
     request.method = "GET"
     response.status = HTTPStatus.OK
@@ -192,3 +203,152 @@ async def test_handle_http_exception():
     response.status = HTTPStatus.NOT_FOUND
     response.content = "Not Found"
     response.render.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_handle_response_streams_iterators():
+    from pykour import Pykour
+    from pykour.internal.handler.response import handle_response
+    from pykour.negotiation import negotiate
+    from pykour.request import Request
+    from pykour.response import Response
+
+    async def chunks():
+        yield "a"
+        yield "b"
+
+    request = MagicMock(spec=Request)
+    request.app = Pykour()
+    request.method = "GET"
+    request.negotiation = negotiate(b"*/*")
+    send = AsyncMock()
+
+    await handle_response(request, Response(send), chunks())
+    await handle_response(request, Response(send), iter([b"c"]))
+
+    bodies = [call.args[0].get("body") for call in send.await_args_list]
+    assert bodies == [None, b"a", b"b", b"", None, b"c", b""]
+    assert send.await_args_list[0].args[0]["headers"] == [(b"Content-Type", b"text/plain; charset=utf-8")]
+
+
+@pytest.mark.asyncio
+async def test_handle_response_closes_stream_for_head():
+    from pykour.internal.handler.response import handle_response
+    from pykour.negotiation import negotiate
+    from pykour.request import Request
+    from pykour.response import Response
+
+    state = {}
+
+    async def chunks():
+        state["started"] = True
+        yield "a"
+
+    stream = chunks()
+    request = MagicMock(spec=Request)
+    request.method = "HEAD"
+    request.negotiation = negotiate(b"*/*")
+    send = AsyncMock()
+
+    await handle_response(request, Response(send), stream)
+
+    assert state == {}
+    assert [call.args[0]["type"] for call in send.await_args_list] == ["http.response.start", "http.response.body"]
+    with pytest.raises(StopAsyncIteration):
+        await stream.__anext__()
+
+
+def create_stream_request(accept: bytes, method: str = "GET"):
+    from pykour import Pykour
+    from pykour.negotiation import negotiate
+    from pykour.request import Request
+
+    request = MagicMock(spec=Request)
+    request.app = Pykour()
+    request.app.json_stream_threshold = 10
+    request.app.json_chunk_size = 16
+    request.method = method
+    request.negotiation = negotiate(accept)
+    return request
+
+
+@pytest.mark.asyncio
+async def test_handle_response_streams_long_lists_as_json():
+    from pykour.internal.handler.response import handle_response
+    from pykour.response import Response
+
+    request = create_stream_request(b"application/json")
+    send = AsyncMock()
+
+    await handle_response(request, Response(send), [{"id": i} for i in range(10)])
+
+    messages = [call.args[0] for call in send.await_args_list]
+    assert not any(key == b"Content-Length" for key, _ in messages[0]["headers"])
+    assert all(message["more_body"] for message in messages[1:-1])
+    body = b"".join(message["body"] for message in messages[1:])
+    assert body == request.app.json_codec.dumps([{"id": i} for i in range(10)])
+
+    send.reset_mock()
+    await handle_response(request, Response(send), [{"id": i} for i in range(9)])
+
+    assert len(send.await_args_list) == 2
+    assert send.await_args_list[0].args[0]["headers"][-1] == (b"Content-Length", b"99")
+
+
+@pytest.mark.asyncio
+async def test_handle_response_encodes_iterators_as_ndjson():
+    from pykour.internal.handler.response import handle_response
+    from pykour.response import Response
+
+    async def rows():
+        yield {"id": 1}
+        yield {"id": 2}
+
+    request = create_stream_request(b"application/x-ndjson")
+    send = AsyncMock()
+
+    await handle_response(request, Response(send), rows())
+
+    messages = [call.args[0] for call in send.await_args_list]
+    assert messages[0]["headers"][0] == (b"Content-Type", b"application/x-ndjson; charset=utf-8")
+    assert b"".join(message["body"] for message in messages[1:]) == b'{"id": 1}\n{"id": 2}\n'
+
+
+def test_detect_response_body_by_ndjson():
+    from pykour.internal.handler.response import detect_response_body
+    from pykour.response import Response
+
+    request = create_stream_request(b"application/x-ndjson")
+    response = Response(None)
+    response.content_type = "application/x-ndjson"
+
+    detect_response_body(request, response, [{"id": 1}, {"id": 2}])
+    assert response.content == b'{"id": 1}\n{"id": 2}\n'
+
+    detect_response_body(request, response, {"id": 1})
+    assert response.content == b'{"id": 1}\n'
+
+
+@pytest.mark.asyncio
+async def test_handle_response_sends_files(tmp_path):
+    from pykour import FileResponse
+    from pykour.internal.handler.response import handle_response
+    from pykour.response import Response
+
+    path = tmp_path / "hello.txt"
+    path.write_bytes(b"Hello, world!")
+    request = create_stream_request(b"*/*")
+    request.headers = MagicMock()
+    request.headers.get_first.side_effect = {"range": "bytes=0-4"}.get
+    request.scope = {}
+    send = AsyncMock()
+    response = Response(send)
+    response.add_header("X-Test", "1")
+
+    await handle_response(request, response, FileResponse(path))
+
+    messages = [call.args[0] for call in send.await_args_list]
+    assert (b"X-Test", b"1") in messages[0]["headers"]
+    assert b"".join(message["body"] for message in messages[1:]) == b"Hello"
+    assert response.status == HTTPStatus.PARTIAL_CONTENT
+    assert response.started
@@ -91,6 +91,8 @@ async def test_large_response(app: Pykour):
         decompressed_body = f.read()
 
     assert decompressed_body == str({"message": "large response" * 100}).encode()
+    content_lengths = [value for key, value in response_start["headers"] if key.lower() == b"content-length"]
+    assert content_lengths == [str(len(gzip_body)).encode()]
 
 
 @pytest.mark.asyncio
@@ -181,3 +183,91 @@ def test_gzip_middleware_factory_returns_middleware():
 
     assert isinstance(app, GZipMiddleware)
     assert app.minimum_size == minimum_size
+
+
+@pytest.mark.asyncio
+async def test_streaming_response():
+    app = Pykour()
+    app.add_middleware(GZipMiddleware, minimum_size=10)
+
+    @app.get("/stream")
+    async def stream():
+        for _ in range(10):
+            yield "chunk" * 100
+
+    @app.get("/short")
+    def short():
+        yield "a"
+        yield "b"
+
+    scope = {
+        "type": "http",
+        "scheme": "http",
+        "http_version": "1.1",
+        "client": ("127.0.0.1", 50000),
+        "method": "GET",
+        "path": "/stream",
+        "headers": [(b"accept-encoding", b"gzip")],
+    }
+    send_messages = []
+
+    async def mock_send(message):
+        send_messages.append(message)
+
+    await app(scope, mock_receive, mock_send)
+
+    response_start = send_messages[0]
+    assert (b"content-encoding", b"gzip") in response_start["headers"]
+    assert not any(key.lower() == b"content-length" for key, _ in response_start["headers"])
+    assert all(message["more_body"] for message in send_messages[1:-1])
+    assert not send_messages[-1]["more_body"]
+    body = b"".join(message["body"] for message in send_messages[1:])
+    assert gzip.decompress(body) == b"chunk" * 1000
+
+    send_messages.clear()
+    await app({**scope, "path": "/short"}, mock_receive, mock_send)
+
+    assert not any(key == b"content-encoding" for key, _ in send_messages[0]["headers"])
+    assert send_messages[1] == {"type": "http.response.body", "body": b"ab", "more_body": False}
+
+
+@pytest.mark.asyncio
+async def test_file_responses(tmp_path):
+    from pykour import FileResponse
+
+    path = tmp_path / "large.txt"
+    path.write_bytes(b"a" * 2048)
+    app = Pykour()
+    app.add_middleware(GZipMiddleware, minimum_size=10)
+
+    @app.get("/file")
+    def file():
+        return FileResponse(path)
+
+    scope = {
+        "type": "http",
+        "scheme": "http",
+        "http_version": "1.1",
+        "client": ("127.0.0.1", 50000),
+        "method": "GET",
+        "path": "/file",
+        "headers": [(b"accept-encoding", b"gzip"), (b"range", b"bytes=0-99")],
+    }
+    send_messages = []
+
+    async def mock_send(message):
+        send_messages.append(message)
+
+    await app(scope, mock_receive, mock_send)
+
+    assert send_messages[0]["status"] == 206
+    assert not any(key == b"content-encoding" for key, _ in send_messages[0]["headers"])
+    assert b"".join(message["body"] for message in send_messages[1:]) == b"a" * 100
+
+    send_messages.clear()
+    scope["headers"] = [(b"accept-encoding", b"gzip")]
+    scope["extensions"] = {"http.response.pathsend": {}}  # type: ignore[assignment]
+    await app(scope, mock_receive, mock_send)
+
+    assert send_messages[0]["type"] == "http.response.start"
+    assert send_messages[1] == {"type": "http.response.pathsend", "path": str(path)}
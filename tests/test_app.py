@@ -1,6 +1,286 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+
 def test_init():
     from pykour.app import ASGIApp
 
     app = ASGIApp()
 
     assert app is not None
+
+
+def create_scope(path):
+    return {
+        "type": "http",
+        "scheme": "http",
+        "http_version": "1.1",
+        "method": "GET",
+        "path": path,
+        "query_string": b"",
+        "headers": [(b"host", b"localhost:8000"), (b"accept", b"application/json")],
+    }
+
+
+@pytest.mark.asyncio
+async def test_disconnect_cancels_async_handler():
+    from pykour import Pykour
+
+    app = Pykour()
+    state = {}
+
+    @app.get("/slow")
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            state["cancelled"] = True
+            raise
+
+    receive = AsyncMock(
+        side_effect=[
+            {"type": "http.request", "body": b"", "more_body": False},
+            {"type": "http.disconnect"},
+        ]
+    )
+    send = AsyncMock()
+
+    await asyncio.wait_for(app(create_scope("/slow"), receive, send), 1)
+
+    assert state == {"cancelled": True}
+    assert app.aborted_requests == 1
+    send.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_sync_handler_does_not_watch_for_disconnect():
+    from pykour import Pykour
+
+    app = Pykour()
+
+    @app.get("/sync")
+    def sync_handler():
+        return {"message": "ok"}
+
+    receive = AsyncMock(return_value={"type": "http.request", "body": b"", "more_body": False})
+    send = AsyncMock()
+
+    await app(create_scope("/sync"), receive, send)
+
+    receive.assert_not_called()
+    assert send.call_args_list[0].args[0]["status"] == 200
+    app.executor.shutdown()
+
+
+async def yield_to_watcher():
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_watcher_hands_over_messages():
+    from pykour.app import DisconnectWatcher
+
+    receive = AsyncMock(
+        side_effect=[
+            {"type": "http.request", "body": b"a", "more_body": True},
+            {"type": "http.request", "body": b"b", "more_body": False},
+            {"type": "http.disconnect"},
+        ]
+    )
+    task = asyncio.ensure_future(asyncio.sleep(10))
+    watcher = DisconnectWatcher(receive, task)
+    watcher.start()
+
+    assert await watcher.receive() == {"type": "http.request", "body": b"a", "more_body": True}
+    assert await watcher.receive() == {"type": "http.request", "body": b"b", "more_body": False}
+    assert not watcher.disconnected
+    await yield_to_watcher()
+
+    assert watcher.disconnected
+    assert task.cancelled()
+    assert await watcher.receive() == {"type": "http.disconnect"}
+
+
+@pytest.mark.asyncio
+async def test_watcher_is_not_started_for_handler_that_does_not_yield():
+    from pykour.app import DisconnectWatcher
+
+    receive = AsyncMock(return_value={"type": "http.request", "body": b"", "more_body": False})
+    task = asyncio.ensure_future(asyncio.sleep(10))
+    watcher = DisconnectWatcher(receive, task)
+    watcher.start()
+    watcher.stop()
+    await yield_to_watcher()
+
+    receive.assert_not_called()
+    task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_watcher_stops_after_final_body():
+    from pykour.app import DisconnectWatcher
+
+    receive = AsyncMock(return_value={"type": "http.request", "body": b"", "more_body": False})
+    task = asyncio.ensure_future(asyncio.sleep(10))
+    watcher = DisconnectWatcher(receive, task)
+    watcher.start()
+
+    await yield_to_watcher()
+    assert await watcher.receive() == {"type": "http.request", "body": b"", "more_body": False}
+
+    assert receive.await_count == 2
+    assert not watcher.disconnected
+    task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_watcher_raises_receive_error():
+    from pykour.app import DisconnectWatcher
+
+    task = asyncio.ensure_future(asyncio.sleep(10))
+    watcher = DisconnectWatcher(AsyncMock(side_effect=ValueError("error")), task)
+    watcher.start()
+    await yield_to_watcher()
+
+    with pytest.raises(ValueError):
+        await watcher.receive()
+    task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_route_of_mounted_router_on_same_path():
+    from pykour import Pykour
+    from pykour.router import Router
+
+    app = Pykour()
+    items = Router()
+
+    @app.get("/items")
+    async def list_items():
+        return []
+
+    @items.post("/items")
+    async def create_item():
+        return {"id": 1}
+
+    app.add_router(items)
+
+    for method, status in (("POST", 201), ("HEAD", 405)):
+        scope = create_scope("/items")
+        scope["method"] = method
+        send = AsyncMock()
+        await app(scope, AsyncMock(return_value={"type": "http.request"}), send)
+
+        start = send.await_args_list[0].args[0]
+        assert start["status"] == status
+    assert (b"Allow", b"GET, POST") in start["headers"]
+
+
+@pytest.mark.asyncio
+async def test_stream_error_before_first_chunk_sends_error_response():
+    from pykour import Pykour
+
+    app = Pykour()
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            raise ValueError("error")
+            yield "a"
+
+        return chunks()
+
+    send = AsyncMock()
+    await app(create_scope("/stream"), AsyncMock(return_value={"type": "http.request"}), send)
+
+    starts = [call.args[0] for call in send.await_args_list if call.args[0]["type"] == "http.response.start"]
+    assert [start["status"] for start in starts] == [500]
+
+
+@pytest.mark.asyncio
+async def test_stream_of_objects_as_text():
+    from pykour import Pykour
+
+    app = Pykour()
+
+    @app.get("/stream")
+    def stream():
+        def chunks():
+            yield {"i": 0}
+            yield b"a"
+
+        return chunks()
+
+    scope = create_scope("/stream")
+    scope["headers"] = [(b"host", b"localhost:8000"), (b"accept", b"*/*")]
+    send = AsyncMock()
+    await app(scope, AsyncMock(return_value={"type": "http.request"}), send)
+
+    messages = [call.args[0] for call in send.await_args_list]
+    assert messages[0]["status"] == 200
+    assert (b"Content-Type", b"text/plain; charset=utf-8") in messages[0]["headers"]
+    assert [message["body"] for message in messages[1:]] == [b"{'i': 0}", b"a", b""]
+
+
+@pytest.mark.asyncio
+async def test_stream_error_after_start_aborts_response():
+    from pykour import Pykour
+
+    app = Pykour()
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            yield "a"
+            raise ValueError("error")
+
+        return chunks()
+
+    scope = create_scope("/stream")
+    scope["headers"] = [(b"host", b"localhost:8000"), (b"accept", b"text/plain")]
+    send = AsyncMock()
+    with pytest.raises(ValueError):
+        await app(scope, AsyncMock(return_value={"type": "http.request"}), send)
+
+    starts = [call.args[0] for call in send.await_args_list if call.args[0]["type"] == "http.response.start"]
+    assert [start["status"] for start in starts] == [200]
+    assert send.await_args_list[-1].args[0] == {"type": "http.response.body", "body": b"a", "more_body": True}
+
+
+@pytest.mark.asyncio
+async def test_background_tasks_run_after_response():
+    from pykour import BackgroundTasks, Pykour
+
+    app = Pykour()
+    events = []
+
+    async def task(value):
+        events.append(("task", value))
+
+    def failing_task():
+        raise ValueError("error")
+
+    @app.get("/tasks")
+    async def handler(tasks: BackgroundTasks):
+        tasks.add_task(failing_task)
+        tasks.add_task(task, 1)
+        return {"ok": True}
+
+    @app.get("/error")
+    async def error(tasks: BackgroundTasks):
+        tasks.add_task(task, 2)
+        raise ValueError("error")
+
+    receive = AsyncMock(return_value={"type": "http.request", "body": b"", "more_body": False})
+
+    async def send(message):
+        events.append(message["type"])
+
+    await app(create_scope("/tasks"), receive, send)
+    await app(create_scope("/error"), receive, send)
+
+    assert events[:3] == ["http.response.start", "http.response.body", ("task", 1)]
+    assert ("task", 2) not in events
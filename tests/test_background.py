@@ -0,0 +1,35 @@
+from pykour.background import BackgroundTasks
+from pykour.db.connection import Connection
+
+
+def test_add_task():
+    def task(a, b=None):
+        pass
+
+    tasks = BackgroundTasks()
+    tasks.add_task(task, 1, b=2)
+
+    assert len(tasks) == 1
+    (background_task,) = tasks
+    assert background_task.func is task
+    assert background_task.args == (1,)
+    assert background_task.kwargs == {"b": 2}
+    assert background_task.connection_param is None
+    assert not background_task.is_async
+
+
+def test_connection_param():
+    async def by_name(conn):
+        pass
+
+    def by_annotation(value, db: Connection):
+        pass
+
+    tasks = BackgroundTasks()
+    tasks.add_task(by_name)
+    tasks.add_task(by_annotation, 1)
+    tasks.add_task(by_annotation, 1, "db")
+    tasks.add_task(by_name, conn="db")
+
+    assert [task.connection_param for task in tasks] == ["conn", "db", None, None]
+    assert tasks.tasks[0].is_async
@@ -0,0 +1,102 @@
+import pytest
+
+from pykour import Pykour
+from pykour.codec import DEFAULT_CODEC, JSONCodec, JSONStreamEncoder, OrjsonCodec, get_codec
+from pykour.config import Config
+from pykour.testing import perform, get, post
+
+
+def test_json_codec():
+    codec = JSONCodec()
+
+    assert codec.dumps({"key": "value"}) == b'{"key": "value"}'
+    assert codec.loads(b'{"key": "value"}') == {"key": "value"}
+    assert codec.loads('{"key": "value"}') == {"key": "value"}
+
+
+def test_orjson_codec():
+    codec = OrjsonCodec()
+
+    assert codec.dumps({"key": "value", 1: "one"}) == b'{"key":"value","1":"one"}'
+    assert codec.loads(b'{"key": "value"}') == {"key": "value"}
+
+
+def test_get_codec():
+    codec = OrjsonCodec()
+
+    assert get_codec(None) is DEFAULT_CODEC
+    assert get_codec("json") is DEFAULT_CODEC
+    assert isinstance(get_codec("orjson"), OrjsonCodec)
+    assert get_codec(codec) is codec
+    with pytest.raises(ValueError):
+        get_codec("unknown")
+
+
+def test_pykour_json_codec():
+    config = Config()
+    config.config = {"pykour": {"json": {"codec": "orjson"}}}
+
+    assert Pykour().json_codec is DEFAULT_CODEC
+    assert isinstance(Pykour(config=config).json_codec, OrjsonCodec)
+    assert Pykour(config=config, json_codec="json").json_codec is DEFAULT_CODEC
+
+
+@pytest.mark.asyncio
+async def test_orjson_app():
+    app = Pykour(json_codec="orjson")
+
+    @app.post("/echo")
+    async def echo(body: dict):
+        return body
+
+    response = await perform(app, post("/echo", body='{"name": "John Doe"}'))
+
+    response.is_created().expect({"name": "John Doe"})
+    assert response.get_body() == '{"name":"John Doe"}'
+
+    response = await perform(app, get("/unknown"))
+    response.is_not_found()
+
+
+@pytest.mark.parametrize("codec", [JSONCodec(), OrjsonCodec()])
+def test_stream_encoder_matches_document(codec):
+    rows = [{"id": i, "name": f"user{i}"} for i in range(1000)]
+
+    chunks = list(JSONStreamEncoder(codec, chunk_size=1024).iterate(rows))
+
+    assert b"".join(chunks) == codec.dumps(rows)
+    assert len(chunks) > 10
+    assert all(len(chunk) < 2048 for chunk in chunks)
+    assert b"".join(JSONStreamEncoder(codec, chunk_size=1024).iterate(iter(rows))) == codec.dumps(rows)
+
+
+def test_stream_encoder_bounds_chunks_of_iterators():
+    rows = ({"id": i} for i in range(100))
+
+    chunks = list(JSONStreamEncoder(JSONCodec(), chunk_size=50).iterate(rows))
+
+    assert all(len(chunk) < 50 + len(b', {"id": 99}') for chunk in chunks)
+    assert JSONCodec().loads(b"".join(chunks)) == [{"id": i} for i in range(100)]
+
+
+def test_stream_encoder_empty():
+    assert list(JSONStreamEncoder(JSONCodec()).iterate([])) == [b"[]"]
+    assert list(JSONStreamEncoder(JSONCodec()).iterate(iter([]))) == [b"[]"]
+    assert list(JSONStreamEncoder(JSONCodec(), ndjson=True).iterate([])) == []
+
+
+def test_stream_encoder_ndjson():
+    chunks = JSONStreamEncoder(JSONCodec(), ndjson=True).iterate([{"id": 1}, {"id": 2}])
+
+    assert b"".join(chunks) == b'{"id": 1}\n{"id": 2}\n'
+
+
+@pytest.mark.asyncio
+async def test_stream_encoder_async_iterable():
+    async def rows():
+        for i in range(3):
+            yield i
+
+    chunks = [chunk async for chunk in JSONStreamEncoder(JSONCodec(), chunk_size=2).aiterate(rows())]
+
+    assert b"".join(chunks) == b"[0, 1, 2]"
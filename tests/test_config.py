@@ -258,3 +258,47 @@ def test_get_datasource_pool_max_connections():
     config = Config()
     config.config = {"pykour": {"datasource": {"pool": {"max-connections": 10}}}}
     assert config.get_datasource_pool_max_connections() == 10
+
+
+def test_get_router_cache_size():
+    config = Config()
+    assert config.get_router_cache_size() == 0
+    config.config = {"pykour": {"router": {"cache-size": 1024}}}
+    assert config.get_router_cache_size() == 1024
+
+
+def test_get_executor_max_workers():
+    config = Config()
+    assert config.get_executor_max_workers() is None
+    config.config = {"pykour": {"executor": {"max-workers": 8}}}
+    assert config.get_executor_max_workers() == 8
+
+
+def test_get_request_max_body_size():
+    config = Config()
+    assert config.get_request_max_body_size() is None
+    config.config = {"pykour": {"request": {"max-body-size": 1048576}}}
+    assert config.get_request_max_body_size() == 1048576
+
+
+def test_get_json_codec():
+    config = Config()
+    assert config.get_json_codec() is None
+    config.config = {"pykour": {"json": {"codec": "orjson"}}}
+    assert config.get_json_codec() == "orjson"
+
+
+def test_get_json_stream_settings():
+    config = Config()
+    assert config.get_json_stream_threshold() == 1000
+    assert config.get_json_chunk_size() == 65536
+    config.config = {"pykour": {"json": {"stream-threshold": 0, "chunk-size": 1024}}}
+    assert config.get_json_stream_threshold() == 0
+    assert config.get_json_chunk_size() == 1024
+
+
+def test_get_docs_assets_dir():
+    config = Config()
+    assert config.get_docs_assets_dir() is None
+    config.config = {"pykour": {"docs": {"assets-dir": "/srv/swagger-ui"}}}
+    assert config.get_docs_assets_dir() == "/srv/swagger-ui"
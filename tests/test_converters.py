@@ -0,0 +1,49 @@
+import uuid
+
+import pytest
+
+from pykour.converters import get_converter, IntegerConverter, PathConverter
+
+
+def test_get_converter():
+    assert isinstance(get_converter("int"), IntegerConverter)
+    assert isinstance(get_converter("path"), PathConverter)
+
+
+def test_get_unsupported_converter():
+    with pytest.raises(ValueError):
+        get_converter("unknown")
+
+
+def test_int_converter():
+    converter = get_converter("int")
+    assert converter.pattern.fullmatch("-42")
+    assert not converter.pattern.fullmatch("4.2")
+    assert converter.convert("-42") == -42
+
+
+def test_float_converter():
+    converter = get_converter("float")
+    assert converter.pattern.fullmatch("4.2")
+    assert not converter.pattern.fullmatch("abc")
+    assert converter.convert("4.2") == 4.2
+
+
+def test_str_converter():
+    converter = get_converter("str")
+    assert converter.pattern.fullmatch("slug")
+    assert not converter.pattern.fullmatch("")
+
+
+def test_uuid_converter():
+    value = "1b4e28ba-2fa1-11d2-883f-0016d3cca427"
+    converter = get_converter("uuid")
+    assert converter.pattern.fullmatch(value)
+    assert not converter.pattern.fullmatch("1b4e28ba")
+    assert converter.convert(value) == uuid.UUID(value)
+
+
+def test_path_converter():
+    converter = get_converter("path")
+    assert converter.pattern.fullmatch("a/b/c")
+    assert converter.convert("a/b/c") == "a/b/c"
@@ -0,0 +1,35 @@
+from pykour.datastructures import Headers
+
+
+def test_headers():
+    headers = Headers([(b"host", b"example.com"), (b"Accept", b"text/html"), (b"accept", b"*/*")])
+
+    assert headers["Accept"] == ["text/html", "*/*"]
+    assert headers.get("ACCEPT") == ["text/html", "*/*"]
+    assert headers.get("missing") is None
+    assert "Host" in headers
+    assert "missing" not in headers
+    assert list(headers) == ["host", "accept"]
+    assert len(headers) == 2
+
+
+def test_get_first_without_decoding():
+    headers = Headers([(b"host", b"example.com"), (b"Content-Type", b"text/plain")])
+
+    assert headers.get_first("Host") == "example.com"
+    assert headers.get_first("content-type") == "text/plain"
+    assert headers.get_first("missing") is None
+    assert headers.get_raw("host") == b"example.com"
+    assert headers.get_raw(b"missing") is None
+    assert headers._index is None
+
+    assert headers["host"] == ["example.com"]
+    assert headers._index is not None
+    assert headers.get_first("CONTENT-TYPE") == "text/plain"
+
+
+def test_empty_headers():
+    headers = Headers()
+
+    assert len(headers) == 0
+    assert headers.get_first("host") is None
@@ -129,3 +129,14 @@ def test_database_operation_error_exception_with_caused_by():
     assert e.args == ("Custom message", caused_by)
     assert str(e) == "Custom message caused by Caused by error"
     assert repr(e) == "DatabaseOperationError('Custom message')"
+
+
+def test_payload_too_large_exception():
+    from pykour.exceptions import PayloadTooLargeException
+
+    # Act
+    e = PayloadTooLargeException()
+
+    # Assert
+    assert e.status_code == 413
+    assert e.message == "Request Entity Too Large"
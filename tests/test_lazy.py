@@ -0,0 +1,82 @@
+import sys
+
+import pytest
+
+from pykour import Pykour
+from pykour.lazy import LazyHandler
+from pykour.openapi.endpoint import generate_openapi_paths
+from pykour.testing import perform, get
+
+
+@pytest.fixture
+def handler_module(tmp_path, monkeypatch):
+    module_name = "lazy_handlers_module"
+    (tmp_path / f"{module_name}.py").write_text(
+        "async def list_items():\n" '    """List items."""\n' '    return {"items": []}\n' "\n" "VALUE = 1\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield module_name
+    sys.modules.pop(module_name, None)
+
+
+def test_invalid_import_path():
+    with pytest.raises(ValueError):
+        LazyHandler("module_without_function")
+
+
+def test_load(handler_module):
+    handler = LazyHandler(f"{handler_module}:list_items")
+    assert handler.__name__ == "list_items"
+    assert not handler.loaded
+    assert handler_module not in sys.modules
+
+    func = handler.load()
+
+    assert handler.loaded
+    assert func.__name__ == "list_items"
+    assert handler.load() is func
+
+
+def test_load_not_callable(handler_module):
+    with pytest.raises(TypeError):
+        LazyHandler(f"{handler_module}:VALUE").load()
+
+
+def test_get_doc_without_import(handler_module):
+    handler = LazyHandler(f"{handler_module}:list_items")
+
+    assert handler.get_doc() == "List items."
+    assert handler_module not in sys.modules
+    assert LazyHandler(f"{handler_module}:unknown").get_doc() is None
+    assert LazyHandler("unknown_module:func").get_doc() is None
+
+
+@pytest.mark.asyncio
+async def test_lazy_route(handler_module):
+    app = Pykour()
+    handler = app.route("/items", handler=f"{handler_module}:list_items")
+
+    assert str(app) == "GET /items -> list_items()"
+    assert app.get_lazy_handlers() == [handler]
+    paths = generate_openapi_paths(app)
+    assert paths["/items"]["get"]["summary"] == "List items."
+    assert handler_module not in sys.modules
+
+    response = await perform(app, get("/items"))
+
+    response.is_ok().expect({"items": []})
+    assert handler.loaded  # type: ignore[attr-defined]
+    assert app.get_route("/items", "GET").binding is not None
+    assert app.get_lazy_handlers() == []
+
+
+@pytest.mark.asyncio
+async def test_warm_up(handler_module):
+    app = Pykour()
+    app.add_route("/items", "GET", (f"{handler_module}:list_items", 200))
+    app.add_route("/broken", "GET", ("unknown_module:func", 200))
+
+    await app.warm_up()
+
+    assert handler_module in sys.modules
+    assert [handler.import_path for handler in app.get_lazy_handlers()] == ["unknown_module:func"]
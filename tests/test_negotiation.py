@@ -0,0 +1,25 @@
+from pykour.negotiation import Negotiation, negotiate, parse_accept_header
+
+
+def test_parse_accept_header():
+    assert parse_accept_header("text/html;q=0.5, application/json") == [("application/json", 1.0), ("text/html", 0.5)]
+
+
+def test_negotiate():
+    assert negotiate(None) == Negotiation((), "text/plain", "text/plain")
+    assert negotiate(b"text/plain") == Negotiation(("text/plain",), "text/plain", "text/plain")
+    assert negotiate(b"text/html, */*;q=0.8") == Negotiation(("text/html", "*/*"), None, "text/plain")
+    assert negotiate(b"text/plain;q=0.5, application/json") == Negotiation(
+        ("application/json", "text/plain"), "application/json", "application/json"
+    )
+    assert negotiate(b"*/*, application/json;q=0.1").error_type == "application/json"
+    assert negotiate(b"application/x-ndjson, application/json;q=0.5") == Negotiation(
+        ("application/x-ndjson", "application/json"), "application/x-ndjson", "application/json"
+    )
+
+
+def test_negotiate_is_cached():
+    negotiate.cache_clear()
+
+    assert negotiate(b"application/json") is negotiate(b"application/json")
+    assert negotiate.cache_info().hits == 1
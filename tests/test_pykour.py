@@ -53,3 +53,49 @@ async def test_call():
     await app(scope, receive, send)
 
     app.app.assert_called_once_with(scope, receive, send)
+
+
+@pytest.mark.asyncio
+async def test_call_freezes_routes():
+    app = Pykour()
+    app.app = AsyncMock()
+
+    await app({"type": "http"}, AsyncMock(), AsyncMock())
+
+    assert app.frozen
+    with pytest.raises(RuntimeError):
+        app.add_route("/late", "GET", (lambda: None, 200))
+
+
+@pytest.mark.asyncio
+async def test_lifespan():
+    app = Pykour()
+    app.add_route("/reports", "GET", (lambda: None, 200), max_workers=1)
+    app.app = AsyncMock()
+    receive = AsyncMock(side_effect=[{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}])
+    send = AsyncMock()
+
+    await app({"type": "lifespan"}, receive, send)
+
+    assert app.frozen
+    app.app.assert_not_called()
+    with pytest.raises(RuntimeError):
+        app.executor.submit(print)
+    assert [call.args[0]["type"] for call in send.call_args_list] == [
+        "lifespan.startup.complete",
+        "lifespan.shutdown.complete",
+    ]
+    with pytest.raises(RuntimeError):
+        app.get_route("/reports", "GET").executor.submit(print)
+
+
+@pytest.mark.asyncio
+async def test_lifespan_startup_failed(mocker):
+    app = Pykour()
+    mocker.patch.object(app, "freeze", side_effect=ValueError("error"))
+    receive = AsyncMock(return_value={"type": "lifespan.startup"})
+    send = AsyncMock()
+
+    await app({"type": "lifespan"}, receive, send)
+
+    send.assert_called_once_with({"type": "lifespan.startup.failed", "message": "error"})
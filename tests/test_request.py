@@ -1,6 +1,10 @@
+from unittest.mock import AsyncMock
+
 import pytest
 
-from pykour.request import Request
+from pykour.exceptions import ClientDisconnect, PayloadTooLargeException
+
+from pykour.request import Request, Stream
 from pykour.types import Receive, Scope
 
 
@@ -77,6 +81,40 @@ def test_create_request(receive: Receive):
     assert request.accept == ["application/json", "text/html", "*/*", "text/plain"]
 
 
+def test_headers_are_parsed_lazily(scope: Scope, receive: Receive):
+    request = Request(scope, receive)
+
+    assert request.content_type == "application/json; charset=utf-8"
+    assert request.charset == "utf-8"
+    assert request.headers._index is None
+    assert request.get_header("Content-Type") == ["application/json; charset=utf-8"]
+    assert request.headers._index is not None
+
+
+def test_query_params_are_cached(receive: Receive):
+    request = Request({"query_string": b"a=1&b=2&b=3"}, receive)
+
+    assert request.query_params is request.query_params
+    assert request.query_params == {"a": "1", "b": ["2", "3"]}
+    assert request.negotiation is request.negotiation
+
+
+def test_state(scope: Scope, receive: Receive):
+    request = Request(scope, receive)
+
+    request.state["user"] = "John"
+
+    assert request.state == {"user": "John"}
+    assert not hasattr(request, "__dict__")
+    with pytest.raises(AttributeError):
+        request.user = "John"  # type: ignore[attr-defined]
+
+
+def test_host(scope: Scope, receive: Receive):
+    assert Request(scope, receive).host == "example.com"
+    assert Request({"type": "http", "headers": []}, receive).host is None
+
+
 def test_create_request_without_items(receive: Receive):
     scope = {}
     request = Request(scope, receive)
@@ -96,6 +134,99 @@ async def test_body(scope: Scope, receive: Receive):
     assert body == b'{"key": "value"}'
 
 
+@pytest.mark.asyncio
+async def test_body_is_read_once(scope: Scope):
+    receive = AsyncMock(
+        side_effect=[
+            {"type": "http.request", "body": b'{"key": ', "more_body": True},
+            {"type": "http.request", "body": b'"value"}', "more_body": False},
+        ]
+    )
+    request = Request(scope, receive)
+
+    assert await request.body() == b'{"key": "value"}'
+    assert await request.body() == b'{"key": "value"}'
+    assert await request.json() is await request.json()
+    assert receive.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_body_too_large(scope: Scope):
+    receive = AsyncMock(
+        side_effect=[
+            {"type": "http.request", "body": b"a" * 8, "more_body": True},
+            {"type": "http.request", "body": b"a" * 8, "more_body": True},
+        ]
+    )
+    request = Request(scope, receive, max_body_size=10)
+
+    with pytest.raises(PayloadTooLargeException):
+        await request.body()
+    assert receive.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_body_too_large_by_content_length(scope: Scope):
+    scope["headers"].append((b"content-length", b"11"))
+    receive = AsyncMock()
+    request = Request(scope, receive, max_body_size=10)
+
+    with pytest.raises(PayloadTooLargeException):
+        await request.body()
+    receive.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_stream(scope: Scope):
+    receive = AsyncMock(
+        side_effect=[
+            {"type": "http.request", "body": b"abc", "more_body": True},
+            {"type": "http.request", "body": b"", "more_body": True},
+            {"type": "http.request", "body": b"def", "more_body": False},
+        ]
+    )
+    request = Request(scope, receive)
+
+    assert [chunk async for chunk in Stream(request)] == [b"abc", b"def"]
+    with pytest.raises(RuntimeError):
+        await request.body()
+
+
+@pytest.mark.asyncio
+async def test_stream_after_body(scope: Scope, receive: Receive):
+    request = Request(scope, receive)
+    await request.body()
+
+    assert [chunk async for chunk in request.stream()] == [b'{"key": "value"}']
+
+
+@pytest.mark.asyncio
+async def test_stream_disconnect(scope: Scope):
+    receive = AsyncMock(
+        side_effect=[
+            {"type": "http.request", "body": b"abc", "more_body": True},
+            {"type": "http.disconnect"},
+        ]
+    )
+    request = Request(scope, receive)
+    chunks = []
+
+    with pytest.raises(ClientDisconnect):
+        async for chunk in request.stream():
+            chunks.append(chunk)
+    assert chunks == [b"abc"]
+
+
+@pytest.mark.asyncio
+async def test_stream_too_large(scope: Scope):
+    receive = AsyncMock(return_value={"type": "http.request", "body": b"a" * 8, "more_body": True})
+    request = Request(scope, receive, max_body_size=10)
+
+    with pytest.raises(PayloadTooLargeException):
+        async for _ in request.stream():
+            pass
+
+
 @pytest.mark.asyncio
 async def test_json(scope: Scope, receive: Receive):
     request = Request(scope, receive)
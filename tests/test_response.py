@@ -61,6 +61,14 @@ def test_add_header_new_key():
     ]
 
 
+def test_slots():
+    response = Response(None)
+
+    assert not hasattr(response, "__dict__")
+    with pytest.raises(AttributeError):
+        response.body = "Hello, World!"  # type: ignore[attr-defined]
+
+
 def test_content():
     response = Response(None, status_code=200)
     response.content = "Hello, World!"
@@ -97,12 +105,57 @@ async def test_render_with_content():
         {
             "type": "http.response.start",
             "status": HTTPStatus.OK,
-            "headers": [(b"Content-Type", b"application/json; charset=utf-8")],
+            "headers": [(b"Content-Type", b"application/json; charset=utf-8"), (b"Content-Length", b"13")],
         }
     )
     send_mock.assert_any_await({"type": "http.response.body", "body": b"Hello, world!"})
 
 
+@pytest.mark.asyncio
+async def test_render_with_bytes_content():
+    send_mock = AsyncMock()
+    response = Response(send=send_mock, status_code=HTTPStatus.OK)
+    response.content = b'{"key": "value"}'
+    await response.render()
+
+    send_mock.assert_any_await({"type": "http.response.body", "body": b'{"key": "value"}'})
+
+
+@pytest.mark.asyncio
+async def test_render_with_memoryview_content():
+    send_mock = AsyncMock()
+    response = Response(send=send_mock, status_code=HTTPStatus.OK)
+    body = memoryview(b"Hello, world!")[7:]
+    response.content = body
+    await response.render()
+
+    assert send_mock.await_count == 2
+    start, message = (call.args[0] for call in send_mock.await_args_list)
+    assert start["headers"][-1] == (b"Content-Length", b"6")
+    assert message["body"] is body
+
+
+@pytest.mark.asyncio
+async def test_render_keeps_content_length():
+    send_mock = AsyncMock()
+    response = Response(send=send_mock, status_code=HTTPStatus.OK)
+    response.add_header("Content-Length", "42")
+    await response.render()
+
+    assert response.get_header("Content-Length") == ["42"]
+
+
+@pytest.mark.asyncio
+async def test_render_not_modified():
+    send_mock = AsyncMock()
+    response = Response(send=send_mock, status_code=HTTPStatus.NOT_MODIFIED)
+    response.content = "Hello, world!"
+    await response.render()
+
+    assert response.get_header("Content-Length") == []
+    send_mock.assert_any_await({"type": "http.response.body", "body": b""})
+
+
 @pytest.mark.asyncio
 async def test_render_empty_content():
     send_mock = AsyncMock()
@@ -114,7 +167,7 @@ async def test_render_empty_content():
         {
             "type": "http.response.start",
             "status": HTTPStatus.OK,
-            "headers": [(b"Content-Type", b"application/json; charset=utf-8")],
+            "headers": [(b"Content-Type", b"application/json; charset=utf-8"), (b"Content-Length", b"0")],
         }
     )
     send_mock.assert_any_await({"type": "http.response.body", "body": b""})
@@ -131,7 +184,341 @@ async def test_render_none_content():
         {
             "type": "http.response.start",
             "status": HTTPStatus.OK,
-            "headers": [(b"Content-Type", b"application/json; charset=utf-8")],
+            "headers": [(b"Content-Type", b"application/json; charset=utf-8"), (b"Content-Length", b"0")],
         }
     )
     send_mock.assert_any_await({"type": "http.response.body", "body": b""})
+
+
+@pytest.mark.asyncio
+async def test_streaming_response_async_iterator():
+    from pykour.response import StreamingResponse
+
+    async def chunks():
+        yield "Hello, "
+        yield b""
+        yield b"world!"
+
+    send_mock = AsyncMock()
+    response = StreamingResponse(send_mock, chunks(), content_type="text/plain")
+    await response.render()
+
+    messages = [call.args[0] for call in send_mock.await_args_list]
+    assert messages == [
+        {
+            "type": "http.response.start",
+            "status": HTTPStatus.OK,
+            "headers": [(b"Content-Type", b"text/plain; charset=utf-8")],
+        },
+        {"type": "http.response.body", "body": b"Hello, ", "more_body": True},
+        {"type": "http.response.body", "body": b"world!", "more_body": True},
+        {"type": "http.response.body", "body": b"", "more_body": False},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_streaming_response_sync_iterator_runs_in_executor():
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    from pykour.response import StreamingResponse
+
+    threads = []
+    state = {}
+
+    def chunks():
+        try:
+            for chunk in (b"a", b"b"):
+                threads.append(threading.current_thread().name)
+                yield chunk
+        finally:
+            state["closed"] = True
+
+    send_mock = AsyncMock()
+    with ThreadPoolExecutor(1, thread_name_prefix="stream") as executor:
+        response = StreamingResponse(send_mock, chunks(), executor=executor)
+        await response.render()
+
+    bodies = [call.args[0]["body"] for call in send_mock.await_args_list[1:]]
+    assert bodies == [b"a", b"b", b""]
+    assert all(name.startswith("stream") for name in threads)
+    assert state == {"closed": True}
+
+
+@pytest.mark.asyncio
+async def test_streaming_response_cancelled_while_sync_iterator_runs():
+    import asyncio
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    from pykour.response import StreamingResponse
+
+    running = threading.Event()
+    resume = threading.Event()
+    closed = threading.Event()
+
+    def chunks():
+        try:
+            yield b"a"
+            running.set()
+            resume.wait()
+            yield b"b"
+        finally:
+            closed.set()
+
+    send_mock = AsyncMock()
+    with ThreadPoolExecutor(1) as executor:
+        task = asyncio.create_task(StreamingResponse(send_mock, chunks(), executor=executor).render())
+        await asyncio.get_running_loop().run_in_executor(None, running.wait, 1)
+        task.cancel()
+        try:
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            assert not closed.is_set()
+        finally:
+            resume.set()
+        await asyncio.get_running_loop().run_in_executor(None, closed.wait, 1)
+
+    assert closed.is_set()
+
+
+@pytest.mark.asyncio
+async def test_streaming_response_closes_iterator_on_error():
+    from pykour.response import StreamingResponse
+
+    state = {}
+
+    async def chunks():
+        try:
+            yield b"a"
+            yield b"b"
+        finally:
+            state["closed"] = True
+
+    send_mock = AsyncMock(side_effect=[None, OSError("closed")])
+    response = StreamingResponse(send_mock, chunks())
+    with pytest.raises(OSError):
+        await response.render()
+
+    assert state == {"closed": True}
+
+
+@pytest.mark.asyncio
+async def test_streaming_response_does_not_start_before_first_chunk():
+    from pykour.response import StreamingResponse
+
+    async def chunks():
+        raise ValueError("error")
+        yield b"a"
+
+    send_mock = AsyncMock()
+    response = StreamingResponse(send_mock, chunks())
+    with pytest.raises(ValueError):
+        await response.render()
+
+    assert not response.started
+    send_mock.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_streaming_response_aborts_after_start():
+    from pykour.response import StreamingResponse
+
+    async def chunks():
+        yield b"a"
+        raise ValueError("error")
+
+    send_mock = AsyncMock()
+    response = StreamingResponse(send_mock, chunks())
+    with pytest.raises(ValueError):
+        await response.render()
+
+    assert response.started
+    assert [call.args[0]["type"] for call in send_mock.await_args_list] == [
+        "http.response.start",
+        "http.response.body",
+    ]
+
+
+def test_streaming_response_from_response():
+    from pykour.response import StreamingResponse
+
+    response = Response(None, status_code=HTTPStatus.CREATED, content_type="text/plain")
+    response.add_header("X-Test", "1")
+    streaming = StreamingResponse.from_response(response, iter([]))
+
+    assert streaming.status == HTTPStatus.CREATED
+    assert streaming.content_type == "text/plain"
+    assert streaming.headers == [("Content-Type", "text/plain; charset=utf-8"), ("X-Test", "1")]
+
+
+def create_file_request(*headers, method="GET", extensions=None):
+    from pykour.request import Request
+
+    scope = {"type": "http", "method": method, "headers": [(k.encode(), v.encode()) for k, v in headers]}
+    if extensions is not None:
+        scope["extensions"] = extensions
+    return Request(scope, AsyncMock())
+
+
+@pytest.fixture
+def text_file(tmp_path):
+    path = tmp_path / "hello.txt"
+    path.write_bytes(b"Hello, world!")
+    return path
+
+
+async def render_file(path, request=None, **kwargs):
+    from pykour.response import FileResponse
+
+    send_mock = AsyncMock()
+    response = FileResponse(path, send=send_mock, **kwargs)
+    await response.render(request)
+    messages = [call.args[0] for call in send_mock.await_args_list]
+    return response, messages[0], b"".join(message.get("body", b"") for message in messages[1:]), messages
+
+
+@pytest.mark.asyncio
+async def test_file_response(text_file):
+    import os
+    from email.utils import formatdate
+
+    response, start, body, messages = await render_file(text_file, chunk_size=5)
+
+    stat_result = os.stat(text_file)
+    assert start["status"] == HTTPStatus.OK
+    assert response.headers == [
+        ("Content-Type", "text/plain; charset=utf-8"),
+        ("Last-Modified", formatdate(stat_result.st_mtime, usegmt=True)),
+        ("ETag", f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'),
+        ("Accept-Ranges", "bytes"),
+        ("Content-Length", "13"),
+    ]
+    assert body == b"Hello, world!"
+    assert [message["body"] for message in messages[1:]] == [b"Hello", b", wor", b"ld!", b""]
+
+
+@pytest.mark.asyncio
+async def test_file_response_content_type(tmp_path):
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"\x00\x01")
+
+    response, _, _, _ = await render_file(path, filename="résumé.pdf")
+
+    assert response.get_header("Content-Type") == ["application/pdf"]
+    assert response.get_header("Content-Disposition") == ["attachment; filename*=utf-8''r%C3%A9sum%C3%A9.pdf"]
+
+
+@pytest.mark.asyncio
+async def test_file_response_not_found(tmp_path):
+    from pykour.exceptions import ResourceNotFoundException
+
+    with pytest.raises(ResourceNotFoundException):
+        await render_file(tmp_path / "missing.txt")
+    with pytest.raises(ResourceNotFoundException):
+        await render_file(tmp_path)
+
+
+@pytest.mark.asyncio
+async def test_file_response_removed_after_stat(text_file):
+    import os
+
+    stat_result = os.stat(text_file)
+    text_file.unlink()
+
+    with pytest.raises(FileNotFoundError):
+        await render_file(text_file, stat_result=stat_result)
+
+
+@pytest.mark.asyncio
+async def test_file_response_range(text_file):
+    response, start, body, _ = await render_file(text_file, create_file_request(("range", "bytes=7-")))
+
+    assert start["status"] == HTTPStatus.PARTIAL_CONTENT
+    assert response.get_header("Content-Range") == ["bytes 7-12/13"]
+    assert response.get_header("Content-Length") == ["6"]
+    assert body == b"world!"
+
+    _, _, body, _ = await render_file(text_file, create_file_request(("range", "bytes=-6")))
+    assert body == b"world!"
+
+    _, start, body, _ = await render_file(text_file, create_file_request(("range", "bytes=0-1, 3-4")))
+    assert start["status"] == HTTPStatus.OK
+    assert body == b"Hello, world!"
+
+    response, start, body, _ = await render_file(text_file, create_file_request(("range", "bytes=13-")))
+    assert start["status"] == HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE
+    assert response.get_header("Content-Range") == ["bytes */13"]
+    assert body == b""
+
+
+@pytest.mark.asyncio
+async def test_file_response_if_range(text_file):
+    response, _, _, _ = await render_file(text_file)
+    (etag,) = response.get_header("ETag")
+    (last_modified,) = response.get_header("Last-Modified")
+
+    for if_range, status in (
+        (etag, HTTPStatus.PARTIAL_CONTENT),
+        (last_modified, HTTPStatus.PARTIAL_CONTENT),
+        ('"other"', HTTPStatus.OK),
+        (f"W/{etag}", HTTPStatus.OK),
+        ("Thu, 01 Jan 1970 00:00:00 GMT", HTTPStatus.OK),
+    ):
+        request = create_file_request(("range", "bytes=0-4"), ("if-range", if_range))
+        _, start, _, _ = await render_file(text_file, request)
+        assert start["status"] == status, if_range
+
+
+@pytest.mark.asyncio
+async def test_file_response_not_modified(text_file):
+    response, _, _, _ = await render_file(text_file)
+    (etag,) = response.get_header("ETag")
+    (last_modified,) = response.get_header("Last-Modified")
+
+    for headers in ((("if-none-match", f'"x", W/{etag}'),), (("if-modified-since", last_modified),)):
+        _, start, body, _ = await render_file(text_file, create_file_request(*headers))
+        assert start["status"] == HTTPStatus.NOT_MODIFIED
+        assert body == b""
+
+    request = create_file_request(("if-none-match", '"x"'), ("if-modified-since", last_modified))
+    _, start, _, _ = await render_file(text_file, request)
+    assert start["status"] == HTTPStatus.OK
+
+
+@pytest.mark.asyncio
+async def test_file_response_head(text_file):
+    response, _, body, _ = await render_file(text_file, create_file_request(method="HEAD"))
+
+    assert response.get_header("Content-Length") == ["13"]
+    assert body == b""
+
+
+@pytest.mark.asyncio
+async def test_file_response_pathsend(text_file):
+    import os
+
+    request = create_file_request(extensions={"http.response.pathsend": {}})
+    _, _, _, messages = await render_file(text_file, request)
+
+    assert messages[1] == {"type": "http.response.pathsend", "path": os.path.abspath(text_file)}
+
+    request = create_file_request(("range", "bytes=0-4"), extensions={"http.response.pathsend": {}})
+    _, _, body, _ = await render_file(text_file, request)
+    assert body == b"Hello"
+
+
+def test_parse_range_header():
+    from pykour.response import parse_range_header
+
+    assert parse_range_header("bytes=0-4", 10) == (0, 4)
+    assert parse_range_header("bytes=5-", 10) == (5, 9)
+    assert parse_range_header("bytes=5-100", 10) == (5, 9)
+    assert parse_range_header("bytes=-3", 10) == (7, 9)
+    assert parse_range_header("bytes=-30", 10) == (0, 9)
+    assert parse_range_header("items=0-4", 10) is None
+    assert parse_range_header("bytes=4-0", 10) is None
+    assert parse_range_header("bytes=a-b", 10) is None
+    assert parse_range_header("bytes=-", 10) is None
+    with pytest.raises(ValueError):
+        parse_range_header("bytes=10-", 10)
+    with pytest.raises(ValueError):
+        parse_range_header("bytes=-0", 10)
@@ -1,5 +1,5 @@
 import pytest
-from pykour.router import Router, Node, Route
+from pykour.router import Router, Node, Route, RouteCache, normalize_host
 
 
 def test_route_creation():
@@ -9,6 +9,16 @@ def test_route_creation():
     assert route.handler == "handler"
 
 
+def test_route_is_immutable():
+    route = Route("/test/:id", "GET", "handler")
+    assert route.param_names == ("id",)
+
+    with pytest.raises(AttributeError):
+        route.handler = "other"
+    with pytest.raises(AttributeError):
+        route.path_params = {"id": "1"}
+
+
 def test_node_creation():
     node = Node("part")
     assert node.part == "part"
@@ -17,6 +27,17 @@ def test_node_creation():
     assert node.route is None
 
 
+def test_node_search_matches_wildcards():
+    node = Node("")
+    route = Route("/users/:id", "GET", "handler")
+    node.insert("/users/:id", route)
+    node.insert("/users/me", Route("/users/me", "GET", "me"))
+
+    assert node.search("/users/42") == (route, {"id": "42"})
+    assert node.search("/users/me")[0].handler == "me"
+    assert node.search("/users/42/unknown") == (None, {})
+
+
 def test_node_insertion():
     router = Router()
     router.add_route("/test", "GET", "handler")
@@ -52,7 +73,8 @@ def test_get_method():
     router = Router()
 
     @router.get("/test")
-    def handler(): ...
+    def handler():
+        pass
 
     route = router.get_route("/test", "GET")
     assert route.path == "/test"
@@ -63,7 +85,8 @@ def test_post_method():
     router = Router()
 
     @router.post("/test")
-    def handler(): ...
+    def handler():
+        pass
 
     route = router.get_route("/test", "POST")
     assert route.path == "/test"
@@ -74,7 +97,8 @@ def test_put_method():
     router = Router()
 
     @router.put("/test")
-    def handler(): ...
+    def handler():
+        pass
 
     route = router.get_route("/test", "PUT")
     assert route.path == "/test"
@@ -85,7 +109,8 @@ def test_delete_method():
     router = Router()
 
     @router.delete("/test")
-    def handler(): ...
+    def handler():
+        pass
 
     route = router.get_route("/test", "DELETE")
     assert route.path == "/test"
@@ -96,7 +121,8 @@ def test_patch_method():
     router = Router()
 
     @router.patch("/test")
-    def handler(): ...
+    def handler():
+        pass
 
     route = router.get_route("/test", "PATCH")
     assert route.path == "/test"
@@ -107,7 +133,8 @@ def test_options_method():
     router = Router()
 
     @router.options("/test")
-    def handler(): ...
+    def handler():
+        pass
 
     route = router.get_route("/test", "OPTIONS")
     assert route.path == "/test"
@@ -118,7 +145,8 @@ def test_head_method():
     router = Router()
 
     @router.head("/test")
-    def handler(): ...
+    def handler():
+        pass
 
     route = router.get_route("/test", "HEAD")
     assert route.path == "/test"
@@ -131,14 +159,16 @@ def test_trace_method():
     with pytest.raises(ValueError):
 
         @router.route("/test", method="TRACE")
-        def handler(): ...
+        def handler():
+            pass
 
 
 def test_string_representation():
     router = Router()
 
     @router.get("/test")
-    def handler(): ...
+    def handler():
+        pass
 
     assert str(router) == "GET /test -> handler()"
     assert repr(router) == "Router(prefix='')"
@@ -148,7 +178,8 @@ def test_get_allowed_methods():
     router = Router()
 
     @router.get("/test")
-    def handler(): ...
+    def handler():
+        pass
 
     methods = router.get_allowed_methods("/test")
     assert methods == ["GET"]
@@ -159,7 +190,8 @@ def test_add_router_without_prefix():
     router2 = Router()
 
     @router2.get("/test")
-    def handler(): ...
+    def handler():
+        pass
 
     router.add_router(router2)
     assert router.exists("/test", "GET")
@@ -173,7 +205,8 @@ def test_add_router_with_prefix():
     router2 = Router()
 
     @router2.get("/test")
-    def handler(): ...
+    def handler():
+        pass
 
     router.add_router(router2, prefix="/api")
     assert router.exists("/api/test", "GET")
@@ -186,8 +219,453 @@ def test_add_route_with_prefix():
     router = Router(prefix="/api")
 
     @router.get("/test")
-    def handler(): ...
+    def handler():
+        pass
 
     assert router.exists("/api/test", "GET")
     assert str(router) == "GET /api/test -> handler()"
     assert repr(router) == "Router(prefix='/api')"
+
+
+def test_static_route_takes_precedence_over_wildcard():
+    router = Router()
+    router.add_route("/users/:id", "GET", "user")
+    router.add_route("/users/me", "GET", "me")
+
+    assert router.get_route("/users/me", "GET").handler == "me"
+    match = router.match("GET", "/users/42")
+    assert match.handler == "user"
+    assert match.path_params == {"id": "42"}
+
+
+def test_wildcard_route_matches_when_static_route_has_no_method():
+    router = Router()
+    router.add_route("/users/me", "GET", "me")
+    router.add_route("/users/{user_id}", "PUT", "replace")
+
+    match = router.match("PUT", "/users/me")
+    assert match.handler == "replace"
+    assert match.path_params == {"user_id": "me"}
+    assert router.get_allowed_methods("/users/me") == ["GET", "PUT"]
+
+
+def test_wildcard_route_matches_when_static_branch_fails():
+    router = Router()
+    router.add_route("/files/static/index", "GET", "index")
+    router.add_route("/files/*name/raw", "GET", "raw")
+
+    match = router.match("GET", "/files/static/raw")
+    assert match.handler == "raw"
+    assert match.path_params == {"name": "static"}
+
+
+def test_param_names_are_kept_per_route():
+    router = Router()
+    router.add_route("/items/:item_id", "GET", "item")
+    router.add_route("/items/{name}/tags", "GET", "tags")
+
+    assert router.match("GET", "/items/1").path_params == {"item_id": "1"}
+    assert router.match("GET", "/items/foo/tags").path_params == {"name": "foo"}
+
+
+def test_trailing_slash_is_ignored():
+    router = Router()
+    router.add_route("/test", "GET", "handler")
+
+    assert router.exists("/test/", "GET")
+    assert not router.exists("/test/extra", "GET")
+
+
+def test_match_returns_route_params_and_allowed_methods():
+    router = Router()
+    router.add_route("/users/:id", "GET", "get_user")
+    router.add_route("/users/:id", "DELETE", "delete_user")
+
+    match = router.match("GET", "/users/1")
+    assert match.handler == "get_user"
+    assert match.path_params == {"id": "1"}
+    assert match.allowed_methods == ("GET", "DELETE")
+
+
+def test_match_without_route_for_method():
+    router = Router()
+    router.add_route("/users/:id", "GET", "get_user")
+
+    match = router.match("POST", "/users/1")
+    assert match.route is None
+    assert match.handler is None
+    assert match.path_params == {}
+    assert match.allowed_methods == ("GET",)
+
+    match = router.match("GET", "/unknown")
+    assert match.route is None
+    assert match.allowed_methods == ()
+
+
+def test_matches_do_not_share_path_params():
+    router = Router()
+    router.add_route("/users/:id", "GET", "get_user")
+
+    first = router.match("GET", "/users/1")
+    second = router.match("GET", "/users/2")
+
+    assert first.route is second.route
+    assert first.path_params == {"id": "1"}
+    assert second.path_params == {"id": "2"}
+
+
+def test_typed_path_params_are_converted():
+    router = Router()
+    router.add_route("/items/{id:int}", "GET", "item")
+    router.add_route("/objects/{uid:uuid}", "GET", "object")
+
+    assert router.match("GET", "/items/42").path_params == {"id": 42}
+    uid = "1b4e28ba-2fa1-11d2-883f-0016d3cca427"
+    assert str(router.match("GET", f"/objects/{uid}").path_params["uid"]) == uid
+
+
+def test_typed_path_param_falls_through_to_next_route():
+    router = Router()
+    router.add_route("/items/{id:int}", "GET", "by_id")
+    router.add_route("/items/{slug:str}", "GET", "by_slug")
+
+    match = router.match("GET", "/items/42")
+    assert match.handler == "by_id"
+    assert match.path_params == {"id": 42}
+
+    match = router.match("GET", "/items/apple")
+    assert match.handler == "by_slug"
+    assert match.path_params == {"slug": "apple"}
+    assert router.get_route("/items/apple", "GET").handler == "by_slug"
+
+
+def test_typed_path_param_without_match():
+    router = Router()
+    router.add_route("/items/{id:int}", "GET", "by_id")
+
+    match = router.match("GET", "/items/apple")
+    assert match.route is None
+    assert match.allowed_methods == ()
+    assert not router.exists("/items/apple", "GET")
+
+
+def test_path_converter_matches_rest_of_path():
+    router = Router()
+    router.add_route("/files/{rest:path}", "GET", "files")
+    router.add_route("/files/readme", "GET", "readme")
+
+    assert router.match("GET", "/files/a/b/c.txt").path_params == {"rest": "a/b/c.txt"}
+    assert router.match("GET", "/files/readme").handler == "readme"
+    assert router.match("GET", "/files/readme/raw").path_params == {"rest": "readme/raw"}
+
+
+def test_path_converter_must_be_last_segment():
+    router = Router()
+
+    with pytest.raises(ValueError):
+        router.add_route("/files/{rest:path}/raw", "GET", "handler")
+
+
+def test_unsupported_converter():
+    router = Router()
+
+    with pytest.raises(ValueError):
+        router.add_route("/items/{id:unknown}", "GET", "handler")
+
+
+def test_freeze():
+    router = Router()
+    router.add_route("/users/me", "GET", "get_me")
+    router.add_route("/users/:id", "PUT", "replace_user")
+    router.freeze()
+
+    assert router.frozen
+    match = router.match("GET", "/users/me")
+    assert match.handler == "get_me"
+    assert match is router.match("GET", "/users/me")
+    assert match.allow_header == b"GET, PUT"
+    assert router.match("PUT", "/users/me").path_params == {"id": "me"}
+    assert router.match("DELETE", "/users/me").route is None
+    assert router.match("PUT", "/users/1").path_params == {"id": "1"}
+
+
+def test_add_route_after_freeze():
+    router = Router()
+    router.add_route("/users", "GET", "list_users")
+    router.freeze()
+    router.freeze()
+
+    with pytest.raises(RuntimeError):
+        router.add_route("/late", "GET", "late")
+    with pytest.raises(RuntimeError):
+
+        @router.get("/late")
+        def handler():
+            pass
+
+
+def test_match_without_route_is_shared():
+    router = Router()
+    router.add_route("/users/:id", "GET", "get_user")
+    router.add_route("/users/:id", "PATCH", "update_user")
+
+    match = router.match("DELETE", "/users/1")
+    assert match is router.match("POST", "/users/2")
+    assert match.allowed_methods == ("GET", "PATCH")
+    assert match.allow_header == b"GET, PATCH"
+    assert match.options_allow_header == b"GET, PATCH, OPTIONS"
+    assert not match.is_allowed("DELETE")
+    assert match.is_allowed("PATCH")
+    assert router.match("GET", "/unknown").is_allowed("DELETE")
+
+
+def test_typed_route_is_not_allowed_when_segment_does_not_parse():
+    router = Router()
+    router.add_route("/items/{id:int}", "GET", "by_id")
+    router.add_route("/items/{slug}", "POST", "create")
+
+    assert router.match("GET", "/items/1").allowed_methods == ("GET", "POST")
+    assert router.match("GET", "/items/apple").allowed_methods == ("POST",)
+
+
+def test_add_router_mounts_without_copying_routes():
+    router = Router()
+    router2 = Router()
+    router.add_router(router2, prefix="/api")
+
+    @router2.get("/late")
+    def handler():
+        pass
+
+    assert list(router.tree.iter_routes()) == []
+    assert router.exists("/api/late", "GET")
+    assert str(router) == "GET /api/late -> handler()"
+
+
+def test_match_mounted_router():
+    router = Router()
+    users = Router()
+    users.add_route("/", "GET", "list_users")
+    users.add_route("/{user_id:int}", "GET", "get_user")
+    router.mount("/users", users)
+    router.add_route("/users/me", "GET", "get_me")
+
+    assert router.match("GET", "/users").handler == "list_users"
+    assert router.match("GET", "/users/me").handler == "get_me"
+    match = router.match("GET", "/users/1")
+    assert match.handler == "get_user"
+    assert match.path_params == {"user_id": 1}
+    assert router.match("POST", "/users").allowed_methods == ("GET",)
+    assert router.match("GET", "/users/1/unknown").route is None
+
+
+def test_match_falls_through_to_mounted_router_for_other_methods():
+    router = Router()
+    items = Router()
+    router.add_route("/items", "GET", "list_items")
+    items.add_route("/items", "POST", "create_item")
+    router.add_router(items)
+
+    assert router.match("GET", "/items").handler == "list_items"
+    match = router.match("POST", "/items")
+    assert match.handler == "create_item"
+    assert match.allowed_methods == ("GET", "POST")
+    match = router.match("HEAD", "/items")
+    assert match.route is None
+    assert match.allow_header == b"GET, POST"
+    assert not match.is_allowed("HEAD")
+
+
+def test_match_nested_mounted_application():
+    async def static_app(scope, receive, send):
+        pass
+
+    router = Router()
+    api = Router()
+    api.mount("/static", static_app)
+    router.mount("/api", api)
+
+    match = router.match("GET", "/api/static/css/site.css")
+    assert match.route is None
+    assert match.mount.prefix == "/api/static"
+    assert match.mount.app is static_app
+    assert router.match("GET", "/api/other").mount is None
+
+
+def test_mount_prefix_must_be_static():
+    router = Router()
+
+    with pytest.raises(ValueError):
+        router.mount("/users/{user_id}", Router())
+
+
+def test_freeze_mounted_router():
+    router = Router()
+    child = Router()
+    router.mount("/child", child)
+    router.freeze()
+
+    assert child.frozen
+    with pytest.raises(RuntimeError):
+        router.mount("/late", Router())
+
+
+def test_normalize_host():
+    assert normalize_host("API.Example.com:8000") == "api.example.com"
+    assert normalize_host("example.com.") == "example.com"
+    assert normalize_host("[::1]:8000") == "[::1]"
+
+
+def test_host_router():
+    router = Router()
+    api = router.host("api.example.com")
+    tenants = router.host("*.example.com")
+    deep = router.host("*.eu.example.com")
+
+    assert router.get_host_router("api.example.com:443") is api
+    assert router.get_host_router("acme.example.com") is tenants
+    assert router.get_host_router("acme.eu.example.com") is deep
+    assert router.get_host_router("x.acme.example.com") is tenants
+    assert router.get_host_router("example.com") is router
+    assert router.get_host_router("other.org") is router
+    assert router.get_host_router(None) is router
+
+
+def test_host_router_is_separate():
+    router = Router()
+    api = router.host("api.example.com", Router())
+
+    @api.get("/users")
+    async def get_users():
+        pass
+
+    assert router.get_host_router("api.example.com").match("GET", "/users").route is not None
+    assert router.match("GET", "/users").route is None
+
+
+def test_invalid_host():
+    router = Router()
+
+    with pytest.raises(ValueError):
+        router.host("api.*.example.com")
+    with pytest.raises(ValueError):
+        router.host("*.")
+
+
+def test_freeze_host_router():
+    router = Router()
+    api = router.host("api.example.com")
+    router.freeze()
+
+    assert api.frozen
+    with pytest.raises(RuntimeError):
+        router.host("late.example.com")
+
+
+def test_route_cache():
+    cache = RouteCache(2)
+    router = Router()
+    router.add_route("/users/:id", "GET", "handler")
+    match = router.match("GET", "/users/1")
+
+    assert cache.get("GET", "/users/1") is None
+    cache.put("GET", "/users/1", match)
+    cache.put("GET", "/users/2", match)
+    assert cache.get("GET", "/users/1") is match
+    cache.put("GET", "/users/3", match)
+
+    assert len(cache) == 2
+    assert cache.get("GET", "/users/2") is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_router_cache():
+    router = Router(cache_size=10)
+    router.add_route("/users/:id/profile", "GET", "handler")
+
+    match = router.match("GET", "/users/42/profile")
+    assert router.match("GET", "/users/42/profile") is match
+    assert match.path_params == {"id": "42"}
+    assert (router.cache.hits, router.cache.misses) == (1, 1)
+    assert Router().cache is None
+
+
+def test_router_cache_path_params_are_read_only():
+    router = Router(cache_size=10)
+    router.add_route("/users/{id}", "GET", "handler")
+
+    with pytest.raises(TypeError):
+        router.match("GET", "/users/1").path_params["id"] = "hacked"  # type: ignore[index]
+    assert router.match("GET", "/users/1").path_params == {"id": "1"}
+
+
+def test_router_cache_invalidation():
+    router = Router(cache_size=10)
+    child = Router()
+    router.mount("/child", child)
+    router.add_route("/users/:id", "GET", "handler")
+
+    assert router.match("GET", "/users/me").route.handler == "handler"
+    assert router.match("GET", "/child/items").route is None
+
+    router.add_route("/users/me", "GET", "me")
+    child.add_route("/items", "GET", "items")
+
+    assert router.match("GET", "/users/me").route.handler == "me"
+    assert router.match("GET", "/child/items").route.handler == "items"
+
+
+def test_route_binding():
+    async def get_item(item_id: int, q: str):
+        pass
+
+    route = Route("/items/{item_id:int}", "GET", (get_item, 200))
+
+    assert [name for name, _ in route.binding.extractors] == ["item_id", "q"]
+    assert route.binding.needs_query
+    assert Route("/items", "GET", "handler").binding is None
+
+
+def test_route_executor():
+    router = Router()
+
+    @router.get("/reports", max_workers=2)
+    def get_reports():
+        pass
+
+    @router.get("/users")
+    def get_users():
+        pass
+
+    route = router.get_route("/reports", "GET")
+    assert route.executor._max_workers == 2
+    assert not route.binding.is_async
+    assert router.get_route("/users", "GET").executor is None
+
+
+def test_route_executors_are_shut_down_when_replaced():
+    router = Router()
+    child = Router()
+    router.add_router(child, prefix="/child")
+    router.add_route("/reports", "GET", (lambda: None, 200), max_workers=1)
+    child.add_route("/items", "GET", (lambda: None, 200), max_workers=1)
+    replaced = router.get_route("/reports", "GET").executor
+
+    router.add_route("/reports", "GET", (lambda: None, 200), max_workers=1)
+
+    with pytest.raises(RuntimeError):
+        replaced.submit(print)
+    assert router.get_executors() == [
+        router.get_route("/reports", "GET").executor,
+        child.get_route("/items", "GET").executor,
+    ]
+    for executor in router.get_executors():
+        executor.shutdown()
+
+
+def test_nodes_have_slots():
+    router = Router()
+    router.add_route("/users/:id", "GET", "handler")
+
+    assert not hasattr(Node("users"), "__dict__")
+    assert not hasattr(router.tree.root, "__dict__")
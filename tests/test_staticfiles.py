@@ -0,0 +1,233 @@
+import gzip
+import os
+from http import HTTPStatus
+from unittest.mock import AsyncMock
+
+import pytest
+
+from pykour import Pykour, StaticFiles
+from pykour.config import Config
+from pykour.staticfiles import FileCache, parse_accept_encoding
+
+
+@pytest.fixture
+def directory(tmp_path):
+    (tmp_path / "index.html").write_bytes(b"<h1>Hello</h1>")
+    (tmp_path / "app.js").write_bytes(b"console.log('hello');" * 100)
+    (tmp_path / "app.js.gz").write_bytes(gzip.compress(b"console.log('hello');" * 100))
+    (tmp_path / "app.js.br").write_bytes(b"brotli")
+    (tmp_path / "css").mkdir()
+    (tmp_path / "css" / "style.css").write_bytes(b"body {}")
+    (tmp_path.parent / "secret.txt").write_bytes(b"secret")
+    return tmp_path
+
+
+async def serve(app, path, *headers, method="GET", extensions=None):
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "headers": [(key.encode(), value.encode()) for key, value in headers],
+    }
+    if extensions is not None:
+        scope["extensions"] = extensions
+    send = AsyncMock()
+    await app(scope, AsyncMock(), send)
+    messages = [call.args[0] for call in send.await_args_list]
+    headers = {key.decode().lower(): value.decode() for key, value in messages[0]["headers"]}  # type: ignore[assignment]
+    body = b"".join(message.get("body", b"") for message in messages[1:])
+    return messages[0]["status"], headers, body, messages
+
+
+@pytest.mark.asyncio
+async def test_serve_file(directory):
+    app = StaticFiles(directory)
+
+    status, headers, body, messages = await serve(app, "/css/style.css")
+
+    assert status == HTTPStatus.OK
+    assert headers["content-type"] == "text/css; charset=utf-8"
+    assert headers["content-length"] == "7"
+    assert "etag" in headers and "last-modified" in headers
+    assert "vary" not in headers
+    assert body == b"body {}"
+    assert len(messages) == 3
+
+
+@pytest.mark.asyncio
+async def test_cache(directory):
+    app = StaticFiles(directory)
+
+    await serve(app, "/index.html")
+    await serve(app, "/index.html")
+    assert (app.cache.hits, app.cache.misses, len(app.cache)) == (1, 1, 1)
+
+    path = directory / "index.html"
+    path.write_bytes(b"<h1>Changed</h1>")
+    os.utime(path, ns=(0, 0))
+    _, _, body, _ = await serve(app, "/index.html")
+    assert body == b"<h1>Changed</h1>"
+    assert app.cache.misses == 2
+
+
+@pytest.mark.asyncio
+async def test_not_found(directory):
+    app = StaticFiles(directory)
+
+    for path in ("/missing.txt", "/../secret.txt", "/css", "/index.html/x"):
+        status, _, body, _ = await serve(app, path)
+        assert status == HTTPStatus.NOT_FOUND, path
+        assert body == b"Not Found"
+
+
+@pytest.mark.asyncio
+async def test_invalid_paths_are_not_found(directory):
+    app = StaticFiles(directory)
+
+    for path in ("/index.html\x00", "/" + "a" * 10000, "/css/" + "a" * 300):
+        status, _, body, _ = await serve(app, path)
+        assert status == HTTPStatus.NOT_FOUND
+        assert body == b"Not Found"
+
+
+@pytest.mark.asyncio
+async def test_unreadable_files_are_not_found(directory, monkeypatch):
+    def fail(*args):
+        raise PermissionError("denied")
+
+    monkeypatch.setattr("pykour.staticfiles.read_bytes", fail)
+    monkeypatch.setattr("pykour.response.read_file", fail)
+
+    for app in (StaticFiles(directory), StaticFiles(directory, cache_size=0)):
+        status, _, body, messages = await serve(app, "/index.html")
+        assert status == HTTPStatus.NOT_FOUND
+        assert body == b"Not Found"
+        assert len(messages) == 2
+
+
+@pytest.mark.asyncio
+async def test_method_not_allowed(directory):
+    status, headers, _, _ = await serve(StaticFiles(directory), "/index.html", method="POST")
+
+    assert status == HTTPStatus.METHOD_NOT_ALLOWED
+    assert headers["allow"] == "GET, HEAD"
+
+
+@pytest.mark.asyncio
+async def test_precompressed(directory):
+    app = StaticFiles(directory)
+
+    _, headers, body, _ = await serve(app, "/app.js", ("accept-encoding", "gzip, deflate"))
+    assert headers["content-encoding"] == "gzip"
+    assert "javascript" in headers["content-type"]
+    assert headers["vary"] == "Accept-Encoding"
+    assert gzip.decompress(body) == b"console.log('hello');" * 100
+
+    _, headers, body, _ = await serve(app, "/app.js", ("accept-encoding", "gzip, br"))
+    assert headers["content-encoding"] == "br"
+    assert body == b"brotli"
+
+    _, headers, body, _ = await serve(app, "/app.js", ("accept-encoding", "br;q=0"))
+    assert "content-encoding" not in headers
+    assert headers["vary"] == "Accept-Encoding"
+    assert body == b"console.log('hello');" * 100
+
+    _, headers, _, _ = await serve(StaticFiles(directory, precompressed=False), "/app.js", ("accept-encoding", "gzip"))
+    assert "content-encoding" not in headers
+
+
+@pytest.mark.asyncio
+async def test_large_files_are_mapped(directory):
+    app = StaticFiles(directory, max_cached_file_size=0, mmap_threshold=1000)
+
+    status, headers, body, messages = await serve(app, "/app.js", ("range", "bytes=0-6"))
+
+    assert status == HTTPStatus.PARTIAL_CONTENT
+    assert body == b"console"
+    assert isinstance(messages[1]["body"], memoryview)
+    assert len(app.cache) == 0
+
+    _, _, _, messages = await serve(app, "/app.js", extensions={"http.response.pathsend": {}})
+    assert messages[1] == {"type": "http.response.pathsend", "path": str(directory / "app.js")}
+
+    _, _, body, _ = await serve(app, "/index.html")
+    assert body == b"<h1>Hello</h1>"
+
+
+@pytest.mark.asyncio
+async def test_maps_are_reused_until_files_change(directory):
+    app = StaticFiles(directory, max_cached_file_size=0, mmap_threshold=1000, max_mapped_files=1)
+
+    _, _, _, messages = await serve(app, "/app.js")
+    _, _, _, other_messages = await serve(app, "/app.js")
+    assert messages[1]["body"].obj is other_messages[1]["body"].obj
+    assert len(app._maps) == 1
+
+    (directory / "app.js").write_bytes(b"changed" * 200)
+    _, _, body, _ = await serve(app, "/app.js")
+    assert body == b"changed" * 200
+    assert len(app._maps) == 1
+
+    (directory / "large.txt").write_bytes(b"large" * 400)
+    await serve(app, "/large.txt")
+    assert list(app._maps) == [str(directory / "large.txt")]
+
+
+def test_file_cache_is_bounded_by_size():
+    cache = FileCache(10)
+    stat_result = os.stat(__file__)
+
+    cache.put("a", stat_result, b"12345")
+    cache.put("b", stat_result, b"12345")
+    assert cache.get("a", stat_result) == b"12345"
+    cache.put("c", stat_result, b"123")
+
+    assert cache.get("b", stat_result) is None
+    assert cache.get("a", stat_result) == b"12345"
+    assert cache.size == 8
+    cache.put("d", stat_result, b"12345678901")
+    assert len(cache) == 2
+
+    cache.clear()
+    assert (len(cache), cache.size) == (0, 0)
+
+
+def test_invalid_directory(tmp_path):
+    with pytest.raises(ValueError):
+        StaticFiles(tmp_path / "missing")
+
+
+def test_parse_accept_encoding():
+    assert parse_accept_encoding(None) == []
+    assert parse_accept_encoding("gzip, deflate;q=0.5, br; q=0") == ["gzip", "deflate"]
+
+
+@pytest.mark.asyncio
+async def test_mount_and_docs_assets(directory):
+    (directory / "swagger-ui.css").write_bytes(b".swagger {}")
+    config = Config()
+    config.config = {"pykour": {"docs": {"assets-dir": str(directory)}}}
+    app = Pykour(config=config)
+    app.mount("/static", StaticFiles(directory))
+
+    def scope(path):
+        return {
+            "type": "http",
+            "scheme": "http",
+            "method": "GET",
+            "path": path,
+            "query_string": b"",
+            "headers": [(b"host", b"localhost:8000")],
+        }
+
+    receive = AsyncMock(return_value={"type": "http.request", "body": b"", "more_body": False})
+
+    for path, expected in (("/static/css/style.css", b"body {}"), ("/docs/assets/swagger-ui.css", b".swagger {}")):
+        send = AsyncMock()
+        await app(scope(path), receive, send)
+        assert send.await_args_list[0].args[0]["status"] == HTTPStatus.OK
+        assert send.await_args_list[1].args[0]["body"] == expected
+
+    send = AsyncMock()
+    await app(scope("/docs"), receive, send)
+    assert b'href="/docs/assets/swagger-ui.css"' in send.await_args_list[1].args[0]["body"]
@@ -1,14 +1,21 @@
 import pytest
 
 from pykour.exceptions import ResourceNotFoundException
-from pykour.testing import perform, get, post, put, patch, delete, head, trace
+from pykour.testing import perform, get, post, put, patch, delete, head, options, trace
 
 from pykour import Pykour, Router
+from pykour.request import Stream
+from pykour.schema import BaseSchema
 from pykour.middleware import UUIDMiddleware
 
 app = Pykour()
 app.add_middleware(UUIDMiddleware, header_name="X-TRACE-ID")
 
+
+class Profile(BaseSchema):
+    name: str
+
+
 user_v1_router = Router()
 
 
@@ -27,6 +34,16 @@ async def create_user():
     return {"message": "User created"}
 
 
+@user_v1_router.post("/{user_id}/profile")
+async def create_profile(profile: Profile, body: dict):
+    return {"name": profile.name, "body": body}
+
+
+@user_v1_router.post("/{user_id}/avatar")
+async def upload_avatar(stream: Stream):
+    return {"size": sum([len(chunk) async for chunk in stream])}
+
+
 @user_v1_router.put("/{user_id}")
 async def replace_user(user_id: int):
     return {"message": f"User {user_id} replaced"}
@@ -49,6 +66,33 @@ api_v1_router.add_router(user_v1_router, prefix="/users")
 app.add_router(api_v1_router, prefix="/api/v1")
 
 
+@app.get("/items/{item_id:int}")
+async def get_item(item_id):
+    return {"item_id": item_id, "type": type(item_id).__name__}
+
+
+async def static_app(scope, receive, send):
+    body = f"{scope['root_path']} {scope['path']}".encode()
+    await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"text/plain")]})
+    await send({"type": "http.response.body", "body": body})
+
+
+app.mount("/static", static_app)
+
+admin_host = app.host("admin.example.com")
+tenant_host = app.host("*.tenants.example.com")
+
+
+@admin_host.get("/items/{item_id:int}")
+async def get_admin_item(item_id):
+    return {"item_id": item_id, "host": "admin"}
+
+
+@tenant_host.get("/")
+async def get_tenant():
+    return {"host": "tenant"}
+
+
 @app.get("/exception")
 async def exception():
     raise ValueError()
@@ -77,6 +121,18 @@ async def test_post_method():
     response.is_created().expect({"message": "User created"})
 
 
+@pytest.mark.asyncio
+async def test_post_method_with_schema_and_dict():
+    response = await perform(app, post("/api/v1/users/1/profile", body='{"name": "John Doe"}'))
+    response.is_created().expect({"name": "John Doe", "body": {"name": "John Doe"}})
+
+
+@pytest.mark.asyncio
+async def test_post_method_with_stream():
+    response = await perform(app, post("/api/v1/users/1/avatar", body="abcdef"))
+    response.is_created().expect({"size": 6})
+
+
 @pytest.mark.asyncio
 async def test_put_method():
     response = await perform(app, put("/api/v1/users/1", body='{"name": "John Doe"}'))
@@ -110,7 +166,19 @@ async def test_not_supported_method():
 @pytest.mark.asyncio
 async def test_method_not_allowed():
     response = await perform(app, head("/api/v1/users"))
-    response.is_method_not_allowed().expect("Method Not Allowed")
+    response.is_method_not_allowed().has_header("Allow", "GET, POST").expect("Method Not Allowed")
+
+
+@pytest.mark.asyncio
+async def test_automatic_options():
+    response = await perform(app, options("/api/v1/users/1"))
+    response.is_ok().has_header("Allow", "GET, PUT, DELETE, PATCH, OPTIONS").empty()
+
+
+@pytest.mark.asyncio
+async def test_automatic_options_route_not_found():
+    response = await perform(app, options("/api/v2/users"))
+    response.is_not_found()
 
 
 @pytest.mark.asyncio
@@ -129,3 +197,41 @@ async def test_exception():
 async def test_http_exception():
     response = await perform(app, get("/http_exception"))
     response.is_not_found().expect("Resource Not Found")
+
+
+@pytest.mark.asyncio
+async def test_typed_path_variable():
+    response = await perform(app, get("/items/1"))
+    response.is_ok().expect({"item_id": 1, "type": "int"})
+
+
+@pytest.mark.asyncio
+async def test_typed_path_variable_not_parsed():
+    response = await perform(app, get("/items/abc"))
+    response.is_not_found().expect("Not Found")
+
+
+def with_host(scope, host):
+    scope["headers"] = [(b"host", host.encode()) if key == b"host" else (key, value) for key, value in scope["headers"]]
+    return scope
+
+
+@pytest.mark.asyncio
+async def test_host_router():
+    response = await perform(app, with_host(get("/items/1"), "Admin.Example.com:8000"))
+    response.is_ok().expect({"item_id": 1, "host": "admin"})
+
+    response = await perform(app, with_host(get("/"), "acme.tenants.example.com"))
+    response.is_ok().expect({"host": "tenant"})
+
+    response = await perform(app, with_host(get("/items/1"), "tenants.example.com"))
+    response.is_ok().expect({"item_id": 1, "type": "int"})
+
+    response = await perform(app, with_host(get("/"), "admin.example.com"))
+    response.is_not_found()
+
+
+@pytest.mark.asyncio
+async def test_mounted_application():
+    response = await perform(app, get("/static/css/site.css"))
+    response.is_ok().expect("/static /css/site.css")